@@ -14,7 +14,7 @@ from flask_neontology.views import (
     page_element,
     page_section,
 )
-from flask_neontology.views.apiview import NeontologyAPIView
+from flask_neontology.views.apiview import NeontologyAPIView, RelatedResource
 
 from ..ontology.author import NeontologyAuthorNode
 from ..ontology.page import NeontologyPageNode
@@ -80,10 +80,6 @@ class PageAPIView(NeontologyAPIView):
     resource_name = "pages"
     tag_description = "API endpoints for documentation pages."
 
-    related_resources = {"authors": (NeontologyAuthorNode, "get_related_authors")}
-
-    def get_related_authors(self, id: str):
-        page = self.match_node(id)
-        if page:
-            return page.author_nodes()
-        return None
+    related_resources = {
+        "authors": RelatedResource(NeontologyAuthorNode, "NEONTOLOGY_PAGE_AUTHORED_BY")
+    }
@@ -0,0 +1,87 @@
+"""Benchmarks for encoding API responses.
+
+These don't need a graph database, run with:
+
+    python -m benchmarks.bench_api
+
+from the root of the repository.
+"""
+
+from flask import Flask, jsonify
+from neontology import BaseNode
+
+from flask_neontology.views import NeontologyAPIView
+from flask_neontology.views.conditional import make_etag
+
+from .common import BenchmarkNode, best_time, make_nodes, report
+
+N_NODES = 10000
+
+
+class BenchmarkAPIView(NeontologyAPIView):
+    model = BenchmarkNode
+    resource_name = "nodes"
+    tag_description = "Benchmark nodes."
+
+
+class ModelJSONBenchmarkAPIView(BenchmarkAPIView):
+    model_json = True
+
+
+class CustomBenchmarkAPIView(BenchmarkAPIView):
+    def serialize_item(self, item: BaseNode) -> dict:
+        return item.model_dump()
+
+
+def dict_response(nodes: list[BenchmarkNode]) -> object:
+    """The previous path: serialize to dicts, hash them for the ETag, jsonify."""
+    data = [node.model_dump() for node in nodes]
+
+    make_etag("BenchmarkAPIView", "1", data)
+
+    return jsonify(data)
+
+
+def bench_list_response(app: Flask, nodes: list[BenchmarkNode]) -> None:
+    """Compare building a list response via dicts and jsonify with encoding
+    the nodes with the app's JSON provider, straight to JSON with model_json, and
+    custom serialize_item."""
+    view = BenchmarkAPIView()
+    model_json_view = ModelJSONBenchmarkAPIView()
+    custom_view = CustomBenchmarkAPIView()
+
+    with app.test_request_context():
+        report(
+            f"model_dump + jsonify({len(nodes)})",
+            best_time(lambda: jsonify([node.model_dump() for node in nodes])),
+        )
+        report(
+            f"model_dump + ETag + jsonify({len(nodes)})",
+            best_time(lambda: dict_response(nodes)),
+        )
+        report(
+            f"encode_items({len(nodes)})",
+            best_time(lambda: view.encode_items(nodes)),
+        )
+        report(
+            f"encode_items({len(nodes)}, model_json)",
+            best_time(lambda: model_json_view.encode_items(nodes)),
+        )
+        report(
+            f"encode_items({len(nodes)}, custom)",
+            best_time(lambda: custom_view.encode_items(nodes)),
+        )
+        report(
+            f"make_json_response({len(nodes)}, model_json)",
+            best_time(
+                lambda: model_json_view.make_json_response(
+                    model_json_view.encode_items(nodes)
+                )
+            ),
+        )
+
+
+if __name__ == "__main__":
+    app = Flask(__name__)
+
+    bench_list_response(app, make_nodes(N_NODES))
@@ -0,0 +1,79 @@
+"""Benchmarks for building and rendering components.
+
+These don't need a graph database, run with:
+
+    python -m benchmarks.bench_components
+
+from the root of the repository.
+"""
+
+from flask import Flask
+
+from flask_neontology.components import (
+    CardComponent,
+    CardListComponent,
+    NodeListTableComponent,
+)
+
+from .common import BenchmarkNode, best_time, make_nodes, report
+
+N_ROWS = 5000
+
+
+def bench_table(app: Flask, nodes: list[BenchmarkNode]) -> None:
+    """Time building and rendering a NodeListTableComponent."""
+    kwargs = {"nodes": nodes, "url_pattern": "/nodes/<pp>/", "fields": None}
+
+    with app.app_context():
+        report(
+            f"NodeListTableComponent({len(nodes)})",
+            best_time(lambda: NodeListTableComponent(**kwargs)),
+        )
+        report(
+            "render",
+            best_time(lambda: NodeListTableComponent(**kwargs).render()),
+        )
+
+
+def bench_trusted_construction(nodes: list[BenchmarkNode]) -> None:
+    """Compare validated and trusted construction of a CardListComponent (which
+    has no validators, so can be built with trusted)."""
+    cards = [CardComponent(title=str(node)) for node in nodes]
+
+    report(
+        f"CardListComponent({len(cards)})",
+        best_time(lambda: CardListComponent(children=cards)),
+    )
+    report(
+        f"CardListComponent.trusted({len(cards)})",
+        best_time(lambda: CardListComponent.trusted(children=cards)),
+    )
+
+
+def bench_row_building(nodes: list[BenchmarkNode]) -> None:
+    """Build rows for a table showing all fields, and one showing only two."""
+    report(
+        f"generate_rows({len(nodes)}, all fields)",
+        best_time(
+            lambda: NodeListTableComponent(nodes=nodes, url_pattern="/nodes/<pp>/"),
+            repeats=1,
+        ),
+    )
+    report(
+        f"generate_rows({len(nodes)}, 2 fields)",
+        best_time(
+            lambda: NodeListTableComponent(
+                nodes=nodes, url_pattern="/nodes/<pp>/", fields=["__str__", "name"]
+            ),
+            repeats=1,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    app = Flask(__name__)
+    nodes = make_nodes(N_ROWS)
+
+    bench_table(app, nodes)
+    bench_trusted_construction(nodes)
+    bench_row_building(make_nodes(50000))
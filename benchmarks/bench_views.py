@@ -0,0 +1,90 @@
+"""Benchmarks for rendering pages.
+
+These need a graph database, configured with the NEO4J_URI, NEO4J_USERNAME and
+NEO4J_PASSWORD environment variables (or a .env file). Run with:
+
+    python -m benchmarks.bench_views
+
+from the root of the repository. A few BenchmarkNodes are merged into the graph.
+"""
+
+from typing import ClassVar, Iterator
+from unittest import mock
+
+from flask import Flask
+from neontology import BaseRelationship, GraphConnection
+
+from flask_neontology import NeontologyManager
+from flask_neontology.autograph import LabelView
+from flask_neontology.components import SectionComponent
+
+from .common import BenchmarkNode, best_time, report
+
+NODE_URL = "/autograph/BenchmarkNode/node/node-0/"
+
+
+class BenchmarkRelationship(BaseRelationship):
+    __relationshiptype__: ClassVar[str] = "BENCHMARK_RELATIONSHIP"
+
+    source: BenchmarkNode
+    target: BenchmarkNode
+
+
+def iter_sections_twice(self: LabelView) -> Iterator[SectionComponent]:
+    """The previous path: each section was called to check it wasn't empty, then
+    called again for its value."""
+    for _, section in self.get_render_plan().sections:
+        if section(self) is not None:
+            yield section(self)
+
+
+def count_queries(app: Flask) -> int:
+    """The graph queries made rendering the node page (without cached sections)."""
+    app.neontology_manager.fragment_cache.clear()
+
+    query_count = 0
+    evaluate_query = GraphConnection.evaluate_query
+
+    def counting_evaluate_query(self, *args, **kwargs):
+        nonlocal query_count
+        query_count += 1
+        return evaluate_query(self, *args, **kwargs)
+
+    with mock.patch.object(GraphConnection, "evaluate_query", counting_evaluate_query):
+        response = app.test_client().get(NODE_URL)
+
+    assert response.status_code == 200
+
+    return query_count
+
+
+def render_uncached(app: Flask) -> None:
+    app.neontology_manager.fragment_cache.clear()
+    app.test_client().get(NODE_URL)
+
+
+def bench_node_page(app: Flask) -> None:
+    """Compare the queries made (and time taken) rendering an autograph node page
+    with each section evaluated once, and twice as before the render plan."""
+    print(f"{'node page queries (render plan)':<40} {count_queries(app):>10}")
+    report("node page (render plan)", best_time(lambda: render_uncached(app)))
+
+    with mock.patch.object(LabelView, "iter_sections", iter_sections_twice):
+        print(f"{'node page queries (sections twice)':<40} {count_queries(app):>10}")
+        report("node page (sections twice)", best_time(lambda: render_uncached(app)))
+
+
+if __name__ == "__main__":
+    app = Flask(__name__)
+
+    NeontologyManager().init_app(app=app, autograph_nodes=[BenchmarkNode])
+
+    nodes = [BenchmarkNode(name=f"node-{i}", count=i) for i in range(3)]
+
+    for node in nodes:
+        node.merge()
+
+    for target in nodes[1:]:
+        BenchmarkRelationship(source=nodes[0], target=target).merge()
+
+    bench_node_page(app)
@@ -0,0 +1,39 @@
+"""Helpers shared by the benchmarks."""
+
+import time
+from typing import Callable, Optional
+
+from neontology import BaseNode
+
+REPEATS = 5
+
+
+class BenchmarkNode(BaseNode):
+    __primarylabel__ = "BenchmarkNode"
+    __primaryproperty__ = "name"
+
+    name: str
+    description: Optional[str] = None
+    count: int = 0
+
+
+def make_nodes(n: int) -> list[BenchmarkNode]:
+    return [
+        BenchmarkNode(name=f"Node {i}", description=f"Description {i}", count=i)
+        for i in range(n)
+    ]
+
+
+def best_time(f: Callable[[], object], repeats: int = REPEATS) -> float:
+    timings = []
+
+    for _ in range(repeats):
+        start = time.perf_counter()
+        f()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def report(name: str, seconds: float) -> None:
+    print(f"{name:<40} {seconds * 1000:>10.1f} ms")
@@ -1,5 +1,8 @@
 from .neontology_manager import NeontologyManager
 from .views import (
+    AsyncNeontologyAPIView,
+    AsyncNeontologyListView,
+    AsyncNeontologyNodeView,
     NeontologyAPIView,
     NeontologyEndpointView,
     NeontologyListView,
@@ -10,6 +13,9 @@ from .views import (
 )
 
 __all__ = [
+    "AsyncNeontologyAPIView",
+    "AsyncNeontologyListView",
+    "AsyncNeontologyNodeView",
     "NeontologyManager",
     "NeontologyEndpointView",
     "NeontologyListView",
@@ -0,0 +1,169 @@
+import hashlib
+import json
+import re
+import urllib.request
+from pathlib import Path
+from typing import Callable, Dict, Optional, Union
+
+from flask import Response, abort, current_app, send_from_directory, url_for
+from markupsafe import Markup
+
+# Third party libraries used in the default template and component headtags, and
+# the local names to use. Bootstrap Icons is left on its CDN, as its stylesheet
+# loads the icon fonts from URLs relative to itself.
+VENDORED_ASSETS: Dict[str, str] = {
+    "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css": (
+        "bootstrap.min.css"
+    ),
+    "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js": (
+        "bootstrap.bundle.min.js"
+    ),
+    "https://code.jquery.com/jquery-3.7.1.min.js": "jquery.min.js",
+    "https://cdn.datatables.net/2.1.2/css/dataTables.dataTables.min.css": (
+        "dataTables.dataTables.min.css"
+    ),
+    "https://cdn.datatables.net/2.3.5/js/dataTables.min.js": "dataTables.min.js",
+    "https://cdn.datatables.net/2.3.5/js/dataTables.bootstrap5.min.js": (
+        "dataTables.bootstrap5.min.js"
+    ),
+    "https://cdn.datatables.net/columncontrol/1.1.1/css/columnControl.dataTables.min.css": (  # noqa: E501
+        "columnControl.dataTables.min.css"
+    ),
+    "https://cdn.datatables.net/columncontrol/1.1.1/js/dataTables.columnControl.min.js": (  # noqa: E501
+        "dataTables.columnControl.min.js"
+    ),
+    "https://unpkg.com/force-graph": "force-graph.min.js",
+    "https://cdn.jsdelivr.net/npm/3d-force-graph": "3d-force-graph.min.js",
+    "https://unpkg.com/cytoscape@3.30.4/dist/cytoscape.min.js": "cytoscape.min.js",
+}
+
+MANIFEST_FILENAME = "manifest.json"
+
+# Fingerprinted files never change, so can be cached "forever"
+ASSET_MAX_AGE = 60 * 60 * 24 * 365
+
+_asset_url_pattern = re.compile(
+    r"""(?P<attr>src|href)=(?P<quote>['"])(?P<url>[^'"]+)(?P=quote)"""
+)
+
+
+def fetch_url(url: str) -> bytes:
+    with urllib.request.urlopen(url) as response:  # nosec: B310 fixed https URLs
+        return response.read()
+
+
+class NeontologyAssets(object):
+    """Locally served, fingerprinted copies of third party component assets.
+
+    Assets are downloaded once (see the `vendor-assets` CLI command) into `directory`,
+    along with a manifest mapping each original URL to its fingerprinted filename.
+    Headtags which reference a vendored URL are then rewritten to the local copy.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self.directory = Path(directory)
+        self.manifest: Dict[str, str] = {}
+        self.load_manifest()
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.directory / MANIFEST_FILENAME
+
+    def load_manifest(self) -> None:
+        if self.manifest_path.exists():
+            with open(self.manifest_path) as manifest_file:
+                self.manifest = json.load(manifest_file)
+
+        else:
+            self.manifest = {}
+
+    def vendor(
+        self,
+        assets: Dict[str, str] = VENDORED_ASSETS,
+        fetch: Callable[[str], bytes] = fetch_url,
+    ) -> Dict[str, str]:
+        """Download the given assets, save them with content hashed filenames.
+
+        Returns:
+            dict: The updated manifest, mapping source URLs to filenames.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        for source_url, name in assets.items():
+            content = fetch(source_url)
+
+            digest = hashlib.sha256(content).hexdigest()[:12]
+
+            # the hash goes before the final extension, e.g. jquery.min.<hash>.js
+            path = Path(name)
+            filename = f"{path.stem}.{digest}{path.suffix}"
+
+            (self.directory / filename).write_bytes(content)
+
+            self.manifest[source_url] = filename
+
+        with open(self.manifest_path, "w") as manifest_file:
+            json.dump(self.manifest, manifest_file, indent=2)
+
+        return self.manifest
+
+    def local_url(self, source_url: str) -> Optional[str]:
+        filename = self.manifest.get(source_url)
+
+        if filename is None:
+            return None
+
+        return url_for("neontology_core.asset", filename=filename)
+
+    def rewrite(self, tag: str) -> str:
+        """Point src/href attributes in a tag at local copies, where we have them."""
+        if not self.manifest:
+            return tag
+
+        def replace(match: re.Match) -> str:
+            local_url = self.local_url(match.group("url"))
+
+            if local_url is None:
+                return match.group(0)
+
+            quote = match.group("quote")
+
+            return f"{match.group('attr')}={quote}{local_url}{quote}"
+
+        return _asset_url_pattern.sub(replace, tag)
+
+    def send(self, filename: str) -> Response:
+        """Serve a vendored asset. Only the files listed in the manifest are
+        served, not the manifest itself (or anything else in the directory)."""
+        if filename not in self.manifest.values():
+            abort(404)
+
+        response = send_from_directory(
+            self.directory.absolute(), filename, max_age=ASSET_MAX_AGE
+        )
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+
+        return response
+
+
+def get_assets() -> Optional[NeontologyAssets]:
+    neontology_manager = getattr(current_app, "neontology_manager", None)
+
+    return getattr(neontology_manager, "assets", None)
+
+
+def rewrite_asset_urls(tag: str) -> str:
+    """Rewrite a headtag/tailtag to use vendored assets, if they're available."""
+    assets = get_assets()
+
+    if assets is None:
+        return tag
+
+    return assets.rewrite(tag)
+
+
+def vendored_assets_filter(html: str) -> Markup:
+    """Jinja filter rewriting the tags in a template block to use vendored assets,
+    e.g. {% filter neontology_assets %}<script src="..."></script>{% endfilter %}."""
+    return Markup(rewrite_asset_urls(str(html)))  # nosec: B704 template markup
@@ -3,7 +3,7 @@ from .labelendpoints import (
     LabelCreateRelationshipEndpointView,
     LabelEditEndpointView,
 )
-from .labellist import LabelListView
+from .labellist import LabelListView, LabelTableDataView
 from .labelview import LabelView
 from .viewset import AutographViewset, autograph_view
 
@@ -13,6 +13,7 @@ __all__ = [
     "LabelCreateRelationshipEndpointView",
     "LabelEditEndpointView",
     "LabelListView",
+    "LabelTableDataView",
     "LabelView",
     "autograph_view",
 ]
@@ -7,6 +7,7 @@ from neontology.utils import (
     get_rels_by_type,
 )
 
+from ..changes import record_change
 from ..components import (
     BreadcrumbElement,
     ModelFormComponent,
@@ -50,11 +51,8 @@ class LabelCreateEndpointView(NeontologyView):
         if not form.form_validate(request.form):
             abort(422)
 
-        else:
-            new_node = form.form_to_model(request.form)
-
         try:
-            new_node.create()
+            new_node = form.form_save(request.form)
 
         except RuntimeError:
             abort(409)
@@ -104,6 +102,8 @@ class LabelEditEndpointView(NeontologyEndpointView):
 
         updated_node.merge()
 
+        record_change(updated_node)
+
         return redirect(self.viewset.pp_to_url(str(updated_node.get_pp())))
 
 
@@ -173,4 +173,6 @@ class LabelCreateRelationshipEndpointView(NeontologyEndpointView):
 
         new_rel.merge()
 
+        record_change(new_rel)
+
         return redirect(self.viewset.pp_to_url(str(self.node.get_pp())))
@@ -9,6 +9,7 @@ from ..components import (
 )
 from ..views import (
     NeontologyListView,
+    NeontologyTableDataView,
     page_element,
     page_section,
 )
@@ -38,17 +39,28 @@ class LabelListView(NeontologyListView):
 </a></h2>"""
         title = HTMLComponent(raw_html=title_html)
 
-        nodes = self.viewset.match_nodes()
+        fields = self.viewset.table_fields()
 
-        node_list_table = self.viewset.nodes_to_table(
-            nodes, fields=["__str__", self.model.__primaryproperty__]
-        )
+        if self.viewset.use_server_side_table():
+            # large labels: send an empty table, which pages through the nodes
+            node_list_table = self.viewset.nodes_to_table(
+                [], fields=fields, server_side=True
+            )
+
+        else:
+            nodes = self.viewset.match_nodes()
+
+            node_list_table = self.viewset.nodes_to_table(nodes, fields=fields)
 
         return [title, node_list_table]
 
-    @page_section(title="Schema")
+    @page_section(title="Schema", cache_ttl=300)
     def schema_section(self) -> MarkdownComponent:
         schema = self.model.neontology_schema()
         md = schema.md_node_table()
 
         return MarkdownComponent(text=md)
+
+
+class LabelTableDataView(NeontologyTableDataView):
+    viewset_handler = AutographViewset
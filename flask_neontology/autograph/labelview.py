@@ -1,6 +1,7 @@
 from typing import List
 
 from neontology import GraphConnection
+from neontology.utils import get_node_types, get_rels_by_type
 
 from ..components import (
     BreadcrumbElement,
@@ -72,7 +73,15 @@ class LabelView(NeontologyNodeView):
         else:
             return [title]
 
-    @page_section(title="Graph Visualization")
+    # the graph shows neighbours (and theirs) with any label or relationship type
+    @page_section(
+        title="Graph Visualization",
+        cache_ttl=60,
+        cache_depends_on=lambda view: (
+            get_node_types().keys(),
+            get_rels_by_type().keys(),
+        ),
+    )
     def graph_section(self) -> Graph2dComponent:
         gc = GraphConnection()
 
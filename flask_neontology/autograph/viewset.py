@@ -1,3 +1,5 @@
+from typing import Optional
+
 from flask import current_app
 from neontology.utils import (
     get_rels_by_type,
@@ -24,6 +26,11 @@ class AutographViewset(NeontologyViewset):
         LinkData(url="/autograph/", title="Autograph"),
     )
 
+    server_side_table_threshold = 1000
+
+    def table_fields(self) -> Optional[list]:
+        return ["__str__", self.model.__primaryproperty__]
+
     def item_url_pattern(self) -> str:
         return str(f"{self.parents[-1].url}{str(self.list_title())}/node/<pp>/")
 
@@ -47,7 +54,7 @@ def autograph_view() -> str:
         for label, node_class in node_classes.items()
     ]
 
-    label_cards_list = CardListComponent(children=label_cards)
+    label_cards_list = CardListComponent.trusted(children=label_cards)
 
     label_cards_section = SectionComponent(
         title="Explore the Labels", body=label_cards_list
@@ -0,0 +1,212 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set
+
+
+class CacheBackend(object):
+    """Base class for cache storage.
+
+    Subclass this to store cached fragments somewhere else (e.g. a shared cache).
+    Values are returned as stored, `None` means there is no (valid) entry.
+
+    Backends which drop entries themselves (eviction or expiry) should call
+    on_evict(key) for them, if it's set.
+    """
+
+    on_evict: Optional[Callable[[Hashable], None]] = None
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        raise NotImplementedError
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: Hashable) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class LRUCache(CacheBackend):
+    """In-memory cache with per-entry TTL and least recently used eviction.
+
+    Args:
+        max_entries (int): Maximum number of entries to hold before evicting.
+        default_ttl (Optional[float]): TTL in seconds for entries set without one.
+    """
+
+    def __init__(self, max_entries: int = 1024, default_ttl: Optional[float] = None):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[Hashable, tuple[Optional[float], Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires, value = entry
+
+            if expires is None or expires >= time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+
+                return value
+
+            del self._entries[key]
+            self.misses += 1
+
+        # expired
+        if self.on_evict is not None:
+            self.on_evict(key)
+
+        return None
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        if ttl is None:
+            ttl = self.default_ttl
+
+        expires = time.monotonic() + ttl if ttl is not None else None
+
+        evicted = []
+
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                evicted.append(self._entries.popitem(last=False)[0])
+                self.evictions += 1
+
+        if self.on_evict is not None:
+            for evicted_key in evicted:
+                self.on_evict(evicted_key)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+
+class TaggedCache(object):
+    """Cache entries tagged with what they depend on (e.g. node labels), so all
+    the entries for a tag can be dropped at once when it changes.
+
+    Tags are tracked in memory, so with a shared backend only this process's
+    entries are dropped (set a TTL to bound how stale the others get). Keys are
+    forgotten when the backend evicts them (see CacheBackend.on_evict), or when
+    they're found to be missing.
+
+    Args:
+        backend (CacheBackend): Where to store the entries.
+        max_keys (Optional[int]): Track at most this many keys, forgetting the
+            oldest (which are then only dropped by their TTL).
+    """
+
+    def __init__(self, backend: CacheBackend, max_keys: Optional[int] = None):
+        self.backend = backend
+        self.max_keys = max_keys
+        # tags by key, oldest first, and keys by tag
+        self._tags: OrderedDict[Hashable, Set[Hashable]] = OrderedDict()
+        self._keys: Dict[Hashable, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self.invalidations = 0
+
+        backend.on_evict = self.forget
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value = self.backend.get(key)
+
+        if value is None:
+            self.forget(key)
+
+        return value
+
+    def forget(self, key: Hashable) -> None:
+        """Stop tracking a key's tags (e.g. once it has been evicted)."""
+        with self._lock:
+            self._forget(key)
+
+    def _forget(self, key: Hashable) -> None:
+        for tag in self._tags.pop(key, ()):
+            keys = self._keys.get(tag)
+
+            if keys is not None:
+                keys.discard(key)
+
+                if not keys:
+                    del self._keys[tag]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[Hashable] = (),
+    ) -> None:
+        with self._lock:
+            self._forget(key)
+
+            self._tags[key] = set(tags)
+
+            for tag in self._tags[key]:
+                self._keys.setdefault(tag, set()).add(key)
+
+            if self.max_keys is not None:
+                while len(self._tags) > self.max_keys:
+                    self._forget(next(iter(self._tags)))
+
+        self.backend.set(key, value, ttl=ttl)
+
+    def invalidate(self, *tags: Hashable) -> None:
+        """Drop every entry tagged with any of the tags."""
+        with self._lock:
+            keys = set()
+
+            for tag in tags:
+                keys |= self._keys.get(tag, set())
+
+            for key in keys:
+                self._forget(key)
+
+            self.invalidations += len(keys)
+
+        for key in keys:
+            self.backend.delete(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tags.clear()
+            self._keys.clear()
+
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        stats = getattr(self.backend, "stats", dict)()
+
+        return {**stats, "invalidations": self.invalidations}
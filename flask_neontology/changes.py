@@ -0,0 +1,363 @@
+import logging
+import threading
+from collections import Counter
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from flask import current_app, has_app_context
+from neontology import BaseNode, BaseRelationship
+
+from .records import match_rows
+
+
+class GenerationStore(object):
+    """Base class for storage of change generation counters.
+
+    Subclass this to keep the counters somewhere shared (e.g. a Redis INCR/MGET),
+    so that every worker process agrees on them, and set shared to True. Keys are
+    e.g. "label:Page" or "relationship:AUTHORED_BY", and counters start at 0.
+    """
+
+    # Whether every process sees the same counters
+    shared: bool = False
+
+    def get(self, keys: Sequence[str]) -> List[int]:
+        raise NotImplementedError
+
+    def incr(self, keys: Sequence[str]) -> None:
+        raise NotImplementedError
+
+
+class MemoryGenerationStore(GenerationStore):
+    """Counters held in memory, so only changes made in this process count."""
+
+    def __init__(self):
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, keys: Sequence[str]) -> List[int]:
+        with self._lock:
+            return [self._counters.get(key, 0) for key in keys]
+
+    def incr(self, keys: Sequence[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._counters[key] = self._counters.get(key, 0) + 1
+
+
+class ChangeTracker(object):
+    """Per-label and per-relationship-type generation counters, bumped whenever
+    nodes or relationships are written through the library.
+
+    Anything built from the graph can depend on the generations of the labels
+    (and relationship types) it reads, e.g. in a cache key or ETag, rather than
+    relying on a TTL.
+
+    Args:
+        store (Optional[GenerationStore]): Where to keep the counters, in memory
+            by default.
+    """
+
+    def __init__(self, store: Optional[GenerationStore] = None):
+        if store is None:
+            store = MemoryGenerationStore()
+
+        self.store = store
+
+        # (listener, whether it's only called for changes made in this process)
+        self._listeners: List[Tuple[Callable, bool]] = []
+
+    def changed(
+        self,
+        labels: Iterable[str] = (),
+        relationship_types: Iterable[str] = (),
+        local: bool = True,
+    ) -> None:
+        """Bump the generations of labels and relationship types.
+
+        local is False for changes made elsewhere (e.g. seen by a
+        WatermarkWatcher), which aren't passed on to local_only listeners.
+        """
+        labels = tuple(labels)
+        relationship_types = tuple(relationship_types)
+
+        self.store.incr(
+            [f"label:{label}" for label in labels]
+            + [f"relationship:{rel_type}" for rel_type in relationship_types]
+        )
+
+        for listener, local_only in self._listeners:
+            if local or not local_only:
+                listener(labels, relationship_types)
+
+    def record(self, *items: Union[BaseNode, BaseRelationship]) -> None:
+        """Bump the generations for written nodes and relationships.
+
+        Relationships also bump the labels of the nodes at either end, as what's
+        related to them has changed.
+        """
+        labels = set()
+        relationship_types = set()
+
+        for item in items:
+            if isinstance(item, BaseRelationship):
+                relationship_types.add(item.get_relationship_type())
+                labels.add(item.source.__primarylabel__)
+                labels.add(item.target.__primarylabel__)
+
+            else:
+                labels.add(item.__primarylabel__)
+
+        self.changed(sorted(labels), sorted(relationship_types))
+
+    def generations(
+        self, labels: Iterable[str] = (), relationship_types: Iterable[str] = ()
+    ) -> Tuple[int, ...]:
+        """The current generations of labels and relationship types (in order)."""
+        return tuple(
+            self.store.get(
+                [f"label:{label}" for label in labels]
+                + [f"relationship:{rel_type}" for rel_type in relationship_types]
+            )
+        )
+
+    def subscribe(
+        self,
+        listener: Callable[[Tuple[str, ...], Tuple[str, ...]], None],
+        local_only: bool = False,
+    ) -> None:
+        """Call listener(labels, relationship_types) after each change."""
+        self._listeners.append((listener, local_only))
+
+
+def _see(seen: Dict[str, int], watermarks: Dict[str, int]) -> List[str]:
+    """Update the seen watermark generations, returning the keys which moved on."""
+    # generations only go up, so a poll which read the graph before a local bump
+    # can't move them back
+    moved = [
+        key for key, generation in watermarks.items() if generation > seen.get(key, 0)
+    ]
+
+    for key in moved:
+        seen[key] = watermarks[key]
+
+    return moved
+
+
+class WatermarkWatcher(object):
+    """Polls watermark nodes in the graph, so changes made by other processes
+    (other workers, or other services writing to the graph) are picked up.
+
+    Each label or relationship type's watermark is a node like
+    (:NeontologyWatermark {key: "label:Page", generation: 12}), which writers
+    bump. When one moves, the watcher bumps the generation in the ChangeTracker,
+    so caches depending on it are replaced.
+
+    Changes made in this process are queued, and move the watermarks (in one
+    query) at the start of the next poll, so requests don't wait on the write.
+    They aren't counted again when they're polled. With a shared GenerationStore
+    other processes already see this process's changes, so the watermarks aren't
+    moved for them, and each move is claimed (and counted) by the first process
+    to poll after it, rather than by every process.
+
+    Args:
+        changes (ChangeTracker): Tracker to update when a watermark moves.
+        interval (float): Seconds between polls.
+        label (str): Label of the watermark nodes.
+        logger (Optional[logging.Logger]): Where to log failed polls.
+    """
+
+    def __init__(
+        self,
+        changes: ChangeTracker,
+        interval: float = 10,
+        label: str = "NeontologyWatermark",
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.changes = changes
+        self.interval = interval
+        self.label = label
+        self._quoted_label = "`" + label.replace("`", "``") + "`"
+        self.logger = logger or logging.getLogger(__name__)
+
+        # watermark generations by key, as of the last poll (or local bump)
+        self._seen: Optional[Dict[str, int]] = None
+        # bumps of this process's changes, by key, waiting to move the watermarks
+        self._pending: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        self.polls = 0
+        self.moves = 0
+        self.errors = 0
+
+        if not changes.store.shared:
+            changes.subscribe(self.bump, local_only=True)
+
+    def bump(self, labels: Sequence[str], relationship_types: Sequence[str]) -> None:
+        """Queue moves of the watermarks for changes made in this process."""
+        keys = [f"label:{label}" for label in labels] + [
+            f"relationship:{rel_type}" for rel_type in relationship_types
+        ]
+
+        with self._lock:
+            self._pending.update(keys)
+
+    def flush(self) -> None:
+        """Move the watermarks for the changes queued by bump(), in one query."""
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+
+        if not pending:
+            return
+
+        cypher = (
+            f"UNWIND $bumps AS bump MERGE (w:{self._quoted_label} {{key: bump.key}})"
+            " SET w.generation = coalesce(w.generation, 0) + bump.count"
+            " RETURN w.key AS key, w.generation AS generation"
+        )
+
+        bumps = [{"key": key, "count": count} for key, count in sorted(pending.items())]
+
+        try:
+            records = match_rows(cypher, {"bumps": bumps})
+
+        except Exception:
+            # try again with the next poll
+            with self._lock:
+                self._pending.update(pending)
+
+            self.errors += 1
+            self.logger.exception("Failed to move the watermarks for %s.", bumps)
+            return
+
+        # this process has already recorded these moves, so polls skip them (unless
+        # another process moved the watermark too, since the last poll)
+        with self._lock:
+            if self._seen is not None:
+                for record in records:
+                    key, generation = record["key"], record["generation"]
+
+                    if self._seen.get(key, 0) == generation - pending[key]:
+                        self._seen[key] = generation
+
+    def poll(self) -> None:
+        """Move the watermarks for this process's changes, then check them, and
+        record changes for any that have moved.
+
+        The first poll only notes where they are.
+        """
+        if self.changes.store.shared:
+            self._poll_shared()
+            return
+
+        self.flush()
+
+        cypher = (
+            f"MATCH (w:{self._quoted_label})"
+            " RETURN w.key AS key, w.generation AS generation"
+        )
+
+        records = match_rows(cypher)
+
+        self.polls += 1
+
+        with self._lock:
+            first_poll = self._seen is None
+
+            if self._seen is None:
+                self._seen = {}
+
+            moved = _see(
+                self._seen, {record["key"]: record["generation"] for record in records}
+            )
+
+        if not first_poll:
+            self._moved(moved)
+
+    def _poll_shared(self) -> None:
+        """Claim and record the watermarks which have moved since they were last
+        claimed, by any process."""
+        cypher = (
+            f"MATCH (w:{self._quoted_label})"
+            " WHERE w.generation > coalesce(w.counted, 0)"
+            " SET w.counted = w.generation"
+            " RETURN w.key AS key"
+        )
+
+        records = match_rows(cypher)
+
+        self.polls += 1
+
+        self._moved([record["key"] for record in records])
+
+    def _moved(self, keys: List[str]) -> None:
+        if not keys:
+            return
+
+        self.moves += len(keys)
+
+        self.changes.changed(
+            [key[6:] for key in keys if key.startswith("label:")],
+            [key[13:] for key in keys if key.startswith("relationship:")],
+            local=False,
+        )
+
+    def run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+
+            except Exception:
+                self.errors += 1
+                self.logger.exception("Failed to poll the graph's watermarks.")
+
+            self._stop.wait(self.interval)
+
+    def start(self) -> None:
+        """Start polling in a background thread (if it isn't already running).
+
+        Threads don't survive a fork, so call this again in forked workers.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stop.clear()
+
+        self._thread = threading.Thread(
+            target=self.run, name="neontology-watermark-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def stats(self) -> Dict[str, int]:
+        return {"polls": self.polls, "moves": self.moves, "errors": self.errors}
+
+
+def get_change_tracker() -> Optional[ChangeTracker]:
+    if not has_app_context():
+        return None
+
+    neontology_manager = getattr(current_app, "neontology_manager", None)
+
+    return getattr(neontology_manager, "changes", None)
+
+
+def record_change(*items: Union[BaseNode, BaseRelationship]) -> None:
+    """Record nodes or relationships written to the graph with the current app's
+    NeontologyManager (if there is one)."""
+    changes = get_change_tracker()
+
+    if changes is not None:
+        changes.record(*items)
@@ -9,6 +9,7 @@ from flask_frozen import Freezer, MissingURLGeneratorWarning
 from neontology.tools import import_json, import_md, import_yaml
 from neontology.utils import get_node_types, get_rels_by_type
 
+from flask_neontology.changes import get_change_tracker
 from flask_neontology.views import NeontologyListView
 
 
@@ -38,12 +39,28 @@ def ingest(directory: str, file_type: str, validate_only: bool) -> None:
 
         else:
             click.echo("Invalid file type specified. See help.")
+            return
 
     except KeyError:
         click.echo(
             "Import failed, are all content nodes defined "
             "and registered with the NeontologyManager."
         )
+        return
+
+    if not validate_only:
+        # any node or relationship type could have been imported
+        changes = get_change_tracker()
+
+        if changes is not None:
+            changes.changed(get_node_types().keys(), get_rels_by_type().keys())
+
+        neontology_manager = getattr(current_app, "neontology_manager", None)
+        watcher = getattr(neontology_manager, "watermark_watcher", None)
+
+        # move the watermarks now, the command exits before the watcher's next poll
+        if watcher is not None:
+            watcher.flush()
 
 
 @click.command("export")
@@ -89,6 +106,27 @@ def export(directory) -> None:
                 json.dump(export_rels, export_file, indent=2)
 
 
+@click.command("vendor-assets")
+def vendor_assets() -> None:
+    """Download third party scripts/styles so they can be served locally."""
+    neontology_manager = getattr(current_app, "neontology_manager", None)
+
+    if neontology_manager is None:
+        raise RuntimeError(
+            "The Flask app does not have a 'neontology_manager' attribute. "
+            "Please ensure it is initialized and attached to the app."
+        )
+
+    assets = neontology_manager.assets
+
+    click.echo(f"Saving assets to {assets.directory}")
+
+    manifest = assets.vendor()
+
+    for source_url, filename in manifest.items():
+        click.echo(f"{source_url} -> {filename}")
+
+
 @click.command("freeze")
 @click.argument("directory", type=click.Path(exists=True))
 def freeze(directory) -> None:
@@ -153,4 +191,8 @@ def freeze(directory) -> None:
                             "<pp>", urllib.parse.quote(str(node.get_pp()))
                         )
 
+        # include any vendored assets referenced by the pages
+        for filename in neontology_manager.assets.manifest.values():
+            yield "neontology_core.asset", {"filename": filename}
+
     freezer.freeze()
@@ -1,7 +1,7 @@
 from .breadcrumb_element import BreadcrumbElement
 from .card_component import CardComponent
 from .card_list_component import CardListComponent
-from .component import Component
+from .component import Component, TemplateCache
 from .cytoscape_component import CytoscapeComponent
 from .feature_item_component import FeatureItemComponent
 from .feature_panel_component import FeaturePanelComponent
@@ -21,7 +21,8 @@ from .list_item_component import ListItemComponent
 from .markdown_component import MarkdownComponent
 from .meta_data import MetaData
 from .page_component import PageComponent, PageElements, PageElementsEnum
-from .section_component import SectionComponent
+from .pagination_component import PaginationComponent
+from .section_component import CachedSectionComponent, SectionComponent
 from .sidemenu_element import SideMenuElement, SideMenuItem
 from .table_component import ColumnData, NodeListTableComponent, TableComponent
 from .table_translated_component import (
@@ -33,6 +34,7 @@ from .text_component import TextComponent
 
 __all__ = [
     "BreadcrumbElement",
+    "CachedSectionComponent",
     "CardComponent",
     "CardListComponent",
     "Component",
@@ -56,6 +58,7 @@ __all__ = [
     "PageComponent",
     "PageElements",
     "PageElementsEnum",
+    "PaginationComponent",
     "SectionComponent",
     "SideMenuElement",
     "SideMenuItem",
@@ -65,5 +68,6 @@ __all__ = [
     "NodeTranslatedTableComponent",
     "RowData",
     "TranslatedTableComponent",
+    "TemplateCache",
     "TextComponent",
 ]
@@ -1,8 +1,9 @@
-from typing import ClassVar, Sequence
+from typing import ClassVar, Optional, Sequence
 
 from .card_component import CardComponent
 from .component import Component
 from .list_component_base import ListComponentBase
+from .pagination_component import PaginationComponent
 
 
 class CardListComponent(Component, ListComponentBase):
@@ -14,6 +15,11 @@ class CardListComponent(Component, ListComponentBase):
   </div>
   {% endfor %}
   </div>
+{% if data.pagination %}
+{{data.pagination.render() | safe}}
+{% endif %}
 """
 
     children: Sequence[CardComponent]
+
+    pagination: Optional[PaginationComponent] = None
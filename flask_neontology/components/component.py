@@ -1,7 +1,170 @@
-from typing import ClassVar, List
+import functools
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from weakref import WeakKeyDictionary
 
-from flask import render_template_string
-from pydantic import BaseModel, ConfigDict
+from flask import current_app, g, has_app_context, render_template
+from jinja2 import Environment, Template
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    PlainValidator,
+    WrapValidator,
+)
+
+
+class TemplateCache(object):
+    """Registry of compiled component templates.
+
+    Each component class's `template` source is compiled once per Jinja environment.
+    An entry is recompiled if the class's template source no longer matches
+    (e.g. it has been reassigned at runtime).
+    """
+
+    def __init__(self) -> None:
+        self._compiled: WeakKeyDictionary[
+            Environment, Dict[type, Tuple[str, Template]]
+        ] = WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, env: Environment, component_class: type, source: str) -> Template:
+        env_templates = self._compiled.get(env)
+
+        if env_templates is not None:
+            entry = env_templates.get(component_class)
+
+            # compare by identity first, as the source is usually the same object
+            if entry is not None and (entry[0] is source or entry[0] == source):
+                self.hits += 1
+                return entry[1]
+
+        compiled = env.from_string(source)
+
+        with self._lock:
+            self.misses += 1
+            self._compiled.setdefault(env, {})[component_class] = (source, compiled)
+
+        return compiled
+
+    def clear(self) -> None:
+        with self._lock:
+            self._compiled.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": sum(len(x) for x in self._compiled.values()),
+        }
+
+
+template_cache = TemplateCache()
+
+
+class ComponentIdScope(object):
+    """Generates component IDs from a seed and a per-prefix counter.
+
+    IDs are unique within the scope and stable between renders,
+    as long as components are created in the same order.
+    """
+
+    def __init__(self, seed: str) -> None:
+        self.seed = seed
+        self.counts: Dict[str, int] = defaultdict(int)
+
+    def next_id(self, prefix: str) -> str:
+        self.counts[prefix] += 1
+
+        # only use characters which are also valid in JavaScript identifiers
+        return f"{prefix}_{self.seed}_{self.counts[prefix]}"
+
+
+_component_id_scope: ContextVar[Optional[ComponentIdScope]] = ContextVar(
+    "neontology_component_id_scope", default=None
+)
+
+# for components created outside an app context, one per thread (or task)
+_fallback_id_scope: ContextVar[Optional[ComponentIdScope]] = ContextVar(
+    "neontology_fallback_id_scope", default=None
+)
+
+
+@contextmanager
+def component_id_scope(seed: str) -> Iterator[ComponentIdScope]:
+    """Generate IDs for components created within this block from the given seed.
+
+    Page sections are built within a scope seeded with the section's name,
+    so that IDs don't depend on which sections were built first.
+    """
+    scope = ComponentIdScope(seed)
+    token = _component_id_scope.set(scope)
+
+    try:
+        yield scope
+
+    finally:
+        _component_id_scope.reset(token)
+
+
+def component_id(prefix: str) -> str:
+    """Return a deterministic ID, unique within the current page, for a component."""
+    scope = _component_id_scope.get()
+
+    if scope is None:
+        if has_app_context():
+            # a fresh scope for each request/app context
+            if "neontology_id_scope" not in g:
+                g.neontology_id_scope = ComponentIdScope("page")
+
+            scope = g.neontology_id_scope
+
+        else:
+            scope = _fallback_id_scope.get()
+
+            if scope is None:
+                scope = ComponentIdScope("c")
+                _fallback_id_scope.set(scope)
+
+    return scope.next_id(prefix)
+
+
+ComponentT = TypeVar("ComponentT", bound="Component")
+
+
+@functools.lru_cache(maxsize=None)
+def _has_validators(cls: type[BaseModel]) -> bool:
+    """Whether a model declares any validators, which model_construct skips."""
+    decorators = cls.__pydantic_decorators__
+
+    return bool(
+        decorators.field_validators
+        or decorators.model_validators
+        or any(
+            isinstance(
+                item, (AfterValidator, BeforeValidator, PlainValidator, WrapValidator)
+            )
+            for field in cls.model_fields.values()
+            for item in field.metadata
+        )
+    )
 
 
 class Component(BaseModel):
@@ -12,5 +175,29 @@ class Component(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
+    @classmethod
+    def compiled_template(cls) -> Template:
+        """Return this class's template, compiled for the current app's environment."""
+        return template_cache.get(current_app.jinja_env, cls, cls.template)
+
+    @classmethod
+    def trusted(cls: type[ComponentT], **data: Any) -> ComponentT:
+        """Build a component from data which is already correctly typed, without
+        validating it.
+
+        Only for components which declare no validators (nothing would derive the
+        data they set), and data built by the library itself, as the fields
+        aren't checked at all.
+
+        Raises:
+            TypeError: If the component declares any validators.
+        """
+        if _has_validators(cls):
+            raise TypeError(
+                f"{cls.__name__} has validators, so it can't be built with trusted()"
+            )
+
+        return cls.model_construct(**data)
+
     def render(self) -> str:
-        return render_template_string(self.template, data=self)
+        return render_template(self.compiled_template(), data=self)
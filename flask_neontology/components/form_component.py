@@ -1,5 +1,3 @@
-import random
-import string
 from enum import Enum
 from typing import Any, ClassVar, List, Optional, Union, get_args
 
@@ -8,7 +6,8 @@ from neontology.schema_utils import SchemaProperty, extract_type_mapping
 from neontology.utils import get_node_types
 from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
 
-from .component import Component
+from ..changes import record_change
+from .component import Component, component_id
 
 
 class ButtonComponent(Component):
@@ -32,8 +31,7 @@ class FieldComponent(Component):
     @field_validator("field_id")
     def generate_unique_id(cls, v: Optional[str]) -> str:
         if v is None:
-            letters = string.ascii_lowercase
-            v = "".join(random.choice(letters) for i in range(6))
+            v = component_id("field")
 
         return v
 
@@ -244,6 +242,21 @@ class ModelFormComponent(FormComponent):
     def form_to_model(self, data: dict):
         return self.model(**self._tidy_data(data))
 
+    def form_save(self, data: dict, merge: bool = False):
+        """Create (or merge) the model from form data in the graph, recording the
+        change with the NeontologyManager."""
+        item = self.form_to_model(data)
+
+        # relationships can only be merged
+        if merge or isinstance(item, BaseRelationship):
+            item.merge()
+        else:
+            item.create()
+
+        record_change(item)
+
+        return item
+
 
 class RelationshipFormComponent(ModelFormComponent):
     # wrap the form in an accordion
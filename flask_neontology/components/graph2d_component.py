@@ -1,12 +1,10 @@
-import random
-import string
 from pathlib import Path
 from typing import ClassVar, List, Optional, Union
 
 from neontology.result import NeontologyResult
 from pydantic import AnyHttpUrl, Field, field_validator, model_validator
 
-from .component import Component
+from .component import Component, component_id
 
 
 class Graph2dComponent(Component):
@@ -82,7 +80,6 @@ fetch("{{data.url}}").then(res => res.json()).then(gData3 => {
     @field_validator("unique_id")
     def generate_unique_id(cls, v: Optional[str]) -> str:
         if v is None:
-            letters = string.ascii_lowercase
-            v = "".join(random.choice(letters) for i in range(6))
+            v = component_id("graph")
 
         return v
@@ -1,9 +1,12 @@
 from enum import Enum
-from typing import ClassVar, List, Optional, Union
+from typing import ClassVar, Iterable, Iterator, List, Optional, Union
 
+from flask import stream_template
 from pydantic import BaseModel, field_validator, model_validator
 
+from ..assets import rewrite_asset_urls
 from .component import Component
+from .html_component import HTMLComponent
 from .section_component import SectionComponent
 
 
@@ -45,7 +48,7 @@ class PageComponent(Component):
 {% if data.headtags %}
 {% block headtags %}
 {% for headtag in data.headtags %}
-{{headtag | safe}}
+{{data.asset_tag(headtag) | safe}}
 {% endfor %}
 {% endblock headtags %}
 {% endif %}
@@ -70,7 +73,7 @@ class PageComponent(Component):
 {% if data.elements.breadcrumbs is not none  %}
 {{ data.elements.breadcrumbs.render() | safe }}
 {% endif %}
-{% for section in data.sections %}
+{% for section in (streamed_sections if streamed_sections is defined else data.sections) %}
 {{section.render() | safe}}
 {% endfor %}
 {% endblock content %}
@@ -90,11 +93,11 @@ class PageComponent(Component):
 {% if data.tailtags %}
 {% block tailtags %}
 {% for tailtag in data.tailtags %}
-{{tailtag | safe}}
+{{data.asset_tag(tailtag) | safe}}
 {% endfor %}
 {% endblock tailtags %}
 {% endif %}
-"""
+"""  # noqa: E501
     title: Optional[str] = None
     description: Optional[str] = None
     sticky_topnav: bool = False
@@ -130,3 +133,47 @@ class PageComponent(Component):
                 self.tailtags.append(tailtag)
 
         return self
+
+    def asset_tag(self, tag: str) -> str:
+        """Point a headtag/tailtag at locally served assets, if they're available."""
+        return rewrite_asset_urls(tag)
+
+    def stream(self, sections: Iterable[Component]) -> Iterator[str]:
+        """Render the page incrementally, evaluating sections as they are consumed.
+
+        The head (including any headtags already set on the page) and breadcrumbs
+        are sent before the first section. Headtags first seen on a streamed section
+        are emitted inline just before it, tailtags are emitted at the end as usual.
+
+        Must be called within a request context.
+        """
+        return stream_template(
+            self.compiled_template(),
+            data=self,
+            streamed_sections=self._stream_sections(sections),
+        )
+
+    def _stream_sections(self, sections: Iterable[Component]) -> Iterator[Component]:
+        for entry in sections:
+            if isinstance(entry, SectionComponent):
+                section = entry
+            else:
+                section = SectionComponent(body=[entry])
+
+            new_headtags = []
+
+            for headtag in section.headtags:
+                if headtag not in self.headtags:
+                    self.headtags.append(headtag)
+                    new_headtags.append(headtag)
+
+            if new_headtags:
+                yield HTMLComponent(
+                    raw_html="\n".join(self.asset_tag(x) for x in new_headtags)
+                )
+
+            for tailtag in section.tailtags:
+                if tailtag not in self.tailtags:
+                    self.tailtags.append(tailtag)
+
+            yield section
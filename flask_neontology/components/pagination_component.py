@@ -0,0 +1,33 @@
+from typing import ClassVar, Optional
+
+from .component import Component
+
+
+class PaginationComponent(Component):
+    template: ClassVar = """
+<nav aria-label="{{data.label}}">
+  <ul class="pagination justify-content-center pt-3">
+    <li class="page-item{% if not data.prev_url %} disabled{% endif %}">
+      {% if data.prev_url %}
+      <a class="page-link" href="{{data.prev_url}}" rel="prev">{{data.prev_title}}</a>
+      {% else %}
+      <span class="page-link">{{data.prev_title}}</span>
+      {% endif %}
+    </li>
+    <li class="page-item{% if not data.next_url %} disabled{% endif %}">
+      {% if data.next_url %}
+      <a class="page-link" href="{{data.next_url}}" rel="next">{{data.next_title}}</a>
+      {% else %}
+      <span class="page-link">{{data.next_title}}</span>
+      {% endif %}
+    </li>
+  </ul>
+</nav>
+"""
+
+    prev_url: Optional[str] = None
+    next_url: Optional[str] = None
+
+    prev_title: str = "Previous"
+    next_title: str = "Next"
+    label: str = "Pages"
@@ -69,3 +69,12 @@ class SectionComponent(SectionHeadComponent):
                     self.tailtags += component.tailtags
 
         return self
+
+
+class CachedSectionComponent(SectionComponent):
+    """A section which has already been rendered, e.g. restored from a cache."""
+
+    template: ClassVar = "{{data.html | safe}}"
+
+    html: str
+    body: Optional[Union[Component, List[Component]]] = None
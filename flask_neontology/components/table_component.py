@@ -1,12 +1,12 @@
 import urllib.parse
 from collections import OrderedDict
 from typing import ClassVar, Dict, List, Optional, Union
-from uuid import uuid4
 
 from neontology import BaseNode
 from pydantic import BaseModel, Field, field_validator, model_validator
 
-from .component import Component
+from .component import Component, component_id
+from .pagination_component import PaginationComponent
 
 
 class ColumnData(BaseModel):
@@ -55,10 +55,40 @@ class TableComponent(Component):
         </tbody>
     </table>
 </div>
-{% if data.datatable %}
+{% if data.pagination %}
+{{data.pagination.render() | safe}}
+{% endif %}
+{% if data.datatable or data.datatable_server_url %}
 <script type="text/javascript">
 $(document).ready( function () {
   $('#{{data.table_id}}').DataTable({
+    {% if data.datatable_server_url %}
+    "serverSide": true,
+    "processing": true,
+    "ajax": {{data.datatable_server_url | tojson}},
+    "columns": [
+      {% for column in data.columns %}
+      {
+        "data": {{column.result_field | tojson}},
+        "render": function (value, type, row) {
+          if (Array.isArray(value)) {
+            value = value.join({{column.separator | tojson}});
+          }
+          if (type !== "display") { return value; }
+          {% if column.link_field %}
+          var cell = $("<a>").attr("href", row[{{column.link_field | tojson}}]);
+          {% if column.link_target %}
+          cell.attr("target", {{column.link_target | tojson}});
+          cell.attr("rel", "noopener noreferrer");
+          {% endif %}
+          {% else %}
+          var cell = $("<span>");
+          {% endif %}
+          return cell.text(value === null ? "None" : value).prop("outerHTML");
+        }
+      }{% if not loop.last %},{% endif %}
+      {% endfor %}
+    ],{% endif %}
     {% if data.datatable_columncontrol %}
     "columnControl": ['order', ['orderAsc', 'orderDesc', 'search']],{% endif %}
     "pageLength": {{data.datatable_page_length}},
@@ -82,11 +112,18 @@ $(document).ready( function () {
 
     datatable_columncontrol: bool = False
 
-    table_id: Optional[str] = Field(default_factory=uuid4)
+    # Fetch rows a page at a time from this URL (DataTables' serverSide mode),
+    # rather than rendering them into the table.
+    datatable_server_url: Optional[str] = None
+
+    # Links to the previous/next pages, for tables built from one page of results
+    pagination: Optional[PaginationComponent] = None
+
+    table_id: Optional[str] = Field(default_factory=lambda: component_id("table"))
 
     @model_validator(mode="after")
     def add_datatable_scripts(self):
-        if self.datatable is True:
+        if self.datatable is True or self.datatable_server_url:
             self.headtags += [
                 "<link href='https://cdn.datatables.net/2.1.2/css/dataTables.dataTables.min.css' rel='stylesheet'>",  # noqa: E501
                 (
@@ -109,7 +146,7 @@ $(document).ready( function () {
     @model_validator(mode="after")
     def auto_search(self) -> "TableComponent":
         if self.datatable_searching is None:
-            if len(self.rows) > 20:
+            if self.datatable_server_url or len(self.rows) > 20:
                 self.datatable_searching = True
             else:
                 self.datatable_searching = False
@@ -120,7 +157,9 @@ $(document).ready( function () {
 class NodeListTableComponent(TableComponent):
     columns: List[ColumnData] = []
     rows: List[Dict[str, Union[str, int, list]]] = []
-    nodes: List[BaseNode]
+    nodes: List[BaseNode] = []
+    # Node class, to generate columns without any nodes (e.g. for server side tables)
+    model: Optional[type[BaseNode]] = None
     url_pattern: Optional[str] = None
     url_field: Optional[str] = None
     fields: Optional[Union[List[str], Dict[str, str]]] = None
@@ -138,12 +177,13 @@ class NodeListTableComponent(TableComponent):
     @model_validator(mode="before")
     @classmethod
     def generate_columns(cls, data: dict) -> dict:
-        if data.get("columns") is None and data["nodes"]:
-            first_node = data["nodes"][0]
+        if data.get("columns") is None and (data.get("nodes") or data.get("model")):
+            node_class = data.get("model") or type(data["nodes"][0])
+
             data["columns"] = []
 
             if not data.get("fields"):
-                fields = OrderedDict([(x, x) for x in first_node.model_fields])
+                fields = OrderedDict([(x, x) for x in node_class.model_fields])
 
             else:
                 if isinstance(data["fields"], list):
@@ -154,8 +194,8 @@ class NodeListTableComponent(TableComponent):
             if data.get("url_pattern"):
                 if data.get("url_field"):
                     url_column = data["url_field"]
-                elif first_node.__primaryproperty__ in fields:
-                    url_column = first_node.__primaryproperty__
+                elif node_class.__primaryproperty__ in fields:
+                    url_column = node_class.__primaryproperty__
                 else:
                     url_column = list(fields.items())[0][1]
 
@@ -192,18 +232,48 @@ class NodeListTableComponent(TableComponent):
     @model_validator(mode="after")
     def generate_rows(self) -> "NodeListTableComponent":
         self.rows = []
+
+        if not self.nodes:
+            return self
+
+        # only build the values which are actually displayed
+        referenced = {column.result_field for column in self.columns} | {
+            column.link_field for column in self.columns if column.link_field
+        }
+
+        node_class = type(self.nodes[0])
+        dump_fields = referenced & set(node_class.model_fields)
+
+        include_str = "__str__" in referenced
+        include_pp = "__pp__" in referenced
+
+        # by default, a node's string representation is its primary property
+        str_is_pp = node_class.__str__ is BaseNode.__str__
+
+        url_parts = None
+        if self.url_pattern and "fn_node_link_field" in referenced:
+            url_parts = self.url_pattern.split("<pp>")
+
+        need_pp = include_pp or url_parts is not None or (include_str and str_is_pp)
+
+        quote = urllib.parse.quote
+        append_row = self.rows.append
+
         for x in self.nodes:
-            row = {
-                **x.model_dump(),
-                "__str__": str(x),
-                "__pp__": str(x.get_pp()),
-            }
-
-            if self.url_pattern:
-                row["fn_node_link_field"] = self.url_pattern.replace(
-                    "<pp>", urllib.parse.quote(str(x.get_pp()))
-                )
-
-            self.rows.append(row)
+            row = x.model_dump(include=dump_fields) if dump_fields else {}
+
+            if need_pp:
+                pp = str(x.get_pp())
+
+            if include_str:
+                row["__str__"] = pp if str_is_pp else str(x)
+
+            if include_pp:
+                row["__pp__"] = pp
+
+            if url_parts is not None:
+                row["fn_node_link_field"] = quote(pp).join(url_parts)
+
+            append_row(row)
 
         return self
@@ -1,24 +1,39 @@
+import functools
 import os
 from enum import Enum
+from pathlib import Path
 from typing import Any, List, Optional
 
-from flask import Blueprint, Flask, g
+from flask import Blueprint, Flask, abort, current_app, g, request
 from neontology import BaseNode, GraphConnection, init_neontology
 from neontology.graphengines import Neo4jConfig
 from neontology.graphengines.graphengine import GraphEngineConfig
-from spectree import Response, SpecTree, Tag
+from pydantic import BaseModel
+from spectree import SpecTree, Tag
 
+from .assets import NeontologyAssets, get_assets, vendored_assets_filter
 from .autograph import (
     AutographViewset,
     LabelCreateEndpointView,
     LabelCreateRelationshipEndpointView,
     LabelEditEndpointView,
     LabelListView,
+    LabelTableDataView,
     LabelView,
     autograph_view,
 )
-from .commands import export, freeze, ingest
-from .views import NeontologyAPIView, NeontologyView
+from .cache import CacheBackend, LRUCache, TaggedCache
+from .changes import ChangeTracker, GenerationStore, WatermarkWatcher
+from .commands import export, freeze, ingest, vendor_assets
+from .views import (
+    NeontologyAPIView,
+    NeontologyListView,
+    NeontologyTableDataView,
+    NeontologyView,
+)
+from .views.apiview import BatchBody, BatchQuery, FieldsQuery, ListQuery
+from .views.conditional import is_not_modified, not_modified_response
+from .views.validation import ResponseValidator, skip_response_validation
 
 
 def loc():
@@ -34,6 +49,16 @@ bp = Blueprint(
 )
 
 
+@bp.route("/neontology/assets/<path:filename>")
+def asset(filename: str):
+    assets = get_assets()
+
+    if assets is None:
+        abort(404)
+
+    return assets.send(filename)
+
+
 class NeontologyManager:
     def __init__(
         self,
@@ -42,6 +67,9 @@ class NeontologyManager:
         autograph_nodes: List[BaseNode] = [],
         views: List[type[NeontologyView]] = [],
         api_views: dict[str, List[type[NeontologyAPIView]]] = {},
+        fragment_cache: Optional[CacheBackend] = None,
+        api_cache: Optional[CacheBackend] = None,
+        change_store: Optional[GenerationStore] = None,
     ):
         if app is not None:
             self.init_app(
@@ -50,6 +78,9 @@ class NeontologyManager:
                 autograph_nodes=autograph_nodes,
                 views=views,
                 api_views=api_views,
+                fragment_cache=fragment_cache,
+                api_cache=api_cache,
+                change_store=change_store,
             )
 
     def init_app(
@@ -60,6 +91,9 @@ class NeontologyManager:
         autograph_decorators: List = [],
         views: List[type[NeontologyView]] = [],
         api_views: dict[str, List[type[NeontologyAPIView]]] = {},
+        fragment_cache: Optional[CacheBackend] = None,
+        api_cache: Optional[CacheBackend] = None,
+        change_store: Optional[GenerationStore] = None,
     ) -> None:
         app.neontology_manager = self  # type: ignore[attr-defined]
 
@@ -74,6 +108,50 @@ class NeontologyManager:
 
         init_neontology(config=graph_config)
 
+        # generation counters for each label and relationship type, bumped by writes
+        self.changes = ChangeTracker(change_store)
+
+        # poll the graph for changes made by other processes
+        self.watermark_watcher = None
+
+        if app.config.get("NEONTOLOGY_WATERMARK_INTERVAL") is not None:
+            self.watermark_watcher = WatermarkWatcher(
+                self.changes,
+                interval=app.config["NEONTOLOGY_WATERMARK_INTERVAL"],
+                label=app.config.get(
+                    "NEONTOLOGY_WATERMARK_LABEL", "NeontologyWatermark"
+                ),
+                logger=app.logger,
+            )
+            self.watermark_watcher.start()
+
+        # storage for page sections declared with a cache_ttl
+        if fragment_cache is None:
+            fragment_cache = LRUCache(
+                max_entries=app.config.get("NEONTOLOGY_FRAGMENT_CACHE_SIZE", 1024)
+            )
+
+        self.fragment_cache = fragment_cache
+
+        # storage for responses of API views with a cache_ttl
+        api_cache_size = app.config.get("NEONTOLOGY_API_CACHE_SIZE", 1024)
+
+        if api_cache is None:
+            api_cache = LRUCache(max_entries=api_cache_size)
+
+        self.api_cache = TaggedCache(api_cache, max_keys=api_cache_size)
+
+        # free up entries for changed labels straight away, other processes'
+        # entries are passed over as they're keyed on the labels' generations
+        self.changes.subscribe(lambda labels, _: self.api_cache.invalidate(*labels))
+
+        # locally served copies of third party scripts/styles (see vendor-assets)
+        self.assets = NeontologyAssets(
+            app.config.get(
+                "NEONTOLOGY_ASSETS_DIR", Path(app.instance_path, "neontology_assets")
+            )
+        )
+
         # register the blueprint (which will make template(s) available)
         app.register_blueprint(bp)
 
@@ -99,6 +177,7 @@ class NeontologyManager:
         # register neontology API views
         if api_views:
             self.api = {}
+            self.response_validators = {}
             for api_ver, api_ver_views in api_views.items():
                 # Initialize SpecTree
                 self.api[api_ver] = SpecTree(
@@ -109,11 +188,16 @@ class NeontologyManager:
                     mode="strict",
                     path="apidoc/" + api_ver,
                 )
+                self.response_validators[api_ver] = self.create_response_validator(
+                    app, api_ver
+                )
                 self.register_api_views(api_ver_views, api_ver, app)
                 self.api[api_ver].register(app)
 
         # set up jinja
 
+        app.add_template_filter(vendored_assets_filter, "neontology_assets")
+
         @app.template_filter()
         def neontology_to_string(obj: Any) -> Any:
             if isinstance(obj, Enum):
@@ -130,6 +214,7 @@ class NeontologyManager:
         app.cli.add_command(ingest)
         app.cli.add_command(freeze)
         app.cli.add_command(export)
+        app.cli.add_command(vendor_assets)
 
     def register_autograph(self, app: Flask, decorators: list) -> None:
         ag_view = autograph_view
@@ -139,6 +224,15 @@ class NeontologyManager:
 
         app.add_url_rule(AutographViewset.get_base_url(), view_func=ag_view)
 
+        for view_class in (
+            LabelListView,
+            LabelCreateEndpointView,
+            LabelEditEndpointView,
+            LabelCreateRelationshipEndpointView,
+            LabelView,
+        ):
+            view_class.build_render_plan()
+
         for node_class in self.nodes.values():
             viewset_data = AutographViewset(node_class)
 
@@ -157,6 +251,9 @@ class NeontologyManager:
             item_view = LabelView.as_view(
                 "AutoGraph" + viewset_data.item_view_name(), node_class
             )
+            table_data_view = LabelTableDataView.as_view(
+                "AutoGraph" + viewset_data.table_data_view_name(), node_class
+            )
 
             for decorator in decorators:
                 list_view = decorator(list_view)
@@ -164,6 +261,7 @@ class NeontologyManager:
                 edit_view = decorator(edit_view)
                 rel_create_view = decorator(rel_create_view)
                 item_view = decorator(item_view)
+                table_data_view = decorator(table_data_view)
 
             app.add_url_rule(viewset_data.list_url(), view_func=list_view)
 
@@ -182,11 +280,50 @@ class NeontologyManager:
 
             app.add_url_rule(viewset_data.item_url_pattern(), view_func=item_view)
 
+            app.add_url_rule(viewset_data.table_data_url(), view_func=table_data_view)
+
     def register_views(self, views: List[type[NeontologyView]], app: Flask) -> None:
         for view in views:
+            view.build_render_plan()
             new_view = view.as_view(view.view_name())
             app.add_url_rule(view.view_url_rule(), view_func=new_view)
 
+            self.check_order_indexes(view, app)
+
+            if (
+                issubclass(view, NeontologyListView)
+                and view.viewset_handler.server_side_table_threshold is not None
+            ):
+                self.register_table_data_view(view, app)
+
+    def check_order_indexes(self, view: type[NeontologyView], app: Flask) -> None:
+        """Warn when a view's nodes are ordered by properties without an index."""
+        if not view.viewset_handler.order_by:
+            return
+
+        viewset = view.get_viewset()
+
+        for field in viewset.unindexed_order_properties():
+            app.logger.warning(
+                f"{view.__name__} orders {viewset.model.__primarylabel__} nodes by "
+                f"'{field}', which has no index. Large lists will be slow to sort."
+            )
+
+    def register_table_data_view(
+        self, list_view: type[NeontologyListView], app: Flask
+    ) -> None:
+        """Add the JSON endpoint used by a list view's server side table."""
+        table_data_view = type(
+            f"{list_view.__name__}TableData",
+            (NeontologyTableDataView,),
+            {"viewset_handler": list_view.viewset_handler},
+        )
+
+        app.add_url_rule(
+            table_data_view.view_url_rule(),
+            view_func=table_data_view.as_view(table_data_view.view_name()),
+        )
+
     def register_api_views(
         self, api_views: List[type[NeontologyAPIView]], api_ver, app: Flask
     ) -> None:
@@ -203,6 +340,13 @@ class NeontologyManager:
             api_view._tag = tag
             api_view._api = self.api[api_ver]
 
+            for field in api_view.unindexed_query_properties():
+                app.logger.warning(
+                    f"{api_view.__name__} filters or sorts "
+                    f"{api_view.model.__primarylabel__} nodes by '{field}', which has "
+                    "no index. Queries on it will read every node."
+                )
+
             # Create decorated methods
             list_view = self._create_list_view(api_view, tag, api_ver)
             detail_view = self._create_detail_view(api_view, tag, api_ver)
@@ -224,13 +368,24 @@ class NeontologyManager:
                 methods=["GET"],
             )
 
+            # Registered for GET (?ids=) and POST (a JSON body of ids). Static
+            # segments take precedence over <pp>, so batch.json isn't a detail URL.
+            batch_response = api_view.batch_response_model()
+
+            for method in ("GET", "POST"):
+                app.add_url_rule(
+                    api_view.get_batch_endpoint(api_ver),
+                    view_func=self._create_batch_view(
+                        api_view, tag, api_ver, method, batch_response
+                    ),
+                    endpoint=f"{endpoint_base}_batch_{method.lower()}",
+                    methods=[method],
+                )
+
             # Register related resource endpoints
-            for relationship, (
-                related_model,
-                _,
-            ) in api_view.related_resources.items():
+            for relationship, related in api_view.related_resources.items():
                 related_view = self._create_related_view(
-                    api_view, relationship, related_model, tag, api_ver
+                    api_view, relationship, related[0], tag, api_ver
                 )
 
                 app.add_url_rule(
@@ -246,12 +401,21 @@ class NeontologyManager:
         """Create the list view function with proper decorators"""
 
         api = self.api[api_ver]
+        validator = self.response_validators[api_ver]
 
-        @api.validate(resp=Response(HTTP_200=List[view_class.model]), tags=[tag])
+        @api.validate(
+            query=view_class.query_model(ListQuery, include=True),
+            resp=validator.response(
+                HTTP_200=List[view_class.model], HTTP_304=None, HTTP_400=None
+            ),
+            after=self.api_after_hook(view_class, api_ver),
+            tags=[tag],
+        )
+        @self.api_response(view_class, api_ver)
         def list_view():
             f"""List all {view_class.resource_name}"""
             view_instance = view_class()
-            return view_instance.get(pp=None)
+            return current_app.ensure_sync(view_instance.get)(pp=None)
 
         list_view.__name__ = f"{view_class.resource_name}_list"
         list_view.__doc__ = f"Get all {view_class.resource_name}"
@@ -264,20 +428,67 @@ class NeontologyManager:
         """Create the detail view function with proper decorators"""
 
         api = self.api[api_ver]
+        validator = self.response_validators[api_ver]
 
         @api.validate(
-            resp=Response(HTTP_200=view_class.model, HTTP_404=None), tags=[tag]
+            query=view_class.query_model(FieldsQuery, include=True),
+            resp=validator.response(
+                HTTP_200=view_class.model, HTTP_304=None, HTTP_400=None, HTTP_404=None
+            ),
+            after=self.api_after_hook(view_class, api_ver),
+            tags=[tag],
         )
+        @self.api_response(view_class, api_ver, streams=False)
         def detail_view(pp):
             f"""Get {view_class.resource_name[:-1]} by ID"""
             view_instance = view_class()
-            return view_instance.get(pp=pp)
+            return current_app.ensure_sync(view_instance.get)(pp=pp)
 
         detail_view.__name__ = f"{view_class.resource_name}_detail"
         detail_view.__doc__ = f"Get {view_class.resource_name[:-1]} by ID"
 
         return detail_view
 
+    def _create_batch_view(
+        self,
+        view_class: type[NeontologyAPIView],
+        tag: Tag,
+        api_ver: str,
+        method: str,
+        response_model: type[BaseModel],
+    ) -> callable:
+        """Create the batch view function for GET or POST requests"""
+
+        api = self.api[api_ver]
+
+        if method == "POST":
+            validation = {
+                "query": view_class.query_model(FieldsQuery),
+                "json": BatchBody,
+            }
+        else:
+            validation = {"query": view_class.query_model(BatchQuery)}
+
+        validator = self.response_validators[api_ver]
+
+        @api.validate(
+            **validation,
+            resp=validator.response(
+                HTTP_200=response_model, HTTP_304=None, HTTP_400=None
+            ),
+            after=self.api_after_hook(view_class, api_ver),
+            tags=[tag],
+        )
+        @self.api_response(view_class, api_ver, streams=False, cache=False)
+        def batch_view():
+            view_instance = view_class()
+            return current_app.ensure_sync(view_instance.batch)()
+
+        batch_view.__name__ = f"{view_class.resource_name}_batch_{method.lower()}"
+        batch_view.__doc__ = f"Get many {view_class.resource_name} by ID"
+
+        return batch_view
+
     def _create_related_view(
         self,
         view_class: type[NeontologyAPIView],
@@ -289,14 +500,26 @@ class NeontologyManager:
         """Create a related resource view function with proper decorators"""
 
         api = self.api[api_ver]
+        validator = self.response_validators[api_ver]
 
         @api.validate(
-            resp=Response(HTTP_200=List[related_model], HTTP_404=None), tags=[tag]
+            query=view_class.query_model(FieldsQuery, related_model),
+            resp=validator.response(
+                HTTP_200=List[related_model],
+                HTTP_304=None,
+                HTTP_400=None,
+                HTTP_404=None,
+            ),
+            after=self.api_after_hook(view_class, api_ver),
+            tags=[tag],
         )
+        @self.api_response(view_class, api_ver, relationship)
         def related_view(pp: int):
             f"""Get {relationship} for {view_class.resource_name[:-1]}"""
             view_instance = view_class()
-            return view_instance.get(pp=pp, relationship=relationship)
+            return current_app.ensure_sync(view_instance.get)(
+                pp=pp, relationship=relationship
+            )
 
         related_view.__name__ = f"{view_class.resource_name}_{relationship}"
         related_view.__doc__ = (
@@ -305,6 +528,145 @@ class NeontologyManager:
 
         return related_view
 
+    def create_response_validator(self, app: Flask, api_ver: str) -> ResponseValidator:
+        """Create the response validator for an API version from the app config.
+
+        NEONTOLOGY_API_VALIDATION is a policy ("full", "sampled" or "docs"), or a
+        dict of policies by API version.
+        """
+        policy = app.config.get("NEONTOLOGY_API_VALIDATION", "full")
+
+        if isinstance(policy, dict):
+            policy = policy.get(api_ver, "full")
+
+        return ResponseValidator(
+            policy,
+            sample_rate=app.config.get("NEONTOLOGY_API_VALIDATION_SAMPLE_RATE", 100),
+            sample_items=app.config.get("NEONTOLOGY_API_VALIDATION_SAMPLE_ITEMS"),
+        )
+
+    def api_response(
+        self,
+        view_class: type[NeontologyAPIView],
+        api_ver: str,
+        relationship: Optional[str] = None,
+        streams: bool = True,
+        cache: bool = True,
+    ) -> callable:
+        """Decorate an API view function, inside spectree's validate decorator, to
+        answer from the API response cache and pick which responses spectree
+        checks against the response model.
+
+        Spectree validates every request, and responses following the API
+        version's validation policy. Streamed responses aren't validated, as that
+        reads all of a response into memory, and are handed to spectree as their
+        body so it doesn't read them either. Sparse fieldset and included resource
+        responses aren't validated, as they don't match the response model (the
+        view checks requested fields and includes itself), and cached responses
+        were validated before they were cached (by api_after_hook()).
+        """
+
+        def decorator(view_function: callable) -> callable:
+            @functools.wraps(view_function)
+            def view(**kwargs):
+                if streams and view_class.wants_stream(relationship):
+                    skip_response_validation()
+
+                    response = view_function(**kwargs)
+
+                    if response.is_streamed:
+                        return response.response, response.status_code, response.headers
+
+                    return response
+
+                if request.args.get("fields") or request.args.get("include"):
+                    skip_response_validation()
+
+                if cache and view_class.cache_ttl is not None:
+                    key = self.api_cache_key(
+                        api_ver, view_class, relationship, **kwargs
+                    )
+
+                    key += self.changes.generations(view_class.cache_labels())
+
+                    cached = self.cached_api_response(key)
+
+                    if cached is not None:
+                        skip_response_validation()
+
+                        return cached
+
+                    g.neontology_api_cache_key = key
+
+                return view_function(**kwargs)
+
+            return view
+
+        return decorator
+
+    def api_after_hook(
+        self, view_class: type[NeontologyAPIView], api_ver: str
+    ) -> callable:
+        """Spectree's after hook for an API view: time response validation, and
+        cache successful responses once they're validated."""
+        validator = self.response_validators[api_ver]
+
+        def after(req, resp, resp_validation_error, instance, model_adapter):
+            validator.after(req, resp, resp_validation_error, instance, model_adapter)
+
+            key = g.pop("neontology_api_cache_key", None)
+
+            if (
+                key is not None
+                and resp_validation_error is None
+                and resp.status_code == 200
+            ):
+                self.cache_api_response(key, resp, view_class)
+
+        return after
+
+    @staticmethod
+    def api_cache_key(
+        api_ver: str,
+        view_class: type[NeontologyAPIView],
+        relationship: Optional[str] = None,
+        pp: Optional[str] = None,
+    ) -> tuple:
+        """Key a cached API response on the request, with the query normalized."""
+        query = tuple(sorted(request.args.items(multi=True)))
+
+        return ("api", api_ver, view_class.resource_name, pp, relationship, query)
+
+    def cached_api_response(self, key: tuple) -> Optional[Any]:
+        """Rebuild a cached API response, or a 304 if the client has it."""
+        entry = self.api_cache.get(key)
+
+        if entry is None:
+            return None
+
+        body, headers, etag = entry
+
+        if is_not_modified(etag):
+            return not_modified_response(etag)
+
+        return current_app.response_class(body, headers=headers)
+
+    def cache_api_response(
+        self, key: tuple, response: Any, view_class: type[NeontologyAPIView]
+    ) -> None:
+        # timings are for the request which built the response
+        headers = [
+            (name, value)
+            for name, value in response.headers.items()
+            if name not in ("Content-Length", "Server-Timing")
+        ]
+
+        entry = (response.get_data(), headers, response.get_etag()[0])
+
+        self.api_cache.set(
+            key, entry, ttl=view_class.cache_ttl, tags=view_class.cache_labels()
+        )
+
     def get_graph(self) -> GraphConnection:
         if "neontology_gc" not in g:
             g.neontology_gc = GraphConnection()
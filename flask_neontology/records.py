@@ -0,0 +1,79 @@
+from typing import Any, Dict, Iterator, List, Optional
+
+from neo4j import Driver
+from neo4j.graph import Node
+from neo4j.time import Date, DateTime, Time
+from neontology import BaseNode, GraphConnection
+from neontology.graphengines import MemgraphEngine, Neo4jEngine
+
+
+def bolt_driver() -> Optional[Driver]:
+    """The graph engine's Bolt driver, None for engines without one (e.g. NetworkX).
+
+    Only Bolt engines (Neo4j, Memgraph) can return maps, such as node projections,
+    and have a result cursor to stream from.
+    """
+    engine = GraphConnection().engine
+
+    if isinstance(engine, (Neo4jEngine, MemgraphEngine)):
+        return engine.driver
+
+    return None
+
+
+def to_native(value: Any) -> Any:
+    """Convert the Bolt temporal types in a value (or a map or list of them) to
+    their native Python equivalents."""
+    if isinstance(value, (Date, DateTime, Time)):
+        return value.to_native()
+
+    if isinstance(value, dict):
+        return {key: to_native(item) for key, item in value.items()}
+
+    if isinstance(value, list):
+        return [to_native(item) for item in value]
+
+    return value
+
+
+def node_from_bolt(
+    node: Node, node_classes: dict[str, type[BaseNode]]
+) -> Optional[BaseNode]:
+    """Build a Bolt node's model, None unless exactly one of its labels is in
+    node_classes."""
+    labels = set(node.labels) & set(node_classes)
+
+    if len(labels) != 1:
+        return None
+
+    return node_classes[labels.pop()](**to_native(dict(node)))
+
+
+def iter_rows(
+    cypher: str, params: Optional[dict] = None, fetch_size: int = 1000
+) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a query as dicts of their columns, fetching them
+    fetch_size at a time.
+
+    Nodes are left as Bolt nodes (see node_from_bolt), other values are converted
+    with to_native.
+
+    Raises:
+        ValueError: If the graph engine doesn't have a Bolt driver
+    """
+    driver = bolt_driver()
+
+    if driver is None:
+        raise ValueError("Only Neo4j and Memgraph engines can return maps.")
+
+    with driver.session(fetch_size=fetch_size) as session:
+        for record in session.run(cypher, params or {}):
+            yield {
+                key: value if isinstance(value, Node) else to_native(value)
+                for key, value in record.items()
+            }
+
+
+def match_rows(cypher: str, params: Optional[dict] = None) -> List[Dict[str, Any]]:
+    """All the records of a query as dicts of their columns, as iter_rows."""
+    return list(iter_rows(cypher, params))
@@ -1,17 +1,32 @@
-from .apiview import NeontologyAPIView
+from .apiview import NeontologyAPIView, RelatedResource
+from .asyncview import (
+    AsyncGraphConnection,
+    AsyncNeontologyAPIView,
+    AsyncNeontologyListView,
+    AsyncNeontologyNodeView,
+    AsyncNeontologyView,
+)
 from .baseview import NeontologyView
 from .decorators import page_element, page_section
 from .endpoint import NeontologyEndpointView
 from .list import NeontologyListView
 from .node import NeontologyNodeView
+from .tabledata import NeontologyTableDataView
 from .viewset import NeontologyViewset
 
 __all__ = [
+    "AsyncGraphConnection",
+    "AsyncNeontologyAPIView",
+    "AsyncNeontologyListView",
+    "AsyncNeontologyNodeView",
+    "AsyncNeontologyView",
     "NeontologyAPIView",
     "NeontologyEndpointView",
     "NeontologyListView",
     "NeontologyNodeView",
+    "NeontologyTableDataView",
     "NeontologyViewset",
+    "RelatedResource",
     "page_element",
     "page_section",
     "NeontologyView",
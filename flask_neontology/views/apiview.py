@@ -1,11 +1,108 @@
+import hashlib
+import re
+import urllib.parse
 from abc import ABC
-from typing import Any, Dict, List, Optional, Type
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
-from flask import jsonify
+from flask import Response, current_app, request, stream_with_context
 from flask.views import MethodView
-from neontology import BaseNode
+from neontology import BaseNode, GraphConnection
+from pydantic import BaseModel, Field, create_model
+from pydantic_core import to_json
 from spectree import SpecTree, Tag
 
+from ..changes import get_change_tracker
+from ..records import bolt_driver, match_rows
+from .conditional import (
+    add_validators,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
+from .pagination import NodePage, match_node_page, property_value
+from .query import (
+    FILTER_OPERATORS,
+    filter_clause,
+    order_by_clause,
+    projection,
+    property_ref,
+    relationship_pattern,
+)
+from .streaming import (
+    NDJSON_MIMETYPE,
+    chunked,
+    iter_maps,
+    iter_nodes,
+    stream_json_array,
+    stream_ndjson,
+)
+from .viewset import indexed_properties
+
+# Query parameters which are never filters
+RESERVED_PARAMS = ("fields", "limit", "cursor", "sort")
+
+# Methods which fetch the list, applying any requested filters and sort order
+LIST_METHODS = ("get_all", "match_nodes", "get_page", "iter_all")
+
+
+class RelatedResource(NamedTuple):
+    """A related resource found by following one relationship type from the item.
+
+    Fetched in a single query, and can be embedded in list and detail responses
+    with ?include=.
+    """
+
+    model: Type[BaseNode]
+    relationship_type: str
+    # "out" (from the item to the related nodes), "in" or "both"
+    direction: str = "out"
+
+
+class FieldsQuery(BaseModel):
+    """Sparse fieldset parameter for API endpoints."""
+
+    fields: Optional[str] = Field(
+        default=None,
+        description="Comma separated properties to return, instead of all of them.",
+    )
+
+
+class BatchQuery(FieldsQuery):
+    """Parameters for API batch endpoints."""
+
+    ids: Optional[str] = Field(
+        default=None, description="Comma separated IDs of the items to return."
+    )
+
+
+class BatchBody(BaseModel):
+    """Request body for API batch endpoints."""
+
+    ids: List[Any] = Field(min_length=1, description="IDs of the items to return.")
+
+
+class ListQuery(FieldsQuery):
+    """Paging (and sparse fieldset) parameters for API list endpoints."""
+
+    limit: Optional[int] = Field(
+        default=None, ge=1, description="Maximum number of items to return."
+    )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Cursor from a previous response's Link header, for another page.",
+    )
+
 
 class NeontologyAPIView(MethodView, ABC):
     """
@@ -16,10 +113,18 @@ class NeontologyAPIView(MethodView, ABC):
         - resource_name: Name of the resource (e.g., 'users', 'posts')
         - tag_description: Description for API documentation grouping
 
-    Required methods to implement:
+    Methods to override to change which items are returned:
         - get_all(): Return all items from database
         - get_by_id(pp): Return single item by ID
 
+    Lists are fetched by get_all() (which calls match_nodes()), get_page() when
+    they're paged and iter_all() when they're streamed. If you override get_all()
+    or match_nodes(), override get_page() too, or paged list requests get a 400
+    response (and the view can't set page_size); streamed lists iterate over
+    get_all() unless iter_all() is overridden as well. Requested filters and sort
+    orders are only applied by the default methods, so views which override any
+    of them can't set filterable_fields or sortable_fields.
+
     Example:
         class UserAPI(APIClassView):
             model = User
@@ -39,9 +144,64 @@ class NeontologyAPIView(MethodView, ABC):
     tag_description: str = None
 
     # Optional: define related resources
-    # Format: {'relationship_name': (model, fetch_method_name)}
+    # Format: {'relationship_name': RelatedResource(model, relationship_type)}
+    # or {'relationship_name': (model, fetch_method_name)}
     related_resources: Dict[str, tuple] = {}
 
+    # Included in the ETag, bump this when a change to the view changes its output.
+    version: str = "1"
+
+    # List endpoints are paged when a limit or cursor is given, or by default
+    # when page_size is set. Limits are capped at max_page_size.
+    page_size: Optional[int] = None
+    max_page_size: int = 1000
+
+    # Send an X-Total-Count header (the number of nodes with the label) with pages
+    total_count: bool = True
+
+    # Maximum number of items requested at once from the batch endpoint
+    max_batch_size: int = 1000
+
+    # Properties list endpoints can be filtered by, e.g. ?status=active. Add an
+    # operator for other comparisons: ?status__in=active,pending, ?created__gte=...
+    # (gt, gte, lt, lte) or ?name__prefix=...
+    filterable_fields: Sequence[str] = ()
+
+    # Properties list endpoints can be sorted by, e.g. ?sort=-created,name
+    sortable_fields: Sequence[str] = ()
+
+    # Stream (unpaged) list and related responses as a chunked JSON array, rather
+    # than building the whole response in memory. Clients can also ask for a
+    # stream of newline delimited JSON with "Accept: application/x-ndjson".
+    # Streamed responses don't have an ETag.
+    stream: bool = False
+
+    # Number of records pulled from the graph at a time when streaming
+    stream_fetch_size: int = 1000
+
+    # Cache (unstreamed) list, detail and related responses for up to this many
+    # seconds. They're dropped sooner when nodes with the labels in cache_labels()
+    # are written through autograph, the TTL covers writes made elsewhere.
+    cache_ttl: Optional[float] = None
+
+    # Make ETags for list, detail and related responses from the request and the
+    # generations of cache_labels(), so requests with a matching If-None-Match get
+    # a 304 before the graph is queried. Only set this if every write to those
+    # labels is seen (made through the library, recorded with record_change, or
+    # picked up by the WatermarkWatcher), otherwise ETags are made from the data.
+    generation_etags: bool = False
+
+    # Encode items straight from their models to JSON with pydantic, rather than
+    # serializing them to dicts for the app's JSON provider. It's much faster for
+    # large lists, but changes the output: dates and times are ISO 8601 rather
+    # than HTTP dates, and properties are in model order rather than sorted. Set
+    # it for a new API version, so existing clients keep the old encoding. Has no
+    # effect if serialize_item is overridden.
+    model_json: bool = False
+
+    # Set by get() for the current request, when generation_etags is set
+    _etag: Optional[str] = None
+
     # Will be set by Manager when registering
     _api: SpecTree = None
     _tag: Tag = None
@@ -49,11 +209,31 @@ class NeontologyAPIView(MethodView, ABC):
     def match_nodes(
         self, limit: Optional[int] = None, skip: Optional[int] = None
     ) -> list[BaseNode]:
-        """Match the full set of nodes for this view."""
+        """Match the full set of nodes for this view (after any requested filters,
+        in any requested order)."""
         if self.model is None:
             raise ValueError("Model not defined.")
 
-        return self.model.match_nodes(limit=limit, skip=skip)
+        if not self.get_filters() and not self.get_sort():
+            return self.model.match_nodes(limit=limit, skip=skip)
+
+        cypher, params = self.list_query("n")
+
+        if skip:
+            cypher += " SKIP $skip"
+            params["skip"] = skip
+
+        if limit is not None:
+            cypher += " LIMIT $limit"
+            params["limit"] = limit
+
+        return (
+            GraphConnection()
+            .evaluate_query(
+                cypher, params, node_classes={self.model.__primarylabel__: self.model}
+            )
+            .nodes
+        )
 
     def match_node(self, pp: str) -> Optional[BaseNode]:
         """Return a single node based on the provided primary property value."""
@@ -75,6 +255,174 @@ class NeontologyAPIView(MethodView, ABC):
             raise ValueError(
                 f"{cls.__name__} must define 'tag_description' class attribute"
             )
+        for field in [*cls.filterable_fields, *cls.sortable_fields]:
+            if field not in cls.model.model_fields:
+                raise ValueError(
+                    f"{cls.__name__} can't filter or sort by unknown property: {field}"
+                )
+        if (cls.filterable_fields or cls.sortable_fields) and cls.overrides(
+            *LIST_METHODS
+        ):
+            raise ValueError(
+                f"{cls.__name__} can't filter or sort its list, as filters and sort "
+                f"orders are only applied by the default {', '.join(LIST_METHODS)}"
+            )
+        if cls.page_size is not None and not cls.pages_list():
+            raise ValueError(
+                f"{cls.__name__} must override get_page() along with get_all(), "
+                "as its list is paged"
+            )
+
+    @classmethod
+    def unindexed_query_properties(cls) -> List[str]:
+        """Filterable and sortable properties which don't have an index in the graph.
+        Returns an empty list if the graph's indexes can't be checked.
+        """
+        fields = list(dict.fromkeys([*cls.filterable_fields, *cls.sortable_fields]))
+
+        if not fields:
+            return []
+
+        indexed = indexed_properties(cls.model.__primarylabel__)
+
+        if indexed is None:
+            return []
+
+        return [field for field in fields if field not in indexed]
+
+    def get_filters(self) -> List[tuple[str, str, Any]]:
+        """
+        The requested filters, as (property, operator, value) triples.
+
+        Raises:
+            ValueError: If a filter is on a property which isn't filterable, or
+                has an unknown operator or invalid value
+        """
+        filters = []
+
+        for key, value in request.args.items(multi=True):
+            if key in RESERVED_PARAMS:
+                continue
+
+            field, _, operator = key.partition("__")
+
+            if field not in self.filterable_fields:
+                if field in self.model.model_fields:
+                    raise ValueError(f"Can't filter by '{field}'.")
+
+                # not a filter
+                continue
+
+            operator = operator or "eq"
+
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(f"Unknown filter operator: '{operator}'.")
+
+            try:
+                if operator == "in":
+                    value = [
+                        property_value(self.model, field, item)
+                        for item in value.split(",")
+                    ]
+                elif operator != "prefix":
+                    value = property_value(self.model, field, value)
+            except ValueError as exc:
+                raise ValueError(f"Invalid value for '{key}'.") from exc
+
+            filters.append((field, operator, value))
+
+        return filters
+
+    def get_sort(self) -> List[tuple[str, str]]:
+        """
+        The requested order (?sort=-created,name) as (property, "asc"|"desc")
+        pairs, empty if none was requested.
+
+        Raises:
+            ValueError: If a property isn't sortable
+        """
+        requested = request.args.get("sort")
+
+        if not requested:
+            return []
+
+        order = []
+
+        for key in requested.split(","):
+            key = key.strip()
+            field = key.lstrip("-")
+
+            if not field:
+                continue
+
+            if field not in self.sortable_fields:
+                raise ValueError(f"Can't sort by '{field}'.")
+
+            order.append((field, "desc" if key.startswith("-") else "asc"))
+
+        return order
+
+    def filter_condition(self) -> tuple[Optional[str], dict]:
+        """A WHERE condition for the requested filters (None if there aren't
+        any), with its query parameters."""
+        filters = self.get_filters()
+
+        condition = filter_clause([(field, operator) for field, operator, _ in filters])
+
+        params = {
+            f"filter_{index}": value for index, (_, _, value) in enumerate(filters)
+        }
+
+        return condition, params
+
+    def list_query(self, returns: str) -> tuple[str, dict]:
+        """
+        Build a query for the listed nodes, n, after any requested filters and
+        in any requested order.
+
+        Args:
+            returns: What to return for each node, e.g. "n" or a projection
+
+        Returns:
+            The Cypher query and its parameters
+        """
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        condition, params = self.filter_condition()
+
+        cypher = f"MATCH (n:{self.model.__primarylabel__})"
+
+        if condition is not None:
+            cypher += f" WHERE {condition}"
+
+        cypher += f" RETURN {returns}"
+
+        order = self.get_sort()
+
+        if order:
+            cypher += f" {order_by_clause(order)}"
+
+        return cypher, params
+
+    def count_items(self) -> int:
+        """The number of listed nodes, after any requested filters."""
+        condition, params = self.filter_condition()
+
+        if condition is None:
+            return self.model.get_count()
+
+        return GraphConnection().evaluate_query_single(
+            f"MATCH (n:{self.model.__primarylabel__}) WHERE {condition} "
+            "RETURN count(n)",
+            params,
+        )
+
+    @classmethod
+    def pages_list(cls) -> bool:
+        """Whether get_page() pages through the items get_all() lists, i.e. neither
+        or both are overridden."""
+        return cls.overrides("get_page") or not cls.overrides("get_all", "match_nodes")
 
     def get_all(self) -> List[Any]:
         """
@@ -85,6 +433,143 @@ class NeontologyAPIView(MethodView, ABC):
         """
         return self.match_nodes()
 
+    def iter_all(self) -> Iterator[Any]:
+        """
+        Iterate over all items, for streamed responses.
+        Override this along with get_all() to stream the items as they're fetched,
+        otherwise the items get_all() returns are streamed.
+
+        Returns:
+            Iterator of items, fetched from the graph stream_fetch_size at a time
+        """
+        if self.overrides("get_all", "match_nodes"):
+            return iter(self.get_all())
+
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        cypher, params = self.list_query("n")
+
+        return iter_nodes(
+            cypher,
+            params,
+            node_classes={self.model.__primarylabel__: self.model},
+            fetch_size=self.stream_fetch_size,
+        )
+
+    def iter_fields(self, fields: List[str]) -> Iterator[dict]:
+        """
+        Iterate over the given properties of all nodes, for streamed responses.
+
+        Args:
+            fields: Properties to return
+
+        Returns:
+            Iterator of dicts, fetched from the graph stream_fetch_size at a time
+        """
+        cypher, params = self.list_query(projection(fields))
+
+        return iter_maps(cypher, params, fetch_size=self.stream_fetch_size)
+
+    def match_fields(self, fields: List[str], pp: Optional[Any] = None) -> List[dict]:
+        """
+        Match only the given properties of all listed nodes (or of the node
+        with primary property pp), without building models.
+
+        Args:
+            fields: Properties to return
+            pp: Primary property value of a single node to match
+
+        Returns:
+            List of dicts of the properties
+        """
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        if pp is None:
+            cypher, params = self.list_query(projection(fields))
+        else:
+            cypher = (
+                f"MATCH (n:{self.model.__primarylabel__})"
+                f" WHERE {property_ref(self.model.__primaryproperty__)} = $pp"
+                f" RETURN {projection(fields)}"
+            )
+            params = {"pp": pp}
+
+        return list(iter_maps(cypher, params))
+
+    def get_paging(self) -> Optional[tuple[int, Optional[str]]]:
+        """The requested page size and cursor, None if the list isn't paged."""
+        limit = request.args.get("limit", type=int)
+        cursor = request.args.get("cursor") or None
+
+        if limit is None and cursor is None:
+            if self.page_size is None:
+                return None
+
+            limit = self.page_size
+
+        if limit is None or limit < 1:
+            limit = self.page_size or self.max_page_size
+
+        return min(limit, self.max_page_size), cursor
+
+    def get_page(self, limit: int, cursor: Optional[str] = None) -> NodePage:
+        """
+        Fetch one page of items (after any requested filters), in the requested
+        order then by primary property.
+        Override this along with get_all() to change which items are listed (and
+        count_items(), for the X-Total-Count header).
+
+        Args:
+            limit: Maximum number of items on the page
+            cursor: Cursor from the previous page, None for the first page
+
+        Raises:
+            ValueError: If the cursor is invalid
+
+        Returns:
+            The page of items, with cursors for the pages either side
+        """
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        condition, params = self.filter_condition()
+
+        return match_node_page(
+            self.model,
+            self.page_order(),
+            cursor,
+            limit,
+            where=condition,
+            where_params=params,
+        )
+
+    def match_fields_page(
+        self, fields: List[str], limit: int, cursor: Optional[str] = None
+    ) -> NodePage:
+        """As get_page, but only matching the given properties of each node."""
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        condition, params = self.filter_condition()
+
+        return match_node_page(
+            self.model, self.page_order(), cursor, limit, fields, condition, params
+        )
+
+    def page_order(self) -> List[tuple[str, str]]:
+        """The (property, "asc"|"desc") pairs pages are ordered by: the requested
+        order, then the primary property so that every node has a position."""
+        order = self.get_sort()
+
+        pp = self.model.__primaryproperty__
+
+        if pp not in [field for field, _ in order]:
+            order.append((pp, "asc"))
+
+        return order
+
     def get_by_id(self, pp: Any) -> Optional[Any]:
         """
         Fetch a single item by ID from the database.
@@ -97,6 +582,116 @@ class NeontologyAPIView(MethodView, ABC):
         """
         return self.match_node(pp)
 
+    def get_batch_ids(self) -> List[Any]:
+        """
+        The primary property values requested from the batch endpoint, from
+        ?ids=a,b or a JSON body of {"ids": ["a", "b"]}.
+
+        Raises:
+            ValueError: If there are none, too many, or any are invalid
+        """
+        if request.method == "POST":
+            body = request.get_json(silent=True)
+
+            ids = body.get("ids") if isinstance(body, dict) else None
+
+            if not isinstance(ids, list):
+                raise ValueError('Expected a JSON body of {"ids": [...]}.')
+
+        else:
+            ids = [pp for pp in request.args.get("ids", "").split(",") if pp]
+
+        if not ids:
+            raise ValueError("No ids given.")
+
+        if len(ids) > self.max_batch_size:
+            raise ValueError(f"Too many ids, the maximum is {self.max_batch_size}.")
+
+        pp_name = self.model.__primaryproperty__
+
+        try:
+            return [property_value(self.model, pp_name, pp) for pp in ids]
+        except ValueError as exc:
+            raise ValueError("Invalid ids.") from exc
+
+    def get_batch(
+        self, pps: List[Any], fields: Optional[List[str]] = None
+    ) -> List[Optional[Any]]:
+        """
+        Fetch many items by ID, in a single query unless get_by_id is overridden.
+
+        Args:
+            pps: The IDs of the items to fetch
+            fields: Only match these properties, where possible
+
+        Returns:
+            The items in the same order as pps, None for any not found
+        """
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        if self.overrides("get_by_id", "match_node"):
+            return [self.get_by_id(pp) for pp in pps]
+
+        label = self.model.__primarylabel__
+        pp_name = self.model.__primaryproperty__
+
+        cypher = (
+            f"UNWIND $pps AS pp MATCH (n:{label}) WHERE {property_ref(pp_name)} = pp"
+        )
+        params = {"pps": list(dict.fromkeys(pps))}
+
+        gc = GraphConnection()
+
+        if fields is not None and self.projects_fields():
+            cypher += (
+                f" RETURN {projection(fields)} AS item, {projection([pp_name])} AS keys"
+            )
+
+            found = {
+                record["keys"][pp_name]: record["item"]
+                for record in match_rows(cypher, params)
+            }
+
+        else:
+            nodes = gc.evaluate_query(
+                cypher + " RETURN n", params, node_classes={label: self.model}
+            ).nodes
+
+            found = {node.get_pp(): node for node in nodes}
+
+        return [found.get(pp) for pp in pps]
+
+    def batch(self):
+        """
+        Handle GET and POST requests for the batch endpoint.
+        This method is automatically decorated by the Manager.
+        """
+        try:
+            fields = self.get_fields()
+            pps = self.get_batch_ids()
+        except ValueError as exc:
+            return {"error": str(exc)}, 400
+
+        return self.make_batch_response(pps, self.get_batch(pps, fields), fields)
+
+    def make_batch_response(
+        self,
+        pps: List[Any],
+        items: List[Optional[Any]],
+        fields: Optional[List[str]] = None,
+    ) -> Response:
+        """Return batch items (null where not found) and the IDs not found as JSON."""
+        data = {
+            "items": [
+                None if item is None else self.prepare_item(item, fields)
+                for item in items
+            ],
+            "not_found": [pp for pp, item in zip(pps, items) if item is None],
+        }
+
+        return self.make_json_response(self.dump_json(data))
+
     def get_related(self, pp: Any, relationship: str) -> List[Any]:
         """
         Fetch related items for a given ID and relationship.
@@ -115,11 +710,204 @@ class NeontologyAPIView(MethodView, ABC):
             method = getattr(self, method_name)
             return method(pp)
 
+        if isinstance(self.related_resources.get(relationship), RelatedResource):
+            return self.match_related(pp, relationship) or []
+
         raise NotImplementedError(
             f"Related resource '{relationship}' not implemented. "
             f"Define '{method_name}(self, pp)' method or override get_related()"
         )
 
+    def uses_related_query(self, relationship: str) -> bool:
+        """Whether a related resource (and its parent) can be fetched in one query,
+        i.e. it's a RelatedResource and isn't fetched by an overridden method."""
+        method_name = f"get_related_{relationship.replace('-', '_')}"
+
+        return (
+            isinstance(self.related_resources.get(relationship), RelatedResource)
+            and not hasattr(self, method_name)
+            and not self.overrides("get_related", "get_by_id", "match_node")
+        )
+
+    def match_related(
+        self, pp: Any, relationship: str, fields: Optional[List[str]] = None
+    ) -> Optional[List[Any]]:
+        """
+        Match an item and its related nodes in one query.
+
+        Args:
+            pp: The ID of the parent item
+            relationship: Name of a RelatedResource in related_resources
+            fields: Only match these properties of the related nodes
+
+        Returns:
+            The related nodes (or dicts of their properties), None if the parent
+            item wasn't found
+        """
+        related = self.related_resources[relationship]
+
+        pattern = relationship_pattern(
+            related.relationship_type,
+            related.direction,
+            target_label=related.model.__primarylabel__,
+        )
+
+        cypher = (
+            f"MATCH (p:{self.model.__primarylabel__})"
+            f" WHERE {property_ref(self.model.__primaryproperty__, 'p')} = $pp"
+            f" OPTIONAL MATCH {pattern}"
+        )
+
+        # no rows at all if the parent is missing, a null n if it has no related nodes
+        if fields is not None:
+            rows = match_rows(f"{cypher} RETURN {projection(fields)} AS n", {"pp": pp})
+
+            if not rows:
+                return None
+
+            return [row["n"] for row in rows if row["n"] is not None]
+
+        records = (
+            GraphConnection()
+            .evaluate_query(
+                cypher + " RETURN p, n",
+                {"pp": pp},
+                node_classes={
+                    self.model.__primarylabel__: self.model,
+                    related.model.__primarylabel__: related.model,
+                },
+            )
+            .records
+        )
+
+        if not records:
+            return None
+
+        return [record["nodes"]["n"] for record in records if "n" in record["nodes"]]
+
+    def get_related_items(
+        self, pp: Any, relationship: str, fields: Optional[List[str]] = None
+    ) -> Optional[Iterable[Any]]:
+        """
+        Fetch the related items for a related resource endpoint.
+
+        Returns:
+            The related items, None if the parent item wasn't found
+        """
+        if self.uses_related_query(relationship):
+            if not self.projects_fields():
+                fields = None
+
+            return self.match_related(pp, relationship, fields)
+
+        if self.get_by_id(pp) is None:
+            return None
+
+        return self.get_related(pp, relationship)
+
+    def get_includes(self) -> List[str]:
+        """
+        The related resources requested with ?include= to embed in each item.
+
+        Raises:
+            ValueError: If a related resource can't be included
+        """
+        requested = request.args.get("include")
+
+        if not requested:
+            return []
+
+        includes = [name.strip() for name in requested.split(",") if name.strip()]
+
+        for name in includes:
+            if not isinstance(self.related_resources.get(name), RelatedResource):
+                raise ValueError(f"Can't include '{name}'.")
+
+        return list(dict.fromkeys(includes))
+
+    def match_included(self, pps: List[Any], relationship: str) -> Dict[Any, list]:
+        """
+        Match the related nodes of many items in one query.
+
+        Args:
+            pps: The IDs of the items
+            relationship: Name of a RelatedResource in related_resources
+
+        Returns:
+            Lists of related nodes, keyed by the ID of their item
+        """
+        related = self.related_resources[relationship]
+
+        pp_name = self.model.__primaryproperty__
+
+        pattern = relationship_pattern(
+            related.relationship_type,
+            related.direction,
+            target_label=related.model.__primarylabel__,
+        )
+
+        cypher = (
+            f"UNWIND $pps AS pp MATCH (p:{self.model.__primarylabel__})"
+            f" WHERE {property_ref(pp_name, 'p')} = pp"
+            f" MATCH {pattern}"
+            " RETURN p, n"
+        )
+
+        records = (
+            GraphConnection()
+            .evaluate_query(
+                cypher,
+                {"pps": list(dict.fromkeys(pps))},
+                node_classes={
+                    self.model.__primarylabel__: self.model,
+                    related.model.__primarylabel__: related.model,
+                },
+            )
+            .records
+        )
+
+        included: Dict[Any, list] = {}
+
+        for record in records:
+            nodes = record["nodes"]
+
+            if "p" in nodes and "n" in nodes:
+                included.setdefault(nodes["p"].get_pp(), []).append(nodes["n"])
+
+        return included
+
+    def embed_included(
+        self, items: List[Any], includes: List[str], fields: Optional[List[str]] = None
+    ) -> List[dict]:
+        """Serialize items with their included related resources embedded, fetching
+        each related resource for all of the items at once."""
+        pp_name = self.model.__primaryproperty__
+
+        pps = [
+            item[pp_name] if isinstance(item, dict) else getattr(item, pp_name)
+            for item in items
+        ]
+
+        data = []
+
+        for item in items:
+            prepared = self.prepare_item(item, fields)
+
+            if isinstance(prepared, BaseModel):
+                prepared = prepared.model_dump()
+
+            data.append(prepared)
+
+        for relationship in includes:
+            included = self.match_included(pps, relationship)
+
+            for pp, entry in zip(pps, data):
+                entry[relationship] = [
+                    self.prepare_item(node) for node in included.get(pp, [])
+                ]
+
+        return data
+
     def serialize_item(self, item: BaseNode) -> dict:
         """
         Serialize a single item. Override if custom serialization needed.
@@ -133,38 +921,536 @@ class NeontologyAPIView(MethodView, ABC):
 
         return item.model_dump()
 
+    def uses_default_serialization(self) -> bool:
+        """Whether items are serialized as-is, i.e. serialize_item isn't overridden."""
+        return type(self).serialize_item is NeontologyAPIView.serialize_item
+
+    @classmethod
+    def overrides(cls, *method_names: str) -> bool:
+        """Whether the view overrides any of the given methods."""
+        return any(
+            getattr(cls, name) is not getattr(NeontologyAPIView, name)
+            for name in method_names
+        )
+
+    def projects_fields(self, *method_names: str) -> bool:
+        """
+        Whether requested fields can be matched in the graph query, rather than
+        selected from full items. Only if serialize_item and the given methods
+        (which fetch the items) aren't overridden, and the graph engine can
+        return maps (see records.bolt_driver).
+        """
+        if self.overrides("serialize_item", *method_names):
+            return False
+
+        return bolt_driver() is not None
+
+    def get_fields(self, model: Optional[Type[BaseNode]] = None) -> Optional[List[str]]:
+        """
+        The properties requested with ?fields=, None for all of them.
+
+        Args:
+            model: The model being returned, defaults to self.model
+
+        Raises:
+            ValueError: If a requested field isn't a property of the model
+        """
+        requested = request.args.get("fields")
+
+        if not requested:
+            return None
+
+        if model is None:
+            model = self.model
+
+        fields = [field.strip() for field in requested.split(",") if field.strip()]
+
+        unknown = [field for field in fields if field not in model.model_fields]
+
+        if unknown:
+            raise ValueError(f"Unknown field(s): {', '.join(unknown)}")
+
+        return list(dict.fromkeys(fields))
+
+    def select_fields(self, item: Any, fields: List[str]) -> dict:
+        """Serialize an item, keeping only the requested fields."""
+        if isinstance(item, dict):
+            # already projected in the graph query
+            return item
+
+        if self.uses_default_serialization():
+            data = item.model_dump(include=set(fields))
+        else:
+            data = self.serialize_item(item)
+
+        return {field: data[field] for field in fields if field in data}
+
+    def encodes_models(self) -> bool:
+        """Whether items are encoded straight from their models by pydantic, i.e.
+        model_json is set and serialize_item isn't overridden."""
+        return self.model_json is True and self.uses_default_serialization()
+
+    def dump_json(self, data: Any) -> bytes:
+        """Encode serialized data (or models, see model_json) as JSON."""
+        if self.encodes_models():
+            # straight from models to JSON, without building dicts first
+            return to_json(data)
+
+        return current_app.json.dumps(data).encode("utf-8")
+
+    def prepare_item(self, item: Any, fields: Optional[List[str]] = None) -> Any:
+        """Serialize an item for dump_json (models are left for pydantic to encode
+        with model_json)."""
+        if fields is not None:
+            return self.select_fields(item, fields)
+
+        if not self.encodes_models():
+            return self.serialize_item(item)
+
+        return item
+
+    def encode_item(
+        self,
+        item: Any,
+        fields: Optional[List[str]] = None,
+        includes: Sequence[str] = (),
+    ) -> bytes:
+        """Serialize a single item to JSON."""
+        if includes:
+            return self.dump_json(
+                self.embed_included([item], list(includes), fields)[0]
+            )
+
+        return self.dump_json(self.prepare_item(item, fields))
+
+    def encode_items(
+        self,
+        items: Iterable[Any],
+        fields: Optional[List[str]] = None,
+        includes: Sequence[str] = (),
+    ) -> bytes:
+        """Serialize items to a JSON array."""
+        if includes:
+            return self.dump_json(
+                self.embed_included(list(items), list(includes), fields)
+            )
+
+        return self.dump_json([self.prepare_item(item, fields) for item in items])
+
+    def get_etag(self, data: Any) -> str:
+        """Generate an ETag from the serialized data behind a response."""
+        view_class = type(self)
+
+        return make_etag(
+            f"{view_class.__module__}.{view_class.__qualname__}", self.version, data
+        )
+
+    def generation_etag(
+        self, pp: Optional[Any] = None, relationship: Optional[str] = None
+    ) -> Optional[str]:
+        """An ETag for the current request from the generations of cache_labels(),
+        None unless generation_etags is set (and there's a change tracker), or if
+        the response is streamed (streamed responses don't have ETags)."""
+        changes = get_change_tracker()
+
+        if self.generation_etags is not True or changes is None:
+            return None
+
+        if (pp is None or relationship is not None) and self.wants_stream(relationship):
+            return None
+
+        return self.get_etag(
+            [
+                request.path,
+                sorted(request.args.items(multi=True)),
+                changes.generations(self.cache_labels()),
+            ]
+        )
+
+    def make_json_response(self, data: Any) -> Response:
+        """Return data (or encoded JSON) as JSON, or a 304 if the client has it."""
+        if isinstance(data, bytes):
+            body = data
+        else:
+            body = current_app.json.dumps(data).encode("utf-8")
+
+        # taken before the data was fetched, so it's never newer than the data
+        etag = self._etag or self.get_etag(hashlib.sha1(body).hexdigest())
+
+        if is_not_modified(etag):
+            return not_modified_response(etag)
+
+        response = current_app.response_class(body, mimetype="application/json")
+
+        return add_validators(response, etag)
+
+    @classmethod
+    def cache_labels(cls) -> Tuple[str, ...]:
+        """Labels of the nodes the view's responses are made from, so cached
+        responses can be dropped when one of them is written.
+
+        They're sorted, as their generations are part of cache keys which must
+        be the same in every process.
+        """
+        labels = {cls.model.__primarylabel__}
+
+        for related in cls.related_resources.values():
+            labels.add(related[0].__primarylabel__)
+
+        return tuple(sorted(labels))
+
+    @classmethod
+    def wants_stream(cls, relationship: Optional[str] = None) -> bool:
+        """Whether the current list (or related) request should be streamed."""
+        if relationship is None:
+            # paged lists are small enough to send in one go
+            if cls.page_size is not None or request.args.keys() & {"limit", "cursor"}:
+                return False
+
+        return cls.stream is True or cls.accepts_ndjson()
+
+    @staticmethod
+    def accepts_ndjson() -> bool:
+        accepted = request.accept_mimetypes.best_match(
+            ["application/json", NDJSON_MIMETYPE]
+        )
+
+        return accepted == NDJSON_MIMETYPE
+
+    def make_stream_response(
+        self,
+        items: Iterable[Any],
+        fields: Optional[List[str]] = None,
+        includes: Sequence[str] = (),
+    ) -> Response:
+        """Stream items as a JSON array (or NDJSON), serializing one at a time."""
+
+        if includes:
+            # included resources are fetched for stream_fetch_size items at a time
+            items = (
+                entry
+                for chunk in chunked(items, self.stream_fetch_size)
+                for entry in self.embed_included(chunk, list(includes), fields)
+            )
+
+            def encode(item: Any) -> str:
+                return self.dump_json(item).decode("utf-8")
+
+        else:
+
+            def encode(item: Any) -> str:
+                return self.encode_item(item, fields).decode("utf-8")
+
+        if self.accepts_ndjson():
+            body = stream_ndjson(items, encode)
+            mimetype = NDJSON_MIMETYPE
+        else:
+            body = stream_json_array(items, encode)
+            mimetype = "application/json"
+
+        return current_app.response_class(stream_with_context(body), mimetype=mimetype)
+
+    def page_url(self, limit: int, cursor: Optional[str] = None) -> str:
+        """The URL of a page of the list endpoint, keeping other query parameters."""
+        args = [
+            (k, v)
+            for k, v in request.args.items(multi=True)
+            if k not in ("limit", "cursor")
+        ]
+
+        args.append(("limit", str(limit)))
+
+        if cursor is not None:
+            args.append(("cursor", cursor))
+
+        return f"{request.base_url}?{urllib.parse.urlencode(args)}"
+
+    def make_page_response(
+        self,
+        page: NodePage,
+        limit: int,
+        fields: Optional[List[str]] = None,
+        includes: Sequence[str] = (),
+    ) -> Response:
+        """Return a page of items as JSON, with Link (and X-Total-Count) headers."""
+        response = self.make_json_response(
+            self.encode_items(page.nodes, fields, includes)
+        )
+
+        links = [f'<{self.page_url(limit)}>; rel="first"']
+
+        if page.prev_cursor:
+            links.append(f'<{self.page_url(limit, page.prev_cursor)}>; rel="prev"')
+
+        if page.next_cursor:
+            links.append(f'<{self.page_url(limit, page.next_cursor)}>; rel="next"')
+
+        response.headers["Link"] = ", ".join(links)
+
+        if self.total_count is True and self.model is not None:
+            response.headers["X-Total-Count"] = str(self.count_items())
+
+        return response
+
     def get(self, pp: Optional[Any] = None, relationship: Optional[str] = None):
         """
         Handle GET requests for list, detail, or related resource views.
         This method is automatically decorated by the Manager.
         """
-        if pp is not None:
-            if relationship is not None:
-                # Related resource view (e.g., /api/users/1/posts)
-                parent_item = self.get_by_id(pp)
-                if parent_item is None:
-                    return {
-                        "error": f"{self.resource_name[:-1].title()} not found"
-                    }, 404
+        try:
+            fields, includes = self.get_query_options(pp, relationship)
+        except ValueError as exc:
+            return {"error": str(exc)}, 400
+
+        self._etag = self.generation_etag(pp, relationship)
+
+        if self._etag is not None and is_not_modified(self._etag):
+            return not_modified_response(self._etag)
+
+        if pp is None:
+            return self.list_response(fields, includes)
+
+        if relationship is None:
+            return self.detail_response(pp, fields, includes)
+
+        # Related resource view (e.g., /api/users/1/posts)
+        return self.make_related_response(
+            self.get_related_items(pp, relationship, fields), relationship, fields
+        )
+
+    def list_response(
+        self, fields: Optional[List[str]] = None, includes: Sequence[str] = ()
+    ):
+        """Fetch the items for the list view, and return them (or a page of them)."""
+        paging = self.get_paging()
+
+        if paging is not None:
+            try:
+                page = self.get_items_page(fields, *paging)
+            except ValueError:
+                return {"error": "Invalid cursor"}, 400
+
+            return self.make_page_response(page, paging[0], fields, includes)
+
+        if self.wants_stream():
+            # items are fetched as the response is sent
+            return self.make_stream_response(self.iter_items(fields), fields, includes)
+
+        items = self.get_items(fields)
+
+        return self.make_json_response(self.encode_items(items, fields, includes))
+
+    def detail_response(
+        self, pp: Any, fields: Optional[List[str]] = None, includes: Sequence[str] = ()
+    ):
+        """Fetch the item for the detail view, and return it."""
+        item = self.get_item(pp, fields)
+
+        if item is None:
+            return self.not_found_response()
+
+        # included resources are fetched while encoding
+        return self.make_json_response(self.encode_item(item, fields, includes))
+
+    def make_related_response(
+        self,
+        related_items: Optional[Iterable[Any]],
+        relationship: str,
+        fields: Optional[List[str]] = None,
+    ):
+        """Return the related items for a related resource view, a 404 if they're
+        None (the parent item wasn't found)."""
+        if related_items is None:
+            return self.not_found_response()
 
-                related_items = self.get_related(pp, relationship)
+        if self.wants_stream(relationship):
+            return self.make_stream_response(related_items, fields)
 
-                return (
-                    jsonify([self.serialize_item(item) for item in related_items]),
-                    200,
+        return self.make_json_response(self.encode_items(related_items, fields))
+
+    def not_found_response(self):
+        return {"error": f"{self.resource_name[:-1].title()} not found"}, 404
+
+    def get_query_options(
+        self, pp: Optional[Any] = None, relationship: Optional[str] = None
+    ) -> tuple[Optional[List[str]], List[str]]:
+        """
+        Check the query parameters for an endpoint, returning the requested
+        fields and included related resources.
+
+        Raises:
+            ValueError: If any of the query parameters are invalid
+        """
+        fields = self.get_fields(self.get_response_model(relationship))
+
+        if relationship is not None:
+            return fields, []
+
+        if pp is None:
+            # checked up front, they're used where the items are fetched
+            self.get_filters()
+            self.get_sort()
+
+            if self.get_paging() is not None and not self.pages_list():
+                raise ValueError("This list can't be paged.")
+
+        includes = self.get_includes()
+
+        pp_name = self.model.__primaryproperty__
+
+        # included resources are matched up with their items by ID
+        if includes and fields is not None and pp_name not in fields:
+            fields.append(pp_name)
+
+        return fields, includes
+
+    def get_item(self, pp: Any, fields: Optional[List[str]] = None) -> Optional[Any]:
+        """Get a single item, matching only the requested fields where possible."""
+        if fields is not None and self.projects_fields("get_by_id", "match_node"):
+            matches = self.match_fields(fields, pp=pp)
+            return matches[0] if matches else None
+
+        return self.get_by_id(pp)
+
+    def get_items(self, fields: Optional[List[str]] = None) -> List[Any]:
+        """Get all items, matching only the requested fields where possible."""
+        if fields is not None and self.projects_fields("get_all", "match_nodes"):
+            return self.match_fields(fields)
+
+        return self.get_all()
+
+    def get_items_page(
+        self, fields: Optional[List[str]], limit: int, cursor: Optional[str] = None
+    ) -> NodePage:
+        """Get a page of items, matching only the requested fields where possible."""
+        if fields is not None and self.projects_fields("get_page"):
+            return self.match_fields_page(fields, limit, cursor)
+
+        return self.get_page(limit, cursor)
+
+    def iter_items(self, fields: Optional[List[str]] = None) -> Iterator[Any]:
+        """Iterate over all items, matching only the requested fields where possible."""
+        if fields is not None and self.projects_fields(
+            "iter_all", "get_all", "match_nodes"
+        ):
+            return self.iter_fields(fields)
+
+        return self.iter_all()
+
+    def get_response_model(self, relationship: Optional[str] = None) -> Type[BaseNode]:
+        """The model of the items returned by an endpoint."""
+        if relationship is not None and relationship in self.related_resources:
+            return self.related_resources[relationship][0]
+
+        return self.model
+
+    @classmethod
+    def query_model(
+        cls,
+        base: Type[FieldsQuery],
+        model: Optional[Type[BaseNode]] = None,
+        include: bool = False,
+    ) -> Type[FieldsQuery]:
+        """Build the query parameters model for an endpoint's docs and validation,
+        listing the fields which can be requested (and, for lists, the filters
+        and sort orders). With include, it lists the related resources which can
+        be included too."""
+        if model is None:
+            model = cls.model
+
+        name = f"{cls.__name__}{model.__name__}{base.__name__}"
+
+        names = "|".join(re.escape(name) for name in model.model_fields)
+
+        params: Dict[str, Any] = {
+            "fields": (
+                Optional[str],
+                Field(
+                    default=None,
+                    description=(
+                        "Comma separated properties to return, from: "
+                        f"{', '.join(model.model_fields)}."
+                    ),
+                    pattern=rf"^\s*({names})\s*(,\s*({names})\s*)*$",
+                ),
+            )
+        }
+
+        includable = [
+            relationship
+            for relationship, related in cls.related_resources.items()
+            if isinstance(related, RelatedResource)
+        ]
+
+        if include and includable:
+            name += "Include"
+
+            includes = "|".join(re.escape(related) for related in includable)
+
+            params["include"] = (
+                Optional[str],
+                Field(
+                    default=None,
+                    description=(
+                        "Comma separated related resources to embed in each item, "
+                        f"from: {', '.join(includable)}."
+                    ),
+                    pattern=rf"^\s*({includes})\s*(,\s*({includes})\s*)*$",
+                ),
+            )
+
+        if issubclass(base, ListQuery):
+            params.update(cls.filter_params())
+
+            if cls.sortable_fields:
+                sortable = "|".join(re.escape(name) for name in cls.sortable_fields)
+
+                params["sort"] = (
+                    Optional[str],
+                    Field(
+                        default=None,
+                        description=(
+                            "Comma separated properties to sort by, prefix with - "
+                            f"for descending, from: {', '.join(cls.sortable_fields)}."
+                        ),
+                        pattern=rf"^\s*-?({sortable})\s*(,\s*-?({sortable})\s*)*$",
+                    ),
+                )
+
+        return create_model(name, __base__=base, **params)
+
+    @classmethod
+    def filter_params(cls) -> Dict[str, tuple]:
+        """Query parameter definitions for each filterable property and operator."""
+        params: Dict[str, tuple] = {}
+
+        for field in cls.filterable_fields:
+            annotation = cls.model.model_fields[field].annotation
+
+            for operator in FILTER_OPERATORS:
+                name = field if operator == "eq" else f"{field}__{operator}"
+
+                if operator == "eq":
+                    description = f"Only items where {field} is this value."
+                elif operator == "in":
+                    description = (
+                        f"Only items where {field} is one of these comma "
+                        "separated values."
+                    )
+                elif operator == "prefix":
+                    description = f"Only items where {field} starts with this."
+                else:
+                    description = f"Only items where {field} is {operator} this value."
+
+                # lists and prefixes are always strings
+                value_type = str if operator in ("in", "prefix") else annotation
+
+                params[name] = (
+                    Optional[value_type],
+                    Field(default=None, description=description),
                 )
-            else:
-                # Detail view
-                item = self.get_by_id(pp)
-                if item is None:
-                    return {
-                        "error": f"{self.resource_name[:-1].title()} not found"
-                    }, 404
-                return jsonify(self.serialize_item(item)), 200
-        else:
-            # List view
-            items = self.get_all()
-            return jsonify([self.serialize_item(item) for item in items]), 200
+
+        return params
 
     @classmethod
     def get_list_endpoint(cls, api_ver: str) -> str:
@@ -176,6 +1462,23 @@ class NeontologyAPIView(MethodView, ABC):
         """Get the URL pattern for the detail endpoint"""
         return f"/api/{api_ver}/{cls.resource_name}/<pp>.json"
 
+    @classmethod
+    def get_batch_endpoint(cls, api_ver: str) -> str:
+        """Get the URL pattern for the batch endpoint"""
+        return f"/api/{api_ver}/{cls.resource_name}/batch.json"
+
+    @classmethod
+    def batch_response_model(cls) -> Type[BaseModel]:
+        """The response model for the batch endpoint."""
+        return create_model(
+            f"{cls.__name__}{cls.model.__name__}Batch",
+            items=(
+                List[Optional[cls.model]],
+                Field(description="The items, in request order, null if not found."),
+            ),
+            not_found=(List[Any], Field(description="IDs which weren't found.")),
+        )
+
     @classmethod
     def get_related_endpoint(cls, relationship: str, api_ver: str) -> str:
         """Get the URL pattern for a related resource endpoint"""
@@ -0,0 +1,206 @@
+import asyncio
+from typing import Any, Callable, List, Optional, TypeVar, Union
+
+from flask import Response, current_app
+from neontology import GraphConnection
+
+from ..components import SectionComponent
+from .apiview import NeontologyAPIView
+from .baseview import NeontologyView
+from .conditional import add_validators, is_not_modified, not_modified_response
+from .list import NeontologyListView
+from .node import NeontologyNodeView
+
+T = TypeVar("T")
+
+
+async def run_sync(f: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking function (e.g. a graph query) in a worker thread.
+
+    The Flask app and request context are carried over to the worker thread.
+    """
+    return await asyncio.to_thread(f, *args, **kwargs)
+
+
+class AsyncGraphConnection(object):
+    """Awaitable wrapper around the neontology GraphConnection.
+
+    Neontology's graph engines are synchronous, so each call is run in a worker
+    thread. Independent queries can then be gathered concurrently:
+
+        nodes, count = await asyncio.gather(
+            graph.match_nodes(MyNode), graph.get_count(MyNode)
+        )
+    """
+
+    def __init__(self, gc: Optional[GraphConnection] = None):
+        self._gc = gc if gc is not None else GraphConnection()
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._gc, name)
+
+        if not callable(attribute):
+            return attribute
+
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await run_sync(attribute, *args, **kwargs)
+
+        return wrapper
+
+
+class AsyncNeontologyView(NeontologyView):
+    """NeontologyView with an async get handler.
+
+    Page sections are run in worker threads and gathered concurrently,
+    sections marked with @page_section(serial=True) are run in order.
+    Requires Flask's async extra (`pip install flask[async]`).
+    """
+
+    @property
+    def graph(self) -> AsyncGraphConnection:
+        return AsyncGraphConnection()
+
+    async def get_sections_async(self) -> List[SectionComponent]:
+        sections = [section for _, section in self.get_render_plan().sections]
+
+        serial_sections = [
+            index
+            for index, section in enumerate(sections)
+            if getattr(section, "page_section_serial", False)
+        ]
+        concurrent_sections = [
+            index for index in range(len(sections)) if index not in serial_sections
+        ]
+
+        def run_serial_sections() -> List[Optional[SectionComponent]]:
+            return [sections[index](self) for index in serial_sections]
+
+        tasks = [run_sync(sections[index], self) for index in concurrent_sections]
+
+        if serial_sections:
+            tasks.append(run_sync(run_serial_sections))
+
+        gathered = await asyncio.gather(*tasks)
+
+        results = dict(zip(concurrent_sections, gathered))
+
+        if serial_sections:
+            results.update(zip(serial_sections, gathered[-1]))
+
+        return [
+            results[index]
+            for index in range(len(sections))
+            if results[index] is not None
+        ]
+
+    async def render_page_async(
+        self, title: Optional[str] = None
+    ) -> Union[str, Response]:
+        if self.stream is True:
+            # sections are streamed from the (synchronous) response iterator
+            return self.render_page(title=title)
+
+        etag = None
+        last_modified = None
+
+        if self.conditional_get is True:
+            etag = self.get_etag()
+            last_modified = self.get_last_modified()
+
+            if is_not_modified(etag, last_modified):
+                return not_modified_response(etag, last_modified)
+
+        sections = await self.get_sections_async()
+
+        response = current_app.make_response(
+            self._render_page(title=title, sections=sections)
+        )
+
+        return add_validators(response, etag, last_modified)
+
+    async def get(self) -> Union[str, Response]:  # type: ignore [override]
+        return await self.render_page_async(title=self.title)
+
+
+class AsyncNeontologyListView(AsyncNeontologyView, NeontologyListView):
+    pass
+
+
+class AsyncNeontologyNodeView(AsyncNeontologyView, NeontologyNodeView):
+    async def get(self, pp: str) -> Union[str, Response]:  # type: ignore [override]
+        if self.model is None:
+            raise ValueError("NeontologyNodeView model not provided.")
+
+        self.node = await run_sync(self.model.match, pp)
+
+        title = self.viewset_handler(self.model).item_title(self.node)
+
+        return await self.render_page_async(title=title)
+
+
+class AsyncNeontologyAPIView(NeontologyAPIView):
+    """NeontologyAPIView with an async get handler.
+
+    Data is fetched in worker threads; for related resource endpoints,
+    the parent and related items are fetched concurrently.
+    Requires Flask's async extra (`pip install flask[async]`).
+    """
+
+    @property
+    def graph(self) -> AsyncGraphConnection:
+        return AsyncGraphConnection()
+
+    async def get(  # type: ignore [override]
+        self, pp: Optional[Any] = None, relationship: Optional[str] = None
+    ):
+        try:
+            fields, includes = self.get_query_options(pp, relationship)
+        except ValueError as exc:
+            return {"error": str(exc)}, 400
+
+        self._etag = self.generation_etag(pp, relationship)
+
+        if self._etag is not None and is_not_modified(self._etag):
+            return not_modified_response(self._etag)
+
+        if pp is None:
+            if self.get_paging() is None and self.wants_stream():
+                # items are fetched as the response is sent
+                return self.list_response(fields, includes)
+
+            return await run_sync(self.list_response, fields, includes)
+
+        if relationship is None:
+            return await run_sync(self.detail_response, pp, fields, includes)
+
+        if self.uses_related_query(relationship):
+            related_items = await run_sync(
+                self.get_related_items, pp, relationship, fields
+            )
+        else:
+            parent_item, related_items = await asyncio.gather(
+                run_sync(self.get_by_id, pp),
+                run_sync(self.get_related, pp, relationship),
+            )
+
+            if parent_item is None:
+                related_items = None
+
+        # streamed responses are built here, as they keep the request context
+        if self.wants_stream(relationship):
+            return self.make_related_response(related_items, relationship, fields)
+
+        return await run_sync(
+            self.make_related_response, related_items, relationship, fields
+        )
+
+    async def batch(self):  # type: ignore [override]
+        try:
+            fields = self.get_fields()
+            pps = self.get_batch_ids()
+        except ValueError as exc:
+            return {"error": str(exc)}, 400
+
+        items = await run_sync(self.get_batch, pps, fields)
+
+        return self.make_batch_response(pps, items, fields)
@@ -1,6 +1,24 @@
+import contextvars
 import inspect
-from typing import Callable, Dict, Optional, Type, Union
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Type,
+    Union,
+)
 
+from flask import (
+    Response,
+    current_app,
+)
 from flask.views import MethodView
 from neontology import BaseNode
 
@@ -9,14 +27,84 @@ from ..components import (
 )
 from ..components.component import Component
 from ..components.page_component import PageComponent
+from .conditional import (
+    add_validators,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
 from .viewset import NeontologyViewset
 
 
+class RenderPlan(NamedTuple):
+    """The page sections and elements of a view class, in render order."""
+
+    sections: tuple[tuple[str, Callable], ...]
+    elements: tuple[tuple[Callable, tuple[str, ...]], ...]
+
+
+_section_executors: Dict[int, ThreadPoolExecutor] = {}
+_section_executors_lock = threading.Lock()
+
+
+def get_section_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return a shared thread pool for evaluating page sections."""
+    with _section_executors_lock:
+        executor = _section_executors.get(max_workers)
+
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="neontology-section"
+            )
+            _section_executors[max_workers] = executor
+
+    return executor
+
+
+def with_current_context(f: Callable) -> Callable:
+    """Wrap a function so it runs within the current app and request contexts.
+
+    The contexts themselves are shared rather than pushed again (as
+    copy_current_request_context does), so the function sees the request's g,
+    and teardown handlers run once, when the request ends. Call this once per
+    function, as a context can only be entered by one thread at a time.
+    """
+    context = contextvars.copy_context()
+
+    def wrapper(*args, **kwargs):
+        return context.run(f, *args, **kwargs)
+
+    return wrapper
+
+
 class NeontologyView(MethodView):
     viewset_handler: type[NeontologyViewset]
 
     title = None
 
+    # Opt in to streaming: send the page head and breadcrumbs first,
+    # then each page section as soon as it has been built.
+    stream: bool = False
+
+    # Headtags to include in the page head. When streaming, declare scripts/styles
+    # needed by sections here so they are sent before the sections arrive.
+    headtags: List[str] = []
+
+    # Evaluate page sections concurrently on a bounded thread pool of this size.
+    # Sections decorated with @page_section(serial=True) run in the request thread,
+    # in order, while the pool works on the others. Output order is preserved.
+    max_section_workers: int = 1
+
+    # Opt in to conditional GET: send an ETag (computed from etag_data) and answer
+    # matching If-None-Match requests with a 304, without rendering the page.
+    conditional_get: bool = False
+
+    # Included in the ETag, bump this when a change to the view changes its output.
+    version: str = "1"
+
+    # Set per class by build_render_plan
+    _render_plan: Optional[RenderPlan] = None
+
     def __init__(self, model: Optional[Type[BaseNode]] = None):
         if self.viewset_handler.model:
             self.model = self.viewset_handler.model
@@ -73,29 +161,173 @@ class NeontologyView(MethodView):
 
         return decorated_methods
 
+    @classmethod
+    def build_render_plan(cls) -> RenderPlan:
+        """
+        Collect the decorated page sections and elements for this class once,
+         so requests don't need to walk the class hierarchy.
+
+        Called by the NeontologyManager when views are registered.
+
+        Returns:
+            RenderPlan: The sections and elements of this view class.
+        """
+        sections = cls.collect_decorated_methods("page_section")
+        elements = cls.collect_decorated_methods("page_element")
+
+        plan = RenderPlan(
+            sections=tuple(sections.items()),
+            elements=tuple(
+                (method, tuple(method.page_element)) for method in elements.values()
+            ),
+        )
+
+        # store on this class specifically, subclasses get their own plan
+        cls._render_plan = plan
+
+        return plan
+
+    @classmethod
+    def get_render_plan(cls) -> RenderPlan:
+        plan = cls.__dict__.get("_render_plan")
+
+        if plan is None:
+            plan = cls.build_render_plan()
+
+        return plan
+
     def get_sections(self) -> list[SectionComponent]:
-        sections = self.collect_decorated_methods("page_section")
+        return list(self.iter_sections())
+
+    def iter_sections(self) -> Iterator[SectionComponent]:
+        sections = [section for _, section in self.get_render_plan().sections]
 
-        return [
-            section(self) for section in sections.values() if section(self) is not None
+        if self.max_section_workers > 1 and len(sections) > 1:
+            results = self._evaluate_sections_concurrently(sections)
+
+        else:
+            results = (section(self) for section in sections)
+
+        # each section is evaluated exactly once
+        for result in results:
+            if result is not None:
+                yield result
+
+    def _evaluate_sections_concurrently(
+        self, sections: List[Callable]
+    ) -> Iterator[Optional[SectionComponent]]:
+        executor = get_section_executor(self.max_section_workers)
+
+        futures: List[Optional[Future]] = [
+            None
+            if getattr(section, "page_section_serial", False)
+            else executor.submit(with_current_context(section), self)
+            for section in sections
         ]
 
-    def get_elements(self) -> Dict[str, Union[Component, str]]:
-        elements = self.collect_decorated_methods("page_element")
+        try:
+            # run the serial sections (in order) while the pool works on the rest
+            serial_results = {
+                index: section(self)
+                for index, (section, future) in enumerate(zip(sections, futures))
+                if future is None
+            }
 
+            for index, future in enumerate(futures):
+                if future is None:
+                    yield serial_results[index]
+
+                else:
+                    yield future.result()
+
+        finally:
+            # if a section failed, or a streamed page was closed (e.g. the client
+            # disconnected), drop the sections which haven't started yet
+            for future in futures:
+                if future is not None:
+                    future.cancel()
+
+    def get_headtags(self) -> List[str]:
+        return list(self.headtags)
+
+    def get_elements(self) -> Dict[str, Union[Component, str]]:
         new_elements = {}
 
-        for method in elements.values():
-            if hasattr(method, "page_element"):
-                for element_name in method.page_element:
-                    new_elements[element_name] = method(self)
+        for method, element_names in self.get_render_plan().elements:
+            element = method(self)
+
+            for element_name in element_names:
+                new_elements[element_name] = element
 
         return new_elements
 
-    def get(self) -> str:
-        sections = self.get_sections()
+    def etag_data(self) -> Optional[Any]:
+        """
+        Return the (JSON serializable) data this page is built from.
+
+        Override this to enable ETags for a view with conditional_get,
+        the page is treated as unchanged for as long as this data is unchanged.
+        """
+        return None
+
+    def get_etag(self) -> Optional[str]:
+        data = self.etag_data()
+
+        if data is None:
+            return None
+
+        view_class = type(self)
+
+        return make_etag(
+            f"{view_class.__module__}.{view_class.__qualname__}", self.version, data
+        )
+
+    def get_last_modified(self) -> Optional[datetime]:
+        return None
+
+    def render_page(self, title: Optional[str] = None) -> Union[str, Response]:
+        if self.conditional_get is not True:
+            return self._render_page(title=title)
+
+        etag = self.get_etag()
+        last_modified = self.get_last_modified()
+
+        if is_not_modified(etag, last_modified):
+            return not_modified_response(etag, last_modified)
+
+        response = current_app.make_response(self._render_page(title=title))
+
+        return add_validators(response, etag, last_modified)
+
+    def _render_page(
+        self,
+        title: Optional[str] = None,
+        sections: Optional[List[SectionComponent]] = None,
+    ) -> Union[str, Response]:
+        if self.stream is True and sections is None:
+            elements = self.get_elements()
+
+            page = PageComponent(
+                title=title, elements=elements, headtags=self.get_headtags()
+            )
+
+            return current_app.response_class(
+                page.stream(self.iter_sections()), mimetype="text/html"
+            )
+
+        if sections is None:
+            sections = self.get_sections()
+
         elements = self.get_elements()
 
-        page = PageComponent(title=self.title, elements=elements, sections=sections)
+        page = PageComponent(
+            title=title,
+            elements=elements,
+            sections=sections,
+            headtags=self.get_headtags(),
+        )
 
         return page.render()
+
+    def get(self) -> Union[str, Response]:
+        return self.render_page(title=self.title)
@@ -0,0 +1,53 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from flask import Response, current_app, request
+
+
+def make_etag(*parts: Any) -> str:
+    """Generate an ETag from (JSON serializable) data behind a response."""
+    payload = json.dumps(parts, sort_keys=True, default=str).encode("utf-8")
+
+    return hashlib.sha1(payload).hexdigest()
+
+
+def is_not_modified(
+    etag: Optional[str], last_modified: Optional[datetime] = None
+) -> bool:
+    """Check the current request's validators against the given ETag/Last-Modified."""
+    # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+    if request.if_none_match:
+        return etag is not None and request.if_none_match.contains_weak(etag)
+
+    if last_modified is not None and request.if_modified_since is not None:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+
+        # HTTP dates only have second precision
+        return last_modified.replace(microsecond=0) <= request.if_modified_since
+
+    return False
+
+
+def add_validators(
+    response: Response,
+    etag: Optional[str],
+    last_modified: Optional[datetime] = None,
+) -> Response:
+    if etag is not None:
+        response.set_etag(etag)
+
+    if last_modified is not None:
+        response.last_modified = last_modified
+
+    return response
+
+
+def not_modified_response(
+    etag: Optional[str], last_modified: Optional[datetime] = None
+) -> Response:
+    response = current_app.response_class(status=304)
+
+    return add_validators(response, etag, last_modified)
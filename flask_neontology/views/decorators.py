@@ -1,10 +1,15 @@
 import functools
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Hashable, Optional, Union
 
+from flask import current_app
+
+from ..cache import CacheBackend
+from ..changes import get_change_tracker
 from ..components import (
+    CachedSectionComponent,
     SectionComponent,
 )
-from ..components.component import Component
+from ..components.component import Component, component_id_scope
 from ..components.page_component import PageElementsEnum
 
 
@@ -27,15 +32,70 @@ def page_element(name: PageElementsEnum) -> Callable:
     return decorator_page_element
 
 
+def get_fragment_cache() -> Optional[CacheBackend]:
+    neontology_manager = getattr(current_app, "neontology_manager", None)
+
+    return getattr(neontology_manager, "fragment_cache", None)
+
+
+def fragment_cache_key(
+    view: Any, section_name: str, depends_on: Optional[Callable] = None
+) -> Hashable:
+    """Key a cached section on the view class, section, model label and node, and
+    the label's generation, so writes to the label replace it.
+
+    depends_on(view) returns more (labels, relationship_types) the section is
+    built from, whose generations are added too.
+    """
+    view_class = type(view)
+
+    model = getattr(view, "model", None)
+    label = getattr(model, "__primarylabel__", None)
+
+    node = getattr(view, "node", None)
+    pp = node.get_pp() if node is not None else None
+
+    changes = get_change_tracker()
+
+    generations: tuple = ()
+
+    if changes is not None:
+        labels = {label} if label else set()
+        relationship_types: set = set()
+
+        if depends_on is not None:
+            more_labels, more_relationship_types = depends_on(view)
+
+            labels.update(more_labels)
+            relationship_types.update(more_relationship_types)
+
+        # in a fixed order, as keys may be shared between processes
+        generations = changes.generations(sorted(labels), sorted(relationship_types))
+
+    return (
+        "section",
+        f"{view_class.__module__}.{view_class.__qualname__}",
+        section_name,
+        label,
+        pp,
+        *generations,
+    )
+
+
 def page_section(
     title: Optional[str] = None,
     description: Optional[str] = None,
     title_level: Optional[str] = "h2",
+    serial: bool = False,
+    cache_ttl: Optional[float] = None,
+    cache_depends_on: Optional[Callable] = None,
 ) -> Callable:
     def decorator_page_section(f: Callable) -> Callable:
-        @functools.wraps(f)
-        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Optional[SectionComponent]:
-            body = f(self)
+        def build_section(self: Any) -> Optional[SectionComponent]:
+            # seed component IDs from the section, so they are stable between renders
+            with component_id_scope(f.__name__):
+                body = f(self)
+
             if body:
                 section = SectionComponent(
                     title=title,
@@ -47,8 +107,42 @@ def page_section(
             else:
                 return None
 
+        @functools.wraps(f)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Optional[SectionComponent]:
+            cache = get_fragment_cache() if cache_ttl is not None else None
+
+            if cache is None:
+                return build_section(self)
+
+            key = fragment_cache_key(self, f.__name__, cache_depends_on)
+
+            # entries are (html, headtags, tailtags), html is None for empty sections
+            entry = cache.get(key)
+
+            if entry is None:
+                section = build_section(self)
+
+                if section is None:
+                    entry = (None, [], [])
+                else:
+                    entry = (section.render(), section.headtags, section.tailtags)
+
+                cache.set(key, entry, ttl=cache_ttl)
+
+            html, headtags, tailtags = entry
+
+            if html is None:
+                return None
+
+            return CachedSectionComponent(
+                html=html, headtags=list(headtags), tailtags=list(tailtags)
+            )
+
         wrapper.page_section = True  # type: ignore [attr-defined]
 
+        # serial sections are never run on the section thread pool
+        wrapper.page_section_serial = serial  # type: ignore [attr-defined]
+
         return wrapper
 
     return decorator_page_section
@@ -1,8 +1,10 @@
 from typing import Optional
 
+from flask import abort, request
 from neontology import BaseNode
 
 from .baseview import NeontologyView
+from .pagination import NodePage
 
 
 class NeontologyListView(NeontologyView):
@@ -25,3 +27,12 @@ class NeontologyListView(NeontologyView):
         else:
             raise ValueError("Viewset Handler Model Not Defined")
         return viewset.list_url()
+
+    def match_page(self, limit: Optional[int] = None) -> NodePage:
+        """Match the page of nodes given by the request's cursor parameter."""
+        cursor = request.args.get("cursor") or None
+
+        try:
+            return self.viewset.match_page(cursor=cursor, limit=limit)
+        except ValueError:
+            abort(400)
@@ -1,8 +1,10 @@
-from typing import Optional, Type
+from typing import Any, Optional, Set, Tuple, Type, Union
 
+from flask import Response
 from neontology import BaseNode
+from neontology.utils import get_rels_by_type
 
-from ..components.page_component import PageComponent
+from ..changes import get_change_tracker
 from .baseview import NeontologyView
 
 
@@ -18,20 +20,61 @@ class NeontologyNodeView(NeontologyView):
         self.viewset = self.viewset_handler(self.model)
         self.node = None
 
-    def get(self, pp: str) -> str:  # type: ignore [override]
+    def get(self, pp: str) -> Union[str, Response]:  # type: ignore [override]
         if self.model is None:
             raise ValueError("NeontologyNodeView model not provided.")
 
         self.node = self.model.match(pp)
 
-        sections = self.get_sections()
-        elements = self.get_elements()
-
         title = self.viewset_handler(self.model).item_title(self.node)
 
-        page = PageComponent(title=title, elements=elements, sections=sections)
+        return self.render_page(title=title)
+
+    def etag_depends_on(self) -> Tuple[Set[str], Set[str]]:
+        """
+        The labels and relationship types the page is built from, besides the
+        node itself: by default the node's label, the relationship types to or
+        from it and the labels at their other ends (the node's neighbours).
+        """
+        label = self.model.__primarylabel__
+
+        labels = {label}
+        relationship_types = set()
+
+        for rel_type, rel_type_data in get_rels_by_type().items():
+            ends = {
+                getattr(node_class, "__primarylabel__", None)
+                for node_class in (
+                    *rel_type_data.all_source_classes,
+                    *rel_type_data.all_target_classes,
+                )
+            }
+
+            if label in ends:
+                relationship_types.add(rel_type)
+                labels.update(end for end in ends if end is not None)
+
+        return labels, relationship_types
+
+    def etag_data(self) -> Optional[Any]:
+        """The node, and the generations of what etag_depends_on returns, so the
+        page changes when its relationships or neighbours are written."""
+        if self.node is None:
+            return None
+
+        data = self.node.model_dump(mode="json")
+
+        changes = get_change_tracker()
+
+        if changes is None:
+            return data
+
+        labels, relationship_types = self.etag_depends_on()
 
-        return page.render()
+        return [
+            data,
+            changes.generations(sorted(labels), sorted(relationship_types)),
+        ]
 
     @classmethod
     def view_name(cls) -> str:
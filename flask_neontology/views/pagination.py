@@ -0,0 +1,237 @@
+import base64
+import enum
+import functools
+import json
+from typing import Any, NamedTuple, Optional, Sequence
+
+from neontology import BaseNode, GraphConnection
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
+
+from ..records import match_rows
+from .query import keyset_clause, order_by_clause, projection
+
+
+class NodePage(NamedTuple):
+    """One page of nodes, with opaque cursors for the pages either side of it."""
+
+    # nodes, or dicts of their properties when only some fields were matched
+    nodes: list[Any]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+def encode_cursor(values: list[Any], backward: bool = False) -> str:
+    """Encode a node's position (its order key values) as an opaque cursor."""
+    data = {"b" if backward else "a": to_jsonable_python(values)}
+
+    raw = json.dumps(data, separators=(",", ":")).encode()
+
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[list[Any], bool]:
+    """Decode a cursor into its order key values and whether it points backward.
+
+    Raises:
+        ValueError: If the cursor isn't one generated by encode_cursor.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Invalid cursor.") from exc
+
+    if not isinstance(data, dict) or len(data) != 1:
+        raise ValueError("Invalid cursor.")
+
+    direction, values = next(iter(data.items()))
+
+    if direction not in ("a", "b") or not isinstance(values, list):
+        raise ValueError("Invalid cursor.")
+
+    return values, direction == "b"
+
+
+def cursor_values(node: BaseNode, order: Sequence[tuple[str, str]]) -> list[Any]:
+    """A node's values for each order key, which make up its cursor."""
+    return [getattr(node, field) for field, _ in order]
+
+
+def property_value(model: type[BaseNode], field: str, value: Any) -> Any:
+    """Convert a value (e.g. a string from a query string) to a property's type,
+    for use as a query parameter.
+
+    Raises:
+        ValueError: If the value isn't valid for the property.
+    """
+    value = TypeAdapter(model.model_fields[field].annotation).validate_python(value)
+
+    if isinstance(value, enum.Enum):
+        value = value.value
+
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def nullable_properties(model: type[BaseNode]) -> frozenset[str]:
+    """The model's properties which can be null (optional, or allowing None)."""
+    return frozenset(
+        field
+        for field, info in model.model_fields.items()
+        if not info.is_required() or _allows_none(info.annotation)
+    )
+
+
+def _allows_none(annotation: Any) -> bool:
+    try:
+        TypeAdapter(annotation).validate_python(None)
+    except ValidationError:
+        return False
+
+    return True
+
+
+def decode_cursor_values(
+    cursor: str, model: type[BaseNode], order: Sequence[tuple[str, str]]
+) -> tuple[list[Any], bool]:
+    """Decode a cursor into query parameters for each order key.
+
+    Raises:
+        ValueError: If the cursor is invalid, or doesn't match the order.
+    """
+    values, backward = decode_cursor(cursor)
+
+    if len(values) != len(order):
+        raise ValueError("Invalid cursor.")
+
+    # restore JSON encoded values (e.g. datetimes) to their property types
+    params = [
+        property_value(model, field, value) for (field, _), value in zip(order, values)
+    ]
+
+    return params, backward
+
+
+def match_node_page(
+    model: type[BaseNode],
+    order: Sequence[tuple[str, str]],
+    cursor: Optional[str],
+    limit: int,
+    fields: Optional[Sequence[str]] = None,
+    where: Optional[str] = None,
+    where_params: Optional[dict] = None,
+) -> NodePage:
+    """Match one page of nodes using keyset pagination.
+
+    Rather than skipping over earlier nodes, the query starts from the position
+    in the cursor, so later pages cost the same as the first.
+
+    Args:
+        model (type[BaseNode]): Node class to match.
+        order (Sequence[tuple[str, str]]): (property, "asc"|"desc") pairs, which
+            must give every node a unique position (i.e. include the primary
+            property).
+        cursor (Optional[str]): A next_cursor/prev_cursor from an earlier page,
+            None for the first page.
+        limit (int): Number of nodes on the page.
+        fields (Optional[Sequence[str]]): Only return these properties, as dicts
+            rather than nodes.
+        where (Optional[str]): Condition on n for the nodes to include (e.g.
+            from filter_clause), with its parameters in where_params.
+
+    Raises:
+        ValueError: If the cursor is invalid.
+
+    Returns:
+        NodePage: The nodes, with cursors for the next and previous pages.
+    """
+    backward = False
+
+    # fetch one extra node to find out whether there's another page
+    params: dict = {**(where_params or {}), "limit": limit + 1}
+
+    conditions = [where] if where else []
+
+    if cursor:
+        values, backward = decode_cursor_values(cursor, model, order)
+
+        conditions.append(
+            keyset_clause(order, backward=backward, nullable=nullable_properties(model))
+        )
+
+        for index, value in enumerate(values):
+            params[f"cursor_{index}"] = value
+
+    cypher = f"MATCH (n:{model.__primarylabel__})"
+
+    if conditions:
+        cypher += " WHERE " + " AND ".join(conditions)
+
+    if backward:
+        # walk back from the cursor, then put the page in the right order
+        query_order = [
+            (field, "desc" if direction == "asc" else "asc")
+            for field, direction in order
+        ]
+    else:
+        query_order = list(order)
+
+    gc = GraphConnection()
+
+    # (item, cursor values) for each node
+    rows: list[tuple[Any, list[Any]]]
+
+    if fields is None:
+        cypher += f" RETURN n {order_by_clause(query_order)} LIMIT $limit"
+
+        nodes = gc.evaluate_query(
+            cypher, params, node_classes={model.__primarylabel__: model}
+        ).nodes
+
+        rows = [(node, cursor_values(node, order)) for node in nodes]
+
+    else:
+        order_fields = [field for field, _ in order]
+
+        cypher += (
+            f" WITH n {order_by_clause(query_order)} LIMIT $limit"
+            f" RETURN {projection(fields)} AS item,"
+            f" {projection(order_fields)} AS keys"
+        )
+
+        rows = [
+            (record["item"], [record["keys"][field] for field in order_fields])
+            for record in match_rows(cypher, params)
+        ]
+
+    more = len(rows) > limit
+    rows = rows[:limit]
+
+    if backward:
+        if not rows:
+            # nothing left before the cursor
+            return match_node_page(
+                model, order, None, limit, fields, where, where_params
+            )
+
+        rows.reverse()
+        has_prev, has_next = more, True
+
+    else:
+        has_prev, has_next = bool(cursor), more
+
+    next_cursor = None
+    prev_cursor = None
+
+    if rows and has_next:
+        next_cursor = encode_cursor(rows[-1][1])
+
+    if rows and has_prev:
+        prev_cursor = encode_cursor(rows[0][1], backward=True)
+
+    return NodePage(
+        nodes=[item for item, _ in rows],
+        next_cursor=next_cursor,
+        prev_cursor=prev_cursor,
+    )
@@ -0,0 +1,204 @@
+from typing import Collection, Optional, Sequence
+
+# Directions accepted for ORDER BY, mapped to their Cypher keyword
+ORDER_DIRECTIONS = {"asc": "ASC", "desc": "DESC"}
+
+# Filter operators (e.g. ?created__gte= in API query parameters), mapped to Cypher
+FILTER_OPERATORS = {
+    "eq": "=",
+    "in": "IN",
+    "gt": ">",
+    "gte": ">=",
+    "lt": "<",
+    "lte": "<=",
+    "prefix": "STARTS WITH",
+}
+
+
+def quote_name(name: str) -> str:
+    """Quote a property name for use in Cypher."""
+    escaped = name.replace("`", "``")
+
+    return f"`{escaped}`"
+
+
+def property_ref(field: str, variable: str = "n") -> str:
+    """Reference a node property in Cypher, quoting the property name."""
+    return f"{variable}.{quote_name(field)}"
+
+
+def projection(fields: Sequence[str], variable: str = "n") -> str:
+    """Build a map projection of some of a node's properties.
+
+    e.g. n {.`name`, .`description`}
+    """
+    properties = ", ".join(f".{quote_name(field)}" for field in fields)
+
+    return f"{variable} {{{properties}}}"
+
+
+def relationship_pattern(
+    relationship_type: str,
+    direction: str = "out",
+    target_label: Optional[str] = None,
+    source: str = "p",
+    target: str = "n",
+) -> str:
+    """Build a pattern from source to target nodes along one relationship type.
+
+    direction is "out" (source to target), "in" (target to source) or "both".
+    """
+    target_node = (
+        target if target_label is None else f"{target}:{quote_name(target_label)}"
+    )
+
+    relationship = f"[:{quote_name(relationship_type)}]"
+
+    if direction == "out":
+        return f"({source})-{relationship}->({target_node})"
+
+    if direction == "in":
+        return f"({source})<-{relationship}-({target_node})"
+
+    if direction == "both":
+        return f"({source})-{relationship}-({target_node})"
+
+    raise ValueError(f"Invalid relationship direction: {direction}")
+
+
+def order_by_clause(
+    order: Sequence[tuple[str, str]], variable: str = "n"
+) -> Optional[str]:
+    """Build an ORDER BY clause from (property, direction) pairs.
+
+    Property names can't be passed as query parameters, so callers must only
+    pass properties which have been checked against the model.
+    """
+    if not order:
+        return None
+
+    keys = []
+
+    for field, direction in order:
+        keyword = ORDER_DIRECTIONS.get(direction.lower())
+
+        if keyword is None:
+            raise ValueError(f"Invalid order direction: {direction}")
+
+        keys.append(f"{property_ref(field, variable)} {keyword}")
+
+    return "ORDER BY " + ", ".join(keys)
+
+
+def filter_clause(
+    filters: Sequence[tuple[str, str]], param: str = "filter", variable: str = "n"
+) -> Optional[str]:
+    """Build conditions, all of which must match, from (property, operator) pairs.
+
+    The values are passed as parameters named ${param}_0, ${param}_1... (one per
+    filter). As with order_by_clause, callers must only pass properties which
+    have been checked against the model.
+    """
+    if not filters:
+        return None
+
+    conditions = []
+
+    for index, (field, operator) in enumerate(filters):
+        keyword = FILTER_OPERATORS.get(operator)
+
+        if keyword is None:
+            raise ValueError(f"Invalid filter operator: {operator}")
+
+        conditions.append(f"{property_ref(field, variable)} {keyword} ${param}_{index}")
+
+    return "(" + " AND ".join(conditions) + ")"
+
+
+def search_clause(
+    fields: Sequence[str], param: str = "search", variable: str = "n"
+) -> Optional[str]:
+    """Build a case-insensitive 'contains' condition across several properties."""
+    if not fields:
+        return None
+
+    conditions = [
+        f"toLower(toString({property_ref(field, variable)})) CONTAINS ${param}"
+        for field in fields
+    ]
+
+    return "(" + " OR ".join(conditions) + ")"
+
+
+def keyset_clause(
+    order: Sequence[tuple[str, str]],
+    backward: bool = False,
+    param: str = "cursor",
+    variable: str = "n",
+    nullable: Collection[str] = (),
+) -> Optional[str]:
+    """Build a condition matching the nodes after a cursor in the given order.
+
+    The cursor's values are passed as parameters named ${param}_0, ${param}_1...
+    (one per order key). The last key should be unique (e.g. the primary
+    property) so that no two nodes share a position. With backward, it matches
+    the nodes before the cursor instead.
+
+    Properties in nullable may be null, on the nodes or in the cursor. Cypher
+    sorts nulls after every value (last ascending, first descending), so their
+    conditions place them there rather than comparing them, which would never
+    match.
+    """
+    if not order:
+        return None
+
+    alternatives = []
+
+    for index, (field, direction) in enumerate(order):
+        keyword = ORDER_DIRECTIONS.get(direction.lower())
+
+        if keyword is None:
+            raise ValueError(f"Invalid order direction: {direction}")
+
+        # nodes come after the cursor if they're equal on all earlier keys,
+        # and beyond it on this one
+        ascending = (keyword == "ASC") != backward
+
+        conditions = [
+            _equal_condition(earlier, f"${param}_{earlier_index}", variable, nullable)
+            for earlier_index, (earlier, _) in enumerate(order[:index])
+        ]
+        conditions.append(
+            _beyond_condition(field, f"${param}_{index}", ascending, variable, nullable)
+        )
+
+        alternatives.append("(" + " AND ".join(conditions) + ")")
+
+    return "(" + " OR ".join(alternatives) + ")"
+
+
+def _equal_condition(
+    field: str, value: str, variable: str, nullable: Collection[str]
+) -> str:
+    ref = property_ref(field, variable)
+
+    if field not in nullable:
+        return f"{ref} = {value}"
+
+    return f"({ref} = {value} OR ({ref} IS NULL AND {value} IS NULL))"
+
+
+def _beyond_condition(
+    field: str, value: str, ascending: bool, variable: str, nullable: Collection[str]
+) -> str:
+    ref = property_ref(field, variable)
+
+    if field not in nullable:
+        return f"{ref} {'>' if ascending else '<'} {value}"
+
+    if ascending:
+        # nulls come last, after every value (and nothing comes after a null)
+        return f"({value} IS NOT NULL AND ({ref} > {value} OR {ref} IS NULL))"
+
+    # nulls come first, so every value comes after a null
+    return f"({ref} < {value} OR ({value} IS NULL AND {ref} IS NOT NULL))"
@@ -0,0 +1,94 @@
+from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+from neontology import BaseNode, GraphConnection
+
+from ..records import bolt_driver, iter_rows, node_from_bolt
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+T = TypeVar("T")
+
+
+def iter_nodes(
+    cypher: str,
+    params: Optional[dict] = None,
+    node_classes: Optional[dict[str, type[BaseNode]]] = None,
+    fetch_size: int = 1000,
+) -> Iterator[BaseNode]:
+    """Yield the nodes returned by a query, fetching records in batches.
+
+    The first column of each record should be a node. Records are pulled from
+    the driver's result cursor fetch_size at a time, so the full result set is
+    never held in memory.
+    """
+    gc = GraphConnection()
+
+    if node_classes is None:
+        node_classes = gc.global_nodes
+
+    driver = bolt_driver()
+
+    # engines without a Bolt driver don't have a result cursor to iterate
+    if driver is None:
+        yield from gc.evaluate_query(cypher, params or {}, node_classes).nodes
+        return
+
+    with driver.session(fetch_size=fetch_size) as session:
+        for record in session.run(cypher, params or {}):
+            node = node_from_bolt(record[0], node_classes)
+
+            if node is not None:
+                yield node
+
+
+def iter_maps(
+    cypher: str, params: Optional[dict] = None, fetch_size: int = 1000
+) -> Iterator[dict]:
+    """Yield the maps (e.g. node projections) returned by a query, in batches.
+
+    As iter_nodes, but the first column of each record should be a map. Only
+    engines with a Bolt driver (see iter_rows) can return maps.
+    """
+    for row in iter_rows(cypher, params, fetch_size):
+        yield next(iter(row.values()))
+
+
+def chunked(items: Iterable[T], chunk_size: int) -> Iterator[list[T]]:
+    """Group items into lists of up to chunk_size."""
+    chunk = []
+
+    for item in items:
+        chunk.append(item)
+
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def stream_json_array(
+    items: Iterable[Any], dumps: Callable[[Any], str], chunk_size: int = 100
+) -> Iterator[str]:
+    """Encode items as a JSON array, a chunk of items at a time."""
+    yield "["
+
+    first = True
+
+    for chunk in chunked((dumps(item) for item in items), chunk_size):
+        body = ",".join(chunk)
+
+        yield body if first else "," + body
+
+        first = False
+
+    yield "]"
+
+
+def stream_ndjson(
+    items: Iterable[Any], dumps: Callable[[Any], str], chunk_size: int = 100
+) -> Iterator[str]:
+    """Encode items as newline delimited JSON, a chunk of items at a time."""
+    for chunk in chunked((dumps(item) for item in items), chunk_size):
+        yield "\n".join(chunk) + "\n"
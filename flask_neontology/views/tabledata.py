@@ -0,0 +1,100 @@
+from typing import Optional
+
+from flask import Response, jsonify, request
+from neontology import BaseNode
+from pydantic_core import to_jsonable_python
+
+from ..components import NodeListTableComponent
+from .baseview import NeontologyView
+
+
+class NeontologyTableDataView(NeontologyView):
+    """JSON endpoint for a viewset's server side (DataTables) table.
+
+    Implements the DataTables server-side processing protocol: paging, ordering
+    and global search are run as a single parameterized Cypher query.
+    """
+
+    init_every_request = False
+
+    # Upper limit on the rows returned for one request, whatever is asked for
+    max_page_length: int = 1000
+
+    @classmethod
+    def view_name(cls, model: Optional[type[BaseNode]] = None) -> str:
+        return cls.get_viewset(model).table_data_view_name()
+
+    @classmethod
+    def view_url_rule(cls, model: Optional[type[BaseNode]] = None) -> str:
+        return cls.get_viewset(model).table_data_url()
+
+    def get(self) -> Response:  # type: ignore [override]
+        args = request.args
+
+        draw = args.get("draw", default=0, type=int)
+        skip = max(args.get("start", default=0, type=int), 0)
+        limit = args.get("length", default=self.max_page_length, type=int)
+
+        # DataTables requests all rows with a length of -1
+        if limit < 0 or limit > self.max_page_length:
+            limit = self.max_page_length
+
+        table = self.viewset.nodes_to_table(
+            [], fields=self.viewset.table_fields(), server_side=True
+        )
+        columns = table.columns
+
+        order = []
+        index = 0
+
+        while f"order[{index}][column]" in args:
+            column_index = args.get(f"order[{index}][column]", type=int)
+            direction = args.get(f"order[{index}][dir]", default="asc").lower()
+
+            if (
+                column_index is not None
+                and 0 <= column_index < len(columns)
+                and direction in ("asc", "desc")
+            ):
+                field = self.viewset.table_column_property(
+                    columns[column_index].result_field
+                )
+
+                if field is not None:
+                    order.append((field, direction))
+
+            index += 1
+
+        if not order:
+            order = self.viewset.ordering()
+
+        search = args.get("search[value]", default="").strip() or None
+
+        search_fields = []
+
+        for column in columns:
+            field = self.viewset.table_searchable_property(column.result_field)
+
+            if field is not None and field not in search_fields:
+                search_fields.append(field)
+
+        total, filtered, nodes = self.viewset.match_table_page(
+            skip=skip,
+            limit=limit,
+            order=order,
+            search=search,
+            search_fields=search_fields,
+        )
+
+        rows = NodeListTableComponent(
+            nodes=nodes, columns=columns, url_pattern=table.url_pattern
+        ).rows
+
+        return jsonify(
+            {
+                "draw": draw,
+                "recordsTotal": total,
+                "recordsFiltered": filtered,
+                "data": to_jsonable_python(rows),
+            }
+        )
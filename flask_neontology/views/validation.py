@@ -0,0 +1,172 @@
+import functools
+import itertools
+import threading
+import time
+from typing import Any, Dict, List, Optional, get_origin
+
+from flask import g
+from pydantic import BaseModel, RootModel, model_validator
+from spectree import Response
+from spectree.utils import default_after_handler
+
+# "full" validates every response, "sampled" one in every sample_rate, and
+# "docs" only uses the response models for the API docs
+VALIDATION_POLICIES = ("full", "sampled", "docs")
+
+
+def skip_response_validation() -> None:
+    """Don't validate the current request's response against its response model."""
+    g.neontology_skip_response_validation = True
+
+
+@functools.lru_cache(maxsize=None)
+def _sampled_list_model(model: type[BaseModel], items: int) -> type[BaseModel]:
+    """A list (root) model which only validates the first items of the list."""
+
+    class SampledList(model):
+        @model_validator(mode="before")
+        @classmethod
+        def sample(cls, data: Any) -> Any:
+            return data[:items] if isinstance(data, list) else data
+
+    SampledList.__name__ = model.__name__
+
+    return SampledList
+
+
+def _is_list_model(model: type[BaseModel]) -> bool:
+    return issubclass(model, RootModel) and get_origin(
+        model.model_fields["root"].annotation
+    ) in (list, List)
+
+
+class ResponseValidator(object):
+    """Decides which API responses spectree checks against their response models,
+    following a policy.
+
+    Items are built from validated nodes, so validating them again on the way out
+    mostly costs time. Routes get their response models from response(), and
+    after() as spectree's after hook: validated responses get a Server-Timing
+    header, and stats() adds up how long validation has taken.
+
+    Args:
+        policy (str): One of VALIDATION_POLICIES.
+        sample_rate (int): With the "sampled" policy, validate one in this many
+            responses.
+        sample_items (Optional[int]): Only validate this many items of list
+            responses, None for all of them.
+    """
+
+    def __init__(
+        self,
+        policy: str = "full",
+        sample_rate: int = 100,
+        sample_items: Optional[int] = None,
+    ):
+        if policy not in VALIDATION_POLICIES:
+            raise ValueError(
+                f"Unknown response validation policy '{policy}', "
+                f"expected one of: {', '.join(VALIDATION_POLICIES)}"
+            )
+
+        self.policy = policy
+        self.sample_rate = max(sample_rate, 1)
+        self.sample_items = sample_items
+
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+
+        self.responses = 0
+        self.validated = 0
+        self.failures = 0
+        self.seconds = 0.0
+
+    def should_validate(self) -> bool:
+        """Whether the next response should be validated."""
+        if self.policy == "docs":
+            return False
+
+        if self.policy == "sampled":
+            return next(self._counter) % self.sample_rate == 0
+
+        return True
+
+    def response(self, *codes: str, **code_models: Any) -> "ValidatedResponse":
+        """Response models for spectree's validate decorator, which responses are
+        validated against following this validator's policy."""
+        return ValidatedResponse(self, *codes, **code_models)
+
+    def validation_model(self, model: type[BaseModel]) -> type[BaseModel]:
+        """The model to validate a response against, for its response model."""
+        if self.sample_items is not None and _is_list_model(model):
+            return _sampled_list_model(model, self.sample_items)
+
+        return model
+
+    def after(
+        self,
+        req: Any,
+        resp: Any,
+        resp_validation_error: Optional[Exception],
+        instance: Any,
+        model_adapter: Any,
+    ) -> None:
+        """Spectree's after hook: time validated responses."""
+        default_after_handler(req, resp, resp_validation_error, instance, model_adapter)
+
+        start = g.pop("neontology_validation_start", None)
+
+        with self._lock:
+            self.responses += 1
+
+            if start is None:
+                return
+
+            duration = time.perf_counter() - start
+
+            self.validated += 1
+            self.seconds += duration
+
+            if resp_validation_error is not None:
+                self.failures += 1
+                return
+
+        resp.headers.add("Server-Timing", f"validate;dur={duration * 1000:.2f}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "policy": self.policy,
+            "responses": self.responses,
+            "validated": self.validated,
+            "failures": self.failures,
+            "seconds": self.seconds,
+        }
+
+
+class ValidatedResponse(Response):
+    """Spectree response models, validated following a ResponseValidator's policy.
+
+    Spectree looks up the model for a response's status code to validate it
+    against, and the docs list all of them. There's no model to validate against
+    for responses the policy skips, or after skip_response_validation().
+    """
+
+    def __init__(self, validator: ResponseValidator, *codes: str, **code_models: Any):
+        super().__init__(*codes, **code_models)
+
+        self.validator = validator
+
+    def find_model(self, code: int) -> Optional[type[BaseModel]]:
+        model = super().find_model(code)
+
+        if (
+            model is None
+            or g.get("neontology_skip_response_validation")
+            or not self.validator.should_validate()
+        ):
+            return None
+
+        # spectree validates the response straight after, for the after hook
+        g.neontology_validation_start = time.perf_counter()
+
+        return self.validator.validation_model(model)
@@ -1,15 +1,62 @@
+import enum
+import types
 import urllib.parse
-from typing import Optional
+from typing import Optional, Sequence, Union, get_args, get_origin
 
-from neontology import BaseNode
+from neo4j.exceptions import Neo4jError
+from neontology import BaseNode, GraphConnection
+from neontology.graphengines import MemgraphEngine, Neo4jEngine
 
+from ..changes import get_change_tracker
 from ..components import (
     CardComponent,
     CardListComponent,
     LinkComponent,
     NodeListTableComponent,
+    PaginationComponent,
 )
 from ..components.link_data import LinkData
+from .decorators import get_fragment_cache
+from .pagination import NodePage, match_node_page
+from .query import order_by_clause, search_clause
+
+# X | Y unions (types.UnionType) only exist from python 3.10
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+
+def indexed_properties(label: str) -> Optional[set[str]]:
+    """Properties of a label which lead an index, None if they can't be checked."""
+    gc = GraphConnection()
+
+    try:
+        if isinstance(gc.engine, MemgraphEngine):
+            records = gc.evaluate_query("SHOW INDEX INFO").records_raw
+
+            indexed = set()
+
+            for record in records:
+                if record["label"] != label or not record["property"]:
+                    continue
+
+                prop = record["property"]
+
+                indexed.add(prop[0] if isinstance(prop, list) else prop)
+
+            return indexed
+
+        if isinstance(gc.engine, Neo4jEngine):
+            cypher = """
+            SHOW INDEXES YIELD entityType, labelsOrTypes, properties
+            WHERE entityType = 'NODE' AND $label IN labelsOrTypes
+            RETURN COLLECT(properties[0])
+            """
+
+            return set(gc.evaluate_query_single(cypher, {"label": label}) or [])
+
+    except Neo4jError:
+        return None
+
+    return None
 
 
 class NeontologyViewset(object):
@@ -17,9 +64,22 @@ class NeontologyViewset(object):
     parents: tuple[LinkData, ...] = (LinkData(url="/", title="Home"),)
     title: Optional[str] = None
     slug: Optional[str] = None
-    order_by: Optional[str] = None
+    # Property (or properties) to order nodes by, prefix with "-" for descending
+    # e.g. "name" or ("-created", "name")
+    order_by: Optional[Union[str, Sequence[str]]] = None
     model: Optional[type[BaseNode]] = None
 
+    # Labels with more nodes than this get a table which fetches its rows
+    # from the server (a page at a time), None to always render every row.
+    server_side_table_threshold: Optional[int] = None
+
+    # Seconds to keep the answer to use_server_side_table() (it's also replaced
+    # when the label is written through the library)
+    server_side_table_cache_ttl: Optional[float] = 300
+
+    # Number of nodes on each page from match_page
+    page_size: int = 50
+
     def __init__(self, model: type[BaseNode]) -> None:
         self.model = model
 
@@ -30,7 +90,28 @@ class NeontologyViewset(object):
         if self.model is None:
             raise ValueError("Model not defined.")
 
-        return self.model.match_nodes(limit=limit, skip=skip)
+        order_by = order_by_clause(self.ordering())
+
+        if order_by is None:
+            return self.model.match_nodes(limit=limit, skip=skip)
+
+        params = {}
+
+        cypher = f"MATCH (n:{self.model.__primarylabel__}) RETURN n {order_by}"
+
+        if skip:
+            cypher += " SKIP $skip"
+            params["skip"] = skip
+
+        if limit is not None:
+            cypher += " LIMIT $limit"
+            params["limit"] = limit
+
+        gc = GraphConnection()
+
+        return gc.evaluate_query(
+            cypher, params, node_classes={self.model.__primarylabel__: self.model}
+        ).nodes
 
     def match_node(self, pp: str) -> Optional[BaseNode]:
         """Return a single node based on the provided primary property value."""
@@ -39,6 +120,162 @@ class NeontologyViewset(object):
 
         return self.model.match(pp)
 
+    def ordering(self) -> list[tuple[str, str]]:
+        """order_by as (property, "asc"|"desc") pairs, empty if it isn't set.
+
+        Optional properties can be used, nodes without a value are paged in the
+        place the graph database sorts them (last ascending, first descending).
+        """
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        if not self.order_by:
+            return []
+
+        if isinstance(self.order_by, str):
+            order_by: Sequence[str] = [self.order_by]
+        else:
+            order_by = self.order_by
+
+        order = []
+
+        for key in order_by:
+            field = key.lstrip("-")
+
+            if field not in self.model.model_fields:
+                raise ValueError(
+                    f"Can't order {self.model.__primarylabel__} by unknown property: "
+                    f"{field}"
+                )
+
+            order.append((field, "desc" if key.startswith("-") else "asc"))
+
+        return order
+
+    def order_keys(self) -> list[tuple[str, str]]:
+        """The (property, "asc"|"desc") pairs nodes are paged by.
+
+        Always includes the primary property, so every node has a unique position.
+        """
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        pp = self.model.__primaryproperty__
+
+        order = self.ordering()
+
+        if pp not in [field for field, _ in order]:
+            order.append((pp, "asc"))
+
+        return order
+
+    def unindexed_order_properties(self) -> list[str]:
+        """Properties in order_by which don't have an index in the graph.
+
+        Sorting on an unindexed property means reading every node of the label.
+        Returns an empty list if the graph's indexes can't be checked.
+        """
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        order = self.ordering()
+
+        if not order:
+            return []
+
+        indexed = indexed_properties(self.model.__primarylabel__)
+
+        if indexed is None:
+            return []
+
+        return [field for field, _ in order if field not in indexed]
+
+    def match_page(
+        self, cursor: Optional[str] = None, limit: Optional[int] = None
+    ) -> NodePage:
+        """Match one page of nodes, in order_keys order, using keyset pagination.
+
+        Rather than skipping over earlier nodes, the query starts from the position
+        in the cursor, so later pages cost the same as the first.
+
+        Args:
+            cursor (Optional[str]): A next_cursor/prev_cursor from an earlier page,
+                None for the first page.
+            limit (Optional[int]): Number of nodes on the page, defaults to page_size.
+
+        Raises:
+            ValueError: If the cursor is invalid.
+
+        Returns:
+            NodePage: The nodes, with cursors for the next and previous pages.
+        """
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        if limit is None:
+            limit = self.page_size
+
+        return match_node_page(self.model, self.order_keys(), cursor, limit)
+
+    def match_table_page(
+        self,
+        skip: int,
+        limit: int,
+        order: Sequence[tuple[str, str]] = (),
+        search: Optional[str] = None,
+        search_fields: Sequence[str] = (),
+    ) -> tuple[int, int, list[BaseNode]]:
+        """Match one page of nodes for a server side table.
+
+        Args:
+            skip (int): Number of nodes to skip.
+            limit (int): Maximum number of nodes to return.
+            order (Sequence[tuple[str, str]]): (property, "asc"|"desc") pairs.
+            search (Optional[str]): Case-insensitive text to look for.
+            search_fields (Sequence[str]): Properties to search in.
+
+        Returns:
+            tuple: Total node count, count matching the search, and the nodes.
+        """
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        gc = GraphConnection()
+
+        params: dict = {"skip": skip, "limit": limit}
+
+        match_cypher = f"MATCH (n:{self.model.__primarylabel__})"
+
+        where = search_clause(search_fields) if search else None
+
+        if where:
+            match_cypher += f" WHERE {where}"
+            params["search"] = search.lower()  # type: ignore [union-attr]
+
+        cypher = match_cypher + " RETURN n"
+
+        order_by = order_by_clause(order)
+
+        if order_by:
+            cypher += f" {order_by}"
+
+        cypher += " SKIP $skip LIMIT $limit"
+
+        nodes = gc.evaluate_query(
+            cypher, params, node_classes={self.model.__primarylabel__: self.model}
+        ).nodes
+
+        total = self.model.get_count()
+
+        if where:
+            filtered = gc.evaluate_query_single(
+                match_cypher + " RETURN COUNT(DISTINCT n)", params
+            )
+        else:
+            filtered = total
+
+        return total, filtered, nodes
+
     @classmethod
     def get_base_url(cls) -> str:
         base_url = None
@@ -83,9 +320,103 @@ class NeontologyViewset(object):
     def list_description(self) -> Optional[str]:
         return f"Find out more about {self.list_title()}"
 
+    def page_url(self, cursor: str) -> str:
+        return f"{self.list_url()}?{urllib.parse.urlencode({'cursor': cursor})}"
+
     def list_view_name(self) -> str:
         return f"{self.__class__.__name__}-{self.model.__primarylabel__}-list"
 
+    def use_server_side_table(self) -> bool:
+        """Whether the label has more nodes than server_side_table_threshold.
+
+        The answer is kept in the fragment cache, keyed on the label's generation,
+        so the nodes are only counted again once the label has been written to
+        (or after server_side_table_cache_ttl, for writes made elsewhere).
+        """
+        if self.server_side_table_threshold is None:
+            return False
+
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        changes = get_change_tracker()
+        cache = get_fragment_cache()
+
+        if changes is None or cache is None:
+            return self.model.get_count() > self.server_side_table_threshold
+
+        label = self.model.__primarylabel__
+
+        key = (
+            "server_side_table",
+            label,
+            self.server_side_table_threshold,
+            *changes.generations([label]),
+        )
+
+        use_server_side = cache.get(key)
+
+        if use_server_side is None:
+            use_server_side = self.model.get_count() > self.server_side_table_threshold
+
+            cache.set(key, use_server_side, ttl=self.server_side_table_cache_ttl)
+
+        return use_server_side
+
+    # Table Data Properties
+
+    def table_fields(self) -> Optional[list]:
+        """Fields to show in the list table, None for all of them."""
+        return None
+
+    def table_data_url(self) -> str:
+        return f"{self.list_url()}table.json"
+
+    def table_data_view_name(self) -> str:
+        return f"{self.__class__.__name__}-{self.model.__primarylabel__}-table-data"
+
+    def table_column_property(self, result_field: str) -> Optional[str]:
+        """The node property behind a table column, for ordering/searching in Cypher.
+
+        Returns None for columns which aren't a plain property.
+        """
+        if self.model is None:
+            raise ValueError("Model not defined.")
+
+        if result_field == "__pp__":
+            return self.model.__primaryproperty__
+
+        # by default, a node's string representation is its primary property
+        if result_field == "__str__" and self.model.__str__ is BaseNode.__str__:
+            return self.model.__primaryproperty__
+
+        if result_field in self.model.model_fields:
+            return result_field
+
+        return None
+
+    def table_searchable_property(self, result_field: str) -> Optional[str]:
+        """As table_column_property, limited to text/number/enum properties."""
+        field = self.table_column_property(result_field)
+
+        if field is None:
+            return None
+
+        annotation = self.model.model_fields[field].annotation  # type: ignore [union-attr]
+
+        # unwrap Optional[...]
+        if get_origin(annotation) in _UNION_TYPES:
+            options = [x for x in get_args(annotation) if x is not type(None)]
+            annotation = options[0] if len(options) == 1 else None
+
+        if annotation in (str, int, float):
+            return field
+
+        if isinstance(annotation, type) and issubclass(annotation, enum.Enum):
+            return field
+
+        return None
+
     # Item/Node Properties
 
     def item_url_pattern(self) -> str:
@@ -171,18 +502,59 @@ class NeontologyViewset(object):
             links=[LinkComponent(url=self.node_to_url(node))],
         )
 
-    def nodes_to_cards(self, nodes: list[BaseNode]) -> CardListComponent:
+    def pagination(self, page: NodePage) -> PaginationComponent:
+        """Links to the pages either side of a page of nodes."""
+        return PaginationComponent.trusted(
+            prev_url=self.page_url(page.prev_cursor) if page.prev_cursor else None,
+            next_url=self.page_url(page.next_cursor) if page.next_cursor else None,
+        )
+
+    def nodes_to_cards(
+        self, nodes: Union[list[BaseNode], NodePage]
+    ) -> CardListComponent:
+        pagination = None
+
+        # a single page (from match_page) gets links to the pages either side
+        if isinstance(nodes, NodePage):
+            pagination = self.pagination(nodes)
+            nodes = nodes.nodes
+
         node_cards = [self.node_to_card(x) for x in nodes]
 
-        node_card_list = CardListComponent(children=node_cards)
+        # cards are already validated, and a card list has no validators
+        node_card_list = CardListComponent.trusted(
+            children=node_cards, pagination=pagination
+        )
 
         return node_card_list
 
     def nodes_to_table(
-        self, nodes: list[BaseNode], fields: Optional[list] = None
+        self,
+        nodes: Union[list[BaseNode], NodePage],
+        fields: Optional[list] = None,
+        server_side: bool = False,
     ) -> NodeListTableComponent:
+        if server_side is True:
+            # rows are fetched a page at a time, from the table data endpoint
+            return NodeListTableComponent(
+                model=self.model,
+                url_pattern=self.item_url_pattern(),
+                fields=fields,
+                datatable_server_url=self.table_data_url(),
+                datatable_ordering=True,
+            )
+
+        pagination = None
+
+        if isinstance(nodes, NodePage):
+            pagination = self.pagination(nodes)
+            nodes = nodes.nodes
+
         node_list_table = NodeListTableComponent(
-            nodes=nodes, url_pattern=self.item_url_pattern(), fields=fields
+            nodes=nodes,
+            url_pattern=self.item_url_pattern(),
+            fields=fields,
+            pagination=pagination,
         )
 
         return node_list_table
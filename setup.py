@@ -17,4 +17,7 @@ setup(
         "PyYAML",
         "spectree",
     ],
+    extras_require={
+        "async": ["flask[async]"],
+    },
 )
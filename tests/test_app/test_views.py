@@ -37,3 +37,13 @@ def test_api_view_related(test_client):
 
     assert {"name": "Author 2"} in response.json
     assert {"name": "Author 3"} in response.json
+
+
+def test_api_view_include(test_client):
+    response = test_client.get(
+        "/api/v1/pages/page-2.json", query_string={"include": "authors"}
+    )
+
+    assert response.status_code == 200
+
+    assert {"name": "Author 2"} in response.json["authors"]
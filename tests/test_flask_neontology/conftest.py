@@ -18,6 +18,7 @@ from flask_neontology.components import (
     TextComponent,
 )
 from flask_neontology.views import (
+    RelatedResource,
     page_element,
     page_section,
 )
@@ -50,8 +51,7 @@ class DummyListView(NeontologyListView):
 
     @page_section(title=None)
     def pages(self) -> CardListComponent:
-        nodes = self.viewset.match_nodes()
-        return self.viewset.nodes_to_cards(nodes)
+        return self.viewset.nodes_to_cards(self.match_page())
 
 
 class DummyNodeView(NeontologyNodeView):
@@ -83,7 +83,10 @@ class DummyAPIView(NeontologyAPIView):
     resource_name = "dummies"
     tag_description = "API endpoints for dummy nodes."
 
-    related_resources = {"dum-dummies": (DummyNode, "get_related_dum_dummies")}
+    related_resources = {
+        "dum-dummies": (DummyNode, "get_related_dum_dummies"),
+        "dum-links": RelatedResource(DummyNode, "DUMMY_RELATIONSHIP"),
+    }
 
     def get_related_dum_dummies(self, pp: str):
         this_node = self.match_node(pp)
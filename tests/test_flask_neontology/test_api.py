@@ -1,3 +1,7 @@
+import json
+import re
+
+
 def test_list(mini_client):
     response = mini_client.get("/api/v1/dummies.json")
 
@@ -22,3 +26,523 @@ def test_related(mini_client):
     assert response.json == [
         {"description": None, "name": "bar"},
     ]
+
+
+def test_list_not_modified(mini_client):
+    response = mini_client.get("/api/v1/dummies.json")
+
+    etag = response.headers["ETag"]
+
+    cached_response = mini_client.get(
+        "/api/v1/dummies.json", headers={"If-None-Match": etag}
+    )
+
+    assert cached_response.status_code == 304
+    assert cached_response.data == b""
+
+
+def test_item_not_modified(mini_client):
+    response = mini_client.get("/api/v1/dummies/foo.json")
+
+    etag = response.headers["ETag"]
+
+    cached_response = mini_client.get(
+        "/api/v1/dummies/foo.json", headers={"If-None-Match": etag}
+    )
+
+    assert cached_response.status_code == 304
+
+    other_response = mini_client.get(
+        "/api/v1/dummies/bar.json", headers={"If-None-Match": etag}
+    )
+
+    assert other_response.status_code == 200
+
+
+def test_generation_etags(mini_app, mini_client, monkeypatch):
+    from unittest import mock
+
+    from neontology import GraphConnection
+
+    from .conftest import DummyAPIView
+
+    monkeypatch.setattr(DummyAPIView, "generation_etags", True)
+
+    etag = mini_client.get("/api/v1/dummies.json").headers["ETag"]
+
+    # answered without querying the graph
+    with mock.patch.object(GraphConnection, "evaluate_query") as evaluate_query:
+        cached_response = mini_client.get(
+            "/api/v1/dummies.json", headers={"If-None-Match": etag}
+        )
+
+    assert cached_response.status_code == 304
+    evaluate_query.assert_not_called()
+
+    mini_app.neontology_manager.changes.changed(["DummyNode"])
+
+    updated_response = mini_client.get(
+        "/api/v1/dummies.json", headers={"If-None-Match": etag}
+    )
+
+    assert updated_response.status_code == 200
+
+
+def test_list_paged(mini_client):
+    response = mini_client.get("/api/v1/dummies.json", query_string={"limit": 1})
+
+    assert response.json == [{"description": None, "name": "bar"}]
+    assert response.headers["X-Total-Count"] == "2"
+
+    links = {
+        rel: url
+        for url, rel in re.findall(r'<([^>]+)>; rel="(\w+)"', response.headers["Link"])
+    }
+
+    assert "prev" not in links
+
+    next_response = mini_client.get(links["next"])
+
+    assert next_response.json == [{"description": None, "name": "foo"}]
+    assert 'rel="next"' not in next_response.headers["Link"]
+    assert 'rel="prev"' in next_response.headers["Link"]
+
+
+def test_list_max_page_size(mini_client, monkeypatch):
+    from .conftest import DummyAPIView
+
+    monkeypatch.setattr(DummyAPIView, "max_page_size", 1)
+
+    response = mini_client.get("/api/v1/dummies.json", query_string={"limit": 50})
+
+    assert len(response.json) == 1
+
+
+def test_list_invalid_cursor(mini_client):
+    response = mini_client.get("/api/v1/dummies.json?cursor=not-a-cursor")
+
+    assert response.status_code == 400
+
+
+def test_list_ndjson(mini_client):
+    response = mini_client.get(
+        "/api/v1/dummies.json", headers={"Accept": "application/x-ndjson"}
+    )
+
+    assert response.is_streamed
+    assert response.mimetype == "application/x-ndjson"
+
+    items = [json.loads(line) for line in response.data.splitlines()]
+
+    assert {"description": None, "name": "foo"} in items
+    assert {"description": None, "name": "bar"} in items
+
+
+def test_list_streamed(mini_client, monkeypatch):
+    from .conftest import DummyAPIView
+
+    monkeypatch.setattr(DummyAPIView, "stream", True)
+    monkeypatch.setattr(DummyAPIView, "stream_fetch_size", 1)
+
+    response = mini_client.get("/api/v1/dummies.json")
+
+    assert response.is_streamed
+    assert "ETag" not in response.headers
+    assert {"description": None, "name": "foo"} in response.json
+    assert {"description": None, "name": "bar"} in response.json
+
+    related_response = mini_client.get("/api/v1/dummies/foo/dum-dummies.json")
+
+    assert related_response.json == [{"description": None, "name": "bar"}]
+
+
+def test_stream_json_array():
+    from flask_neontology.views.streaming import stream_json_array
+
+    chunks = list(stream_json_array(range(5), json.dumps, chunk_size=2))
+
+    assert chunks == ["[", "0,1", ",2,3", ",4", "]"]
+    assert json.loads("".join(chunks)) == [0, 1, 2, 3, 4]
+    assert "".join(stream_json_array([], json.dumps)) == "[]"
+
+
+def test_encode_items():
+    from flask import Flask
+
+    from .conftest import DummyAPIView, DummyNode
+
+    class CustomAPIView(DummyAPIView):
+        def serialize_item(self, item):
+            return {"name": item.name.upper()}
+
+    nodes = [DummyNode(name="foo"), DummyNode(name="bar", description="Bar")]
+
+    with Flask("TestAPP").app_context():
+        assert json.loads(DummyAPIView().encode_items(nodes)) == [
+            {"name": "foo", "description": None},
+            {"name": "bar", "description": "Bar"},
+        ]
+        assert json.loads(DummyAPIView().encode_item(nodes[0])) == {
+            "name": "foo",
+            "description": None,
+        }
+
+        # overridden serialize_item is still used
+        assert json.loads(CustomAPIView().encode_items(nodes)) == [
+            {"name": "FOO"},
+            {"name": "BAR"},
+        ]
+
+
+def test_encode_items_model_json():
+    from datetime import datetime, timezone
+
+    from flask import Flask, jsonify
+
+    from .conftest import DummyAPIView, DummyNode
+
+    class DatedNode(DummyNode):
+        published: datetime
+
+    class ModelJSONAPIView(DummyAPIView):
+        model_json = True
+
+    node = DatedNode(
+        name="foo", published=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    )
+
+    with Flask("TestAPP").app_context():
+        # the existing encoding: sorted keys and HTTP dates, as jsonify
+        assert json.loads(DummyAPIView().encode_item(node)) == (
+            jsonify(node.model_dump()).json
+        )
+        assert list(json.loads(DummyAPIView().encode_item(node))) == [
+            "description",
+            "name",
+            "published",
+        ]
+        assert b"Tue, 02 Jan 2024 03:04:05 GMT" in DummyAPIView().encode_item(node)
+
+        data = json.loads(ModelJSONAPIView().encode_item(node))
+
+        assert list(data) == ["name", "description", "published"]
+        assert data["published"] == "2024-01-02T03:04:05Z"
+
+
+def test_custom_serialize_item(mini_client, monkeypatch):
+    from .conftest import DummyAPIView
+
+    monkeypatch.setattr(
+        DummyAPIView, "serialize_item", lambda self, item: item.model_dump()
+    )
+
+    response = mini_client.get("/api/v1/dummies/foo.json")
+
+    assert response.json == {"description": None, "name": "foo"}
+
+
+def test_list_fields(mini_client):
+    response = mini_client.get("/api/v1/dummies.json", query_string={"fields": "name"})
+
+    assert {"name": "foo"} in response.json
+    assert {"name": "bar"} in response.json
+
+    paged_response = mini_client.get(
+        "/api/v1/dummies.json", query_string={"fields": "name", "limit": 1}
+    )
+
+    assert paged_response.json == [{"name": "bar"}]
+    assert "fields=name" in paged_response.headers["Link"]
+
+
+def test_item_fields(mini_client):
+    response = mini_client.get(
+        "/api/v1/dummies/foo.json", query_string={"fields": "description,name"}
+    )
+
+    assert response.json == {"description": None, "name": "foo"}
+
+    related_response = mini_client.get(
+        "/api/v1/dummies/foo/dum-dummies.json", query_string={"fields": "name"}
+    )
+
+    assert related_response.json == [{"name": "bar"}]
+
+
+def test_unknown_fields(mini_client):
+    response = mini_client.get(
+        "/api/v1/dummies.json", query_string={"fields": "name,nope"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_cache_labels_sorted():
+    from flask_neontology.views import NeontologyAPIView, RelatedResource
+
+    from .conftest import DummyNode
+
+    class OtherNode:
+        __primarylabel__ = "AnOtherNode"
+
+    class SortedAPIView(NeontologyAPIView):
+        model = DummyNode
+        related_resources = {"others": RelatedResource(OtherNode, "OTHER")}
+
+    # generations are added to cache keys in this order, in every process
+    assert SortedAPIView.cache_labels() == ("AnOtherNode", "DummyNode")
+
+
+def test_select_fields(monkeypatch):
+    from flask import Flask
+
+    from flask_neontology.views import apiview
+
+    from .conftest import DummyAPIView, DummyNode
+
+    class CustomAPIView(DummyAPIView):
+        def serialize_item(self, item):
+            return {"name": item.name.upper(), "description": item.description}
+
+    node = DummyNode(name="foo", description="Foo")
+
+    with Flask("TestAPP").app_context():
+        assert json.loads(DummyAPIView().encode_item(node, ["name"])) == {"name": "foo"}
+        assert json.loads(CustomAPIView().encode_item(node, ["name"])) == {
+            "name": "FOO"
+        }
+
+    # custom serialization can't be pushed into the query
+    monkeypatch.setattr(apiview, "bolt_driver", lambda: object())
+
+    assert DummyAPIView().projects_fields("get_all")
+    assert not CustomAPIView().projects_fields("get_all")
+
+    # nor can engines which don't return maps
+    monkeypatch.setattr(apiview, "bolt_driver", lambda: None)
+
+    assert not DummyAPIView().projects_fields("get_all")
+
+
+def test_to_native():
+    import datetime
+
+    from neo4j.time import DateTime
+
+    from flask_neontology.records import to_native
+
+    created = DateTime(2024, 5, 1, 12, 30)
+
+    assert to_native({"name": "foo", "created": created, "tags": [created]}) == {
+        "name": "foo",
+        "created": datetime.datetime(2024, 5, 1, 12, 30),
+        "tags": [datetime.datetime(2024, 5, 1, 12, 30)],
+    }
+
+
+def test_list_filtered(mini_client, monkeypatch):
+    from .conftest import DummyAPIView
+
+    monkeypatch.setattr(DummyAPIView, "filterable_fields", ("name",))
+    monkeypatch.setattr(DummyAPIView, "sortable_fields", ("name",))
+
+    response = mini_client.get("/api/v1/dummies.json", query_string={"name": "foo"})
+
+    assert response.json == [{"description": None, "name": "foo"}]
+
+    in_response = mini_client.get(
+        "/api/v1/dummies.json", query_string={"name__in": "foo,bar", "sort": "-name"}
+    )
+
+    assert [item["name"] for item in in_response.json] == ["foo", "bar"]
+
+    paged_response = mini_client.get(
+        "/api/v1/dummies.json", query_string={"name__prefix": "f", "limit": 1}
+    )
+
+    assert paged_response.json == [{"description": None, "name": "foo"}]
+    assert paged_response.headers["X-Total-Count"] == "1"
+    assert 'rel="next"' not in paged_response.headers["Link"]
+
+
+def test_list_sorted_by_optional_field(mini_client, monkeypatch):
+    from .conftest import DummyAPIView, DummyNode
+
+    monkeypatch.setattr(DummyAPIView, "sortable_fields", ("description",))
+
+    DummyNode(name="baz", description="example").merge()
+
+    names = []
+    url = "/api/v1/dummies.json?sort=-description&limit=1"
+
+    # nulls sort first descending, and paging carries on past them
+    while url:
+        response = mini_client.get(url)
+        names += [item["name"] for item in response.json]
+
+        links = {
+            rel: link
+            for link, rel in re.findall(
+                r'<([^>]+)>; rel="(\w+)"', response.headers["Link"]
+            )
+        }
+        url = links.get("next")
+
+    assert names == ["bar", "foo", "baz"]
+
+
+def test_list_invalid_filter(mini_client, monkeypatch):
+    from .conftest import DummyAPIView
+
+    monkeypatch.setattr(DummyAPIView, "filterable_fields", ("name",))
+
+    not_filterable = mini_client.get(
+        "/api/v1/dummies.json", query_string={"description": "foo"}
+    )
+
+    assert not_filterable.status_code == 400
+
+    unknown_operator = mini_client.get(
+        "/api/v1/dummies.json", query_string={"name__like": "foo"}
+    )
+
+    assert unknown_operator.status_code == 400
+
+
+def test_overridden_list_configuration():
+    import pytest
+
+    from .conftest import DummyAPIView
+
+    class FilteredAPIView(DummyAPIView):
+        filterable_fields = ("name",)
+
+        def get_all(self):
+            return []
+
+    class PagedAPIView(DummyAPIView):
+        page_size = 10
+
+        def get_all(self):
+            return []
+
+    # filters wouldn't be applied, and pages wouldn't match the list
+    with pytest.raises(ValueError):
+        FilteredAPIView.validate_configuration()
+
+    with pytest.raises(ValueError):
+        PagedAPIView.validate_configuration()
+
+    PagedAPIView.get_page = lambda self, limit, cursor=None: None
+
+    PagedAPIView.validate_configuration()
+
+
+def test_overridden_list_not_paged():
+    from flask import Flask
+
+    from .conftest import DummyAPIView
+
+    class ListAPIView(DummyAPIView):
+        def get_all(self):
+            return []
+
+    app = Flask("TestAPP")
+
+    with app.test_request_context("/api/v1/dummies.json?limit=1"):
+        response = ListAPIView().get()
+
+    assert response[1] == 400
+
+
+def test_filter_clause():
+    from flask_neontology.views.query import filter_clause
+
+    assert filter_clause([]) is None
+
+    assert filter_clause([("status", "in"), ("created", "gte")]) == (
+        "(n.`status` IN $filter_0 AND n.`created` >= $filter_1)"
+    )
+
+
+def test_batch(mini_client):
+    response = mini_client.get(
+        "/api/v1/dummies/batch.json", query_string={"ids": "foo,nope,bar"}
+    )
+
+    assert response.json == {
+        "items": [
+            {"description": None, "name": "foo"},
+            None,
+            {"description": None, "name": "bar"},
+        ],
+        "not_found": ["nope"],
+    }
+
+    post_response = mini_client.post(
+        "/api/v1/dummies/batch.json?fields=name", json={"ids": ["bar", "foo"]}
+    )
+
+    assert post_response.json == {
+        "items": [{"name": "bar"}, {"name": "foo"}],
+        "not_found": [],
+    }
+
+
+def test_batch_too_many(mini_client, monkeypatch):
+    from .conftest import DummyAPIView
+
+    monkeypatch.setattr(DummyAPIView, "max_batch_size", 1)
+
+    response = mini_client.get(
+        "/api/v1/dummies/batch.json", query_string={"ids": "foo,bar"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_related_resource(mini_client):
+    response = mini_client.get("/api/v1/dummies/foo/dum-links.json")
+
+    assert response.json == [{"description": None, "name": "bar"}]
+
+    # bar exists, but has no outgoing links
+    empty_response = mini_client.get("/api/v1/dummies/bar/dum-links.json")
+
+    assert empty_response.status_code == 200
+    assert empty_response.json == []
+
+    missing_response = mini_client.get("/api/v1/dummies/nope/dum-links.json")
+
+    assert missing_response.status_code == 404
+
+
+def test_include(mini_client):
+    response = mini_client.get(
+        "/api/v1/dummies.json", query_string={"include": "dum-links"}
+    )
+
+    assert {
+        "description": None,
+        "name": "foo",
+        "dum-links": [{"description": None, "name": "bar"}],
+    } in response.json
+    assert {"description": None, "name": "bar", "dum-links": []} in response.json
+
+    detail_response = mini_client.get(
+        "/api/v1/dummies/foo.json",
+        query_string={"include": "dum-links", "fields": "description"},
+    )
+
+    assert detail_response.json == {
+        "description": None,
+        "name": "foo",
+        "dum-links": [{"description": None, "name": "bar"}],
+    }
+
+    # resources fetched by a method can't be included
+    invalid_response = mini_client.get(
+        "/api/v1/dummies.json", query_string={"include": "dum-dummies"}
+    )
+
+    assert invalid_response.status_code == 400
@@ -0,0 +1,122 @@
+import re
+
+from flask import Flask, render_template_string
+
+from flask_neontology.assets import NeontologyAssets, vendored_assets_filter
+from flask_neontology.neontology_manager import bp
+
+JQUERY_URL = "https://code.jquery.com/jquery-3.7.1.min.js"
+BOOTSTRAP_CSS_URL = (
+    "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css"
+)
+BOOTSTRAP_JS_URL = (
+    "https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js"
+)
+
+
+def make_app(assets: NeontologyAssets) -> Flask:
+    app = Flask(__name__)
+    app.register_blueprint(bp)
+    app.add_template_filter(vendored_assets_filter, "neontology_assets")
+
+    class Manager:
+        pass
+
+    app.neontology_manager = Manager()
+    app.neontology_manager.assets = assets
+
+    return app
+
+
+def test_vendor_assets(tmp_path):
+    assets = NeontologyAssets(tmp_path)
+
+    manifest = assets.vendor({JQUERY_URL: "jquery.min.js"}, fetch=lambda url: b"$")
+
+    filename = manifest[JQUERY_URL]
+
+    # the content hash goes before the final extension
+    assert re.fullmatch(r"jquery\.min\.[0-9a-f]{12}\.js", filename)
+    assert (tmp_path / filename).read_bytes() == b"$"
+
+    # the manifest is persisted
+    assert NeontologyAssets(tmp_path).manifest == manifest
+
+
+def test_vendored_filename_changes_with_content(tmp_path):
+    assets = NeontologyAssets(tmp_path)
+
+    first = assets.vendor({JQUERY_URL: "jquery.min.js"}, fetch=lambda url: b"a")
+    first_filename = first[JQUERY_URL]
+
+    second = assets.vendor({JQUERY_URL: "jquery.min.js"}, fetch=lambda url: b"b")
+
+    assert second[JQUERY_URL] != first_filename
+
+
+def test_rewrite_headtag(tmp_path):
+    assets = NeontologyAssets(tmp_path)
+    assets.vendor({JQUERY_URL: "jquery.min.js"}, fetch=lambda url: b"$")
+
+    app = make_app(assets)
+
+    tag = f'<script src="{JQUERY_URL}"></script>'
+    other_tag = '<script src="https://example.com/other.js"></script>'
+
+    with app.test_request_context():
+        assert assets.rewrite(tag) == (
+            f'<script src="/neontology/assets/{assets.manifest[JQUERY_URL]}"></script>'
+        )
+        assert assets.rewrite(other_tag) == other_tag
+
+
+def test_rewrite_default_template(tmp_path):
+    assets = NeontologyAssets(tmp_path)
+    assets.vendor(
+        {
+            BOOTSTRAP_CSS_URL: "bootstrap.min.css",
+            BOOTSTRAP_JS_URL: "bootstrap.bundle.min.js",
+        },
+        fetch=lambda url: url.encode(),
+    )
+
+    app = make_app(assets)
+
+    with app.test_request_context():
+        html = render_template_string(
+            '{% extends "neontology/neontology_default.html" %}'
+        )
+
+    assert BOOTSTRAP_CSS_URL not in html
+    assert BOOTSTRAP_JS_URL not in html
+    assert f'href="/neontology/assets/{assets.manifest[BOOTSTRAP_CSS_URL]}"' in html
+    assert f'src="/neontology/assets/{assets.manifest[BOOTSTRAP_JS_URL]}"' in html
+
+
+def test_rewrite_without_manifest(tmp_path):
+    assets = NeontologyAssets(tmp_path)
+
+    tag = f'<script src="{JQUERY_URL}"></script>'
+
+    assert assets.rewrite(tag) == tag
+
+
+def test_serve_asset(tmp_path):
+    assets = NeontologyAssets(tmp_path)
+    assets.vendor({JQUERY_URL: "jquery.min.js"}, fetch=lambda url: b"$")
+
+    client = make_app(assets).test_client()
+
+    response = client.get(f"/neontology/assets/{assets.manifest[JQUERY_URL]}")
+
+    assert response.status_code == 200
+    assert response.data == b"$"
+    assert response.cache_control.max_age == 31536000
+    assert response.cache_control.immutable is True
+
+    response.close()
+
+    assert client.get("/neontology/assets/missing.js").status_code == 404
+
+    # only vendored assets are served, not the manifest
+    assert client.get("/neontology/assets/manifest.json").status_code == 404
@@ -0,0 +1,90 @@
+from flask import Flask
+
+from flask_neontology import (
+    AsyncNeontologyAPIView,
+    AsyncNeontologyListView,
+    AsyncNeontologyNodeView,
+    NeontologyManager,
+    NeontologyViewset,
+)
+from flask_neontology.components import TextComponent
+from flask_neontology.views import page_section
+
+from .conftest import DummyNode
+
+
+class AsyncDummyViewset(NeontologyViewset):
+    model = DummyNode
+    slug = "async-dummies"
+
+
+class AsyncDummyListView(AsyncNeontologyListView):
+    viewset_handler = AsyncDummyViewset
+
+    @page_section(title=None)
+    def pages(self):
+        nodes = self.viewset.match_nodes()
+        return self.viewset.nodes_to_cards(nodes)
+
+
+class AsyncDummyNodeView(AsyncNeontologyNodeView):
+    viewset_handler = AsyncDummyViewset
+
+    @page_section(title=None)
+    def content(self):
+        return TextComponent(text=f"{self.node.name} CONTENT")
+
+    @page_section(title=None, serial=True)
+    def more_content(self):
+        return TextComponent(text=f"{self.node.name} MORE")
+
+
+class AsyncDummyAPIView(AsyncNeontologyAPIView):
+    model = DummyNode
+    resource_name = "async-dummies"
+    tag_description = "Async API endpoints for dummy nodes."
+
+
+def test_async_views(get_graph_config, populate_dummy_nodes):
+    nm = NeontologyManager()
+
+    app = Flask("TestAPP")
+
+    nm.init_app(
+        app=app,
+        graph_config=get_graph_config,
+        views=[AsyncDummyListView, AsyncDummyNodeView],
+        api_views={"v1": [AsyncDummyAPIView]},
+    )
+
+    test_client = app.test_client()
+
+    response = test_client.get("/async-dummies/")
+
+    assert response.status_code == 200
+    assert b"foo" in response.data
+
+    response = test_client.get("/async-dummies/foo/")
+
+    assert response.status_code == 200
+    assert response.data.index(b"foo CONTENT") < response.data.index(b"foo MORE")
+
+    response = test_client.get("/api/v1/async-dummies/foo.json")
+
+    assert response.json == {"description": None, "name": "foo"}
+
+    response = test_client.get("/api/v1/async-dummies/nope.json")
+
+    assert response.status_code == 404
+
+    response = test_client.get("/api/v1/async-dummies.json", query_string={"limit": 1})
+
+    assert response.json == [{"description": None, "name": "bar"}]
+    assert 'rel="next"' in response.headers["Link"]
+
+    response = test_client.get(
+        "/api/v1/async-dummies.json", headers={"Accept": "application/x-ndjson"}
+    )
+
+    assert response.is_streamed
+    assert len(response.data.splitlines()) == 2
@@ -69,3 +69,109 @@ def test_add_node_rel_post(mini_client):
     assert post_response.status_code == 200
 
     assert b"bar" in post_response.data
+
+
+def test_node_page_query_count(mini_client, monkeypatch):
+    """Each page section should be evaluated (and so query the graph) only once.
+
+    The node page makes one query to match the node, then one each for the
+    outgoing relationships and graph sections. Evaluating each section twice
+    would take this from 3 queries to 5.
+    """
+    from neontology import GraphConnection
+
+    query_count = 0
+    evaluate_query = GraphConnection.evaluate_query
+
+    def counting_evaluate_query(self, *args, **kwargs):
+        nonlocal query_count
+        query_count += 1
+        return evaluate_query(self, *args, **kwargs)
+
+    monkeypatch.setattr(GraphConnection, "evaluate_query", counting_evaluate_query)
+
+    response = mini_client.get("/autograph/DummyNode/node/foo/")
+
+    assert response.status_code == 200
+    assert query_count == 3
+
+
+def test_render_plan_built_at_registration(mini_app):
+    from flask_neontology.autograph import LabelView
+
+    plan = LabelView.__dict__["_render_plan"]
+
+    assert [name for name, _ in plan.sections] == [
+        "node_table",
+        "outgoing_relationships",
+        "graph_section",
+    ]
+
+
+def test_label_page_schema_cached(mini_app, mini_client):
+    fragment_cache = mini_app.neontology_manager.fragment_cache
+
+    response = mini_client.get("/autograph/DummyNode/")
+    assert response.status_code == 200
+    assert b"Schema" in response.data
+
+    hits = fragment_cache.stats()["hits"]
+
+    cached_response = mini_client.get("/autograph/DummyNode/")
+    assert b"Schema" in cached_response.data
+
+    assert fragment_cache.stats()["hits"] == hits + 1
+
+
+def test_node_page_stable_output(mini_client):
+    first = mini_client.get("/autograph/DummyNode/node/foo/")
+    second = mini_client.get("/autograph/DummyNode/node/foo/")
+
+    assert first.data == second.data
+
+
+def test_label_table_data(mini_client):
+    response = mini_client.get(
+        "/autograph/DummyNode/table.json",
+        query_string={
+            "draw": 2,
+            "start": 0,
+            "length": 1,
+            "order[0][column]": 0,
+            "order[0][dir]": "desc",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json["draw"] == 2
+    assert response.json["recordsTotal"] == 2
+    assert response.json["recordsFiltered"] == 2
+    assert len(response.json["data"]) == 1
+    assert response.json["data"][0]["__str__"] == "foo"
+    assert (
+        response.json["data"][0]["fn_node_link_field"]
+        == "/autograph/DummyNode/node/foo/"
+    )
+
+
+def test_label_table_data_search(mini_client):
+    response = mini_client.get(
+        "/autograph/DummyNode/table.json",
+        query_string={"draw": 1, "start": 0, "length": 10, "search[value]": "BA"},
+    )
+
+    assert response.json["recordsTotal"] == 2
+    assert response.json["recordsFiltered"] == 1
+    assert response.json["data"][0]["name"] == "bar"
+
+
+def test_label_page_server_side_table(mini_app, mini_client, monkeypatch):
+    from flask_neontology.autograph import AutographViewset
+
+    monkeypatch.setattr(AutographViewset, "server_side_table_threshold", 1)
+
+    response = mini_client.get("/autograph/DummyNode/")
+
+    assert response.status_code == 200
+    assert b"/autograph/DummyNode/table.json" in response.data
+    assert b"/autograph/DummyNode/node/foo/" not in response.data
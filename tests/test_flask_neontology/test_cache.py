@@ -0,0 +1,98 @@
+import time
+
+from flask_neontology.cache import LRUCache, TaggedCache
+
+
+def test_lru_get_set():
+    cache = LRUCache(max_entries=2)
+
+    cache.set("foo", 1)
+
+    assert cache.get("foo") == 1
+    assert cache.get("bar") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_lru_eviction():
+    cache = LRUCache(max_entries=2)
+
+    cache.set("foo", 1)
+    cache.set("bar", 2)
+
+    # using foo makes bar the least recently used entry
+    cache.get("foo")
+    cache.set("baz", 3)
+
+    assert cache.get("foo") == 1
+    assert cache.get("bar") is None
+    assert cache.get("baz") == 3
+    assert len(cache) == 2
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_ttl():
+    cache = LRUCache(default_ttl=60)
+
+    cache.set("foo", 1, ttl=0.01)
+    cache.set("bar", 2)
+
+    time.sleep(0.02)
+
+    assert cache.get("foo") is None
+    assert cache.get("bar") == 2
+
+
+def test_lru_delete_and_clear():
+    cache = LRUCache()
+
+    cache.set("foo", 1)
+    cache.set("bar", 2)
+    cache.delete("foo")
+
+    assert cache.get("foo") is None
+
+    cache.clear()
+
+    assert cache.get("bar") is None
+
+
+def test_tagged_invalidate():
+    cache = TaggedCache(LRUCache())
+
+    cache.set("pages", 1, tags=["Page"])
+    cache.set("authors", 2, tags=["Author"])
+    cache.set("page-authors", 3, tags=["Page", "Author"])
+
+    cache.invalidate("Page")
+
+    assert cache.get("pages") is None
+    assert cache.get("page-authors") is None
+    assert cache.get("authors") == 2
+    assert cache.stats()["invalidations"] == 2
+
+
+def test_tagged_forgets_evicted_keys():
+    cache = TaggedCache(LRUCache(max_entries=10))
+
+    for index in range(100):
+        cache.set(f"page-{index}", index, tags=["Page"])
+
+    assert len(cache._tags) == 10
+    assert len(cache._keys["Page"]) == 10
+
+    cache.invalidate("Page")
+
+    assert cache._tags == {}
+    assert cache._keys == {}
+
+
+def test_tagged_forgets_expired_keys():
+    cache = TaggedCache(LRUCache(default_ttl=0.01))
+
+    cache.set("foo", 1, tags=["Page"])
+
+    time.sleep(0.02)
+
+    assert cache.get("foo") is None
+    assert cache._keys == {}
@@ -0,0 +1,142 @@
+from flask_neontology.changes import ChangeTracker, WatermarkWatcher
+
+from .conftest import DummyNode, DummyRelationship
+
+
+def test_changed():
+    changes = ChangeTracker()
+
+    assert changes.generations(["DummyNode"], ["DUMMY_RELATIONSHIP"]) == (0, 0)
+
+    changes.changed(["DummyNode"])
+    changes.changed(["DummyNode"], ["DUMMY_RELATIONSHIP"])
+
+    assert changes.generations(["DummyNode"], ["DUMMY_RELATIONSHIP"]) == (2, 1)
+
+
+def test_record():
+    changes = ChangeTracker()
+
+    seen = []
+    changes.subscribe(lambda labels, rel_types: seen.append((labels, rel_types)))
+
+    foo = DummyNode(name="foo")
+    bar = DummyNode(name="bar")
+
+    changes.record(foo)
+    changes.record(DummyRelationship(source=foo, target=bar))
+
+    assert changes.generations(["DummyNode"], ["DUMMY_RELATIONSHIP"]) == (2, 1)
+    assert seen == [(("DummyNode",), ()), (("DummyNode",), ("DUMMY_RELATIONSHIP",))]
+
+
+def test_watermark_watcher(use_graph):
+    changes = ChangeTracker()
+    watcher = WatermarkWatcher(changes)
+
+    # a local change moves the watermark, for other processes to see
+    changes.changed(["DummyNode"])
+
+    watcher.poll()
+
+    # another process writes
+    use_graph.evaluate_query_single(
+        "MERGE (w:NeontologyWatermark {key: 'label:DummyNode'}) "
+        "SET w.generation = w.generation + 1"
+    )
+
+    watcher.poll()
+
+    assert changes.generations(["DummyNode"]) == (2,)
+    assert watcher.stats()["moves"] == 1
+
+    # the watcher doesn't count its own process's changes again
+    changes.changed(["DummyNode"])
+
+    watcher.poll()
+
+    assert changes.generations(["DummyNode"]) == (3,)
+    assert watcher.stats()["moves"] == 1
+
+
+def fake_watermarks(monkeypatch, watermarks):
+    """Serve the watcher's queries from a dict of watermarks, returning the list
+    of query parameters it's called with."""
+    from flask_neontology import changes as changes_module
+
+    calls = []
+
+    def match_rows(cypher, params=None):
+        calls.append(params)
+
+        if params is None:
+            return [{"key": key, "generation": g} for key, g in watermarks.items()]
+
+        for bump in params["bumps"]:
+            watermarks[bump["key"]] = watermarks.get(bump["key"], 0) + bump["count"]
+
+        return [
+            {"key": bump["key"], "generation": watermarks[bump["key"]]}
+            for bump in params["bumps"]
+        ]
+
+    monkeypatch.setattr(changes_module, "match_rows", match_rows)
+
+    return calls
+
+
+def test_watermark_watcher_batches_bumps(monkeypatch):
+    watermarks = {"label:DummyNode": 1}
+    calls = fake_watermarks(monkeypatch, watermarks)
+
+    changes = ChangeTracker()
+    watcher = WatermarkWatcher(changes)
+
+    watcher.poll()
+
+    # local changes don't write to the graph until the next poll
+    changes.changed(["DummyNode"])
+    changes.changed(["DummyNode"])
+
+    assert len(calls) == 1
+
+    watcher.poll()
+
+    assert calls[1] == {"bumps": [{"key": "label:DummyNode", "count": 2}]}
+    assert changes.generations(["DummyNode"]) == (2,)
+    assert watcher.stats()["moves"] == 0
+
+    # another process moves the watermark before this one's change is written
+    watermarks["label:DummyNode"] += 1
+    changes.changed(["DummyNode"])
+
+    watcher.poll()
+
+    assert changes.generations(["DummyNode"]) == (4,)
+    assert watcher.stats()["moves"] == 1
+
+
+def test_watermark_watcher_shared_store(monkeypatch):
+    from flask_neontology import changes as changes_module
+    from flask_neontology.changes import MemoryGenerationStore
+
+    class SharedStore(MemoryGenerationStore):
+        shared = True
+
+    # a watermark moved since any process last claimed it
+    claimed = [{"key": "label:DummyNode"}]
+    monkeypatch.setattr(
+        changes_module, "match_rows", lambda cypher, params=None: claimed
+    )
+
+    changes = ChangeTracker(SharedStore())
+    watcher = WatermarkWatcher(changes)
+
+    # other processes already see local changes, so there's nothing to write
+    changes.changed(["DummyNode"])
+
+    watcher.flush()
+    watcher.poll()
+
+    assert changes.generations(["DummyNode"]) == (2,)
+    assert watcher.stats()["moves"] == 1
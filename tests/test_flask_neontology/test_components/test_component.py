@@ -0,0 +1,174 @@
+from typing import ClassVar
+
+import pytest
+from pydantic import field_validator
+
+from flask_neontology.components import (
+    CardComponent,
+    CardListComponent,
+    ColumnData,
+    LinkComponent,
+    NodeListTableComponent,
+    PaginationComponent,
+    TableComponent,
+    TextComponent,
+)
+from flask_neontology.components.component import (
+    Component,
+    component_id_scope,
+    template_cache,
+)
+
+
+class GreetingComponent(Component):
+    template: ClassVar = "<p>Hello {{data.name}}</p>"
+    name: str
+
+
+class ShoutingComponent(GreetingComponent):
+    template: ClassVar = "<p>HELLO {{data.name}}</p>"
+
+
+def test_template_compiled_once(mini_app):
+    template_cache.clear()
+
+    with mini_app.app_context():
+        first = GreetingComponent(name="foo").render()
+        second = GreetingComponent(name="bar").render()
+
+    assert first == "<p>Hello foo</p>"
+    assert second == "<p>Hello bar</p>"
+    assert template_cache.stats()["misses"] == 1
+    assert template_cache.stats()["hits"] == 1
+
+
+def test_subclass_template_override(mini_app):
+    template_cache.clear()
+
+    with mini_app.app_context():
+        assert GreetingComponent(name="foo").render() == "<p>Hello foo</p>"
+        assert ShoutingComponent(name="foo").render() == "<p>HELLO foo</p>"
+
+    assert template_cache.stats()["misses"] == 2
+
+
+def test_template_reassignment(mini_app):
+    template_cache.clear()
+
+    class ChangingComponent(Component):
+        template: ClassVar = "<p>before</p>"
+
+    with mini_app.app_context():
+        assert ChangingComponent().render() == "<p>before</p>"
+        ChangingComponent.template = "<p>after</p>"
+        assert ChangingComponent().render() == "<p>after</p>"
+
+
+def test_builtin_components_use_cache(mini_app):
+    template_cache.clear()
+
+    with mini_app.app_context():
+        for _ in range(5):
+            TextComponent(text="foo").render()
+
+    assert template_cache.stats()["misses"] == 1
+    assert template_cache.stats()["hits"] == 4
+
+
+def test_component_ids_stable(mini_app):
+    columns = [ColumnData(title="Name", result_field="name")]
+    rows = [{"name": "foo"}]
+
+    with mini_app.app_context():
+        first = TableComponent(columns=columns, rows=rows)
+        second = TableComponent(columns=columns, rows=rows)
+
+    with mini_app.app_context():
+        rerendered = TableComponent(columns=columns, rows=rows)
+
+    assert first.table_id != second.table_id
+    assert first.table_id == rerendered.table_id
+
+
+def test_component_id_scope(mini_app):
+    columns = [ColumnData(title="Name", result_field="name")]
+
+    with mini_app.app_context():
+        with component_id_scope("section"):
+            table = TableComponent(columns=columns, rows=[])
+
+    assert table.table_id == "table_section_1"
+
+
+def test_component_ids_outside_app_context():
+    import threading
+
+    from flask_neontology.components.component import component_id
+
+    ids = []
+
+    def make_ids():
+        ids.append([component_id("table"), component_id("table")])
+
+    threads = [threading.Thread(target=make_ids) for _ in range(2)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    # unique within each thread, which don't share a counter
+    assert ids == [["table_c_1", "table_c_2"], ["table_c_1", "table_c_2"]]
+
+
+def _card_kwargs():
+    return dict(
+        title="foo",
+        subtitle="Dummies",
+        links=[LinkComponent(url="/dummies/foo/")],
+    )
+
+
+# the components (and arguments) the library builds with .trusted
+TRUSTED_COMPONENTS = {
+    "card_list": (
+        CardListComponent,
+        lambda: dict(
+            children=[CardComponent(**_card_kwargs())],
+            pagination=PaginationComponent(next_url="/dummies/?cursor=x"),
+        ),
+    ),
+    "pagination": (PaginationComponent, lambda: dict(prev_url="/dummies/?cursor=x")),
+}
+
+
+@pytest.mark.parametrize("name", TRUSTED_COMPONENTS)
+def test_trusted_component_parity(name):
+    component_class, make_kwargs = TRUSTED_COMPONENTS[name]
+
+    validated = component_class(**make_kwargs())
+    trusted = component_class.trusted(**make_kwargs())
+
+    assert type(trusted) is type(validated)
+    assert trusted.model_dump() == validated.model_dump()
+    assert trusted.model_fields_set == validated.model_fields_set
+
+
+class ValidatedComponent(Component):
+    name: str
+
+    @field_validator("name")
+    @classmethod
+    def strip(cls, v):
+        return v.strip()
+
+
+@pytest.mark.parametrize(
+    "component_class",
+    [ValidatedComponent, CardComponent, LinkComponent, NodeListTableComponent],
+)
+def test_trusted_component_rejects_validators(component_class):
+    # the validators would be skipped, so the component must be validated
+    with pytest.raises(TypeError):
+        component_class.trusted()
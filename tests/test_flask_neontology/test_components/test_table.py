@@ -0,0 +1,76 @@
+from typing import Optional
+
+from neontology import BaseNode
+
+from flask_neontology.components import NodeListTableComponent
+
+
+class TableTestNode(BaseNode):
+    __primarylabel__ = "TableTestNode"
+    __primaryproperty__ = "name"
+
+    name: str
+    description: Optional[str] = None
+    count: int = 0
+
+
+class CustomStrNode(TableTestNode):
+    __primarylabel__ = "CustomStrNode"
+
+    def __str__(self) -> str:
+        return f"Custom {self.name}"
+
+
+def test_node_list_table_rows_only_include_columns():
+    nodes = [TableTestNode(name=f"node {i}", count=i) for i in range(3)]
+
+    table = NodeListTableComponent(
+        nodes=nodes, url_pattern="/nodes/<pp>/", fields=["__str__", "count"]
+    )
+
+    # the link goes on the first column, as the primary property isn't shown
+    assert table.rows[0] == {
+        "__str__": "node 0",
+        "count": 0,
+        "fn_node_link_field": "/nodes/node%200/",
+    }
+    assert table.rows[2]["count"] == 2
+
+
+def test_node_list_table_link_field():
+    nodes = [TableTestNode(name="a b/c")]
+
+    table = NodeListTableComponent(nodes=nodes, url_pattern="/nodes/<pp>/")
+
+    assert table.columns[0].link_field == "fn_node_link_field"
+    assert table.rows[0]["fn_node_link_field"] == "/nodes/a%20b/c/"
+    assert table.rows[0]["name"] == "a b/c"
+    assert table.rows[0]["description"] is None
+
+
+def test_node_list_table_custom_str():
+    nodes = [CustomStrNode(name="foo")]
+
+    table = NodeListTableComponent(nodes=nodes, fields=["__str__", "__pp__"])
+
+    assert table.rows[0] == {"__str__": "Custom foo", "__pp__": "foo"}
+
+
+def test_node_list_table_server_side(mini_app):
+    table = NodeListTableComponent(
+        model=TableTestNode,
+        url_pattern="/nodes/<pp>/",
+        datatable_server_url="/nodes/table.json",
+    )
+
+    with mini_app.app_context():
+        html = table.render()
+
+    assert [column.result_field for column in table.columns] == [
+        "name",
+        "description",
+        "count",
+    ]
+    assert table.rows == []
+    assert '"serverSide": true' in html
+    assert '"ajax": "/nodes/table.json"' in html
@@ -75,3 +75,21 @@ def test_nm_init_views(get_graph_config, populate_dummy_nodes):
     response = test_client.get("/dummies/foo/test-endpoint")
 
     assert response.status_code == 200
+
+
+def test_nm_init_unindexed_order(get_graph_config, use_graph, monkeypatch, caplog):
+    from .conftest import DummyViewset
+
+    monkeypatch.setattr(DummyViewset, "order_by", "-description")
+
+    nm = NeontologyManager()
+
+    app = Flask("TestAPP")
+
+    nm.init_app(
+        app=app,
+        graph_config=get_graph_config,
+        views=[DummyListView],
+    )
+
+    assert "orders DummyNode nodes by 'description'" in caplog.text
@@ -0,0 +1,114 @@
+from typing import List
+
+import pytest
+from flask import Flask, jsonify, request, stream_with_context
+from pydantic import BaseModel
+from spectree import SpecTree
+
+from flask_neontology.views.validation import (
+    ResponseValidator,
+    skip_response_validation,
+)
+
+
+class Item(BaseModel):
+    name: str
+
+
+def make_app(validator: ResponseValidator) -> Flask:
+    app = Flask("test_validation")
+
+    api = SpecTree("flask", mode="strict")
+
+    @app.route("/items/")
+    @api.validate(
+        resp=validator.response(HTTP_200=List[Item]),
+        after=validator.after,
+    )
+    def items():
+        if request.args.get("skip") or request.args.get("stream"):
+            skip_response_validation()
+
+        if request.args.get("stream"):
+            body = stream_with_context(iter([b'[{"title": "foo"}]']))
+
+            return body, 200, {"Content-Type": "application/json"}
+
+        return jsonify([{"name": "foo"}, {request.args.get("key", "name"): "bar"}])
+
+    api.register(app)
+
+    return app
+
+
+def test_validate_full():
+    validator = ResponseValidator()
+    client = make_app(validator).test_client()
+
+    response = client.get("/items/")
+    invalid = client.get("/items/?key=title")
+
+    assert response.status_code == 200
+    assert response.headers["Server-Timing"].startswith("validate;dur=")
+    assert invalid.status_code == 500
+    assert validator.stats()["validated"] == 2
+    assert validator.stats()["failures"] == 1
+
+
+def test_validate_sampled():
+    validator = ResponseValidator("sampled", sample_rate=3)
+    client = make_app(validator).test_client()
+
+    for _ in range(6):
+        client.get("/items/")
+
+    assert validator.stats()["responses"] == 6
+    assert validator.stats()["validated"] == 2
+
+
+def test_validate_sample_items():
+    validator = ResponseValidator(sample_items=1)
+    client = make_app(validator).test_client()
+
+    response = client.get("/items/?key=title")
+
+    # only the first item is checked, and the response is sent as it was
+    assert response.status_code == 200
+    assert response.json == [{"name": "foo"}, {"title": "bar"}]
+
+
+def test_validate_docs():
+    validator = ResponseValidator("docs")
+    client = make_app(validator).test_client()
+
+    response = client.get("/items/?key=title")
+
+    assert response.status_code == 200
+    assert validator.stats()["validated"] == 0
+
+
+def test_skip_response_validation():
+    validator = ResponseValidator()
+    client = make_app(validator).test_client()
+
+    skipped = client.get("/items/?key=title&skip=1")
+    streamed = client.get("/items/?stream=1")
+
+    assert skipped.status_code == 200
+    assert streamed.status_code == 200
+    assert streamed.is_streamed
+    assert validator.stats()["validated"] == 0
+
+
+def test_response_models_documented():
+    validator = ResponseValidator("docs")
+    app = make_app(validator)
+
+    spec = app.test_client().get("/apidoc/openapi.json").json
+
+    assert "200" in spec["paths"]["/items/"]["get"]["responses"]
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError):
+        ResponseValidator("sometimes")
@@ -1,3 +1,9 @@
+import html
+import re
+
+import pytest
+
+
 def test_list(mini_client):
     response = mini_client.get("/dummies/")
 
@@ -6,9 +12,337 @@ def test_list(mini_client):
     assert b"bar" in response.data
 
 
+def test_list_paged(mini_client, monkeypatch):
+    from .conftest import DummyViewset
+
+    monkeypatch.setattr(DummyViewset, "page_size", 1)
+
+    # ordered by the primary property
+    response = mini_client.get("/dummies/")
+
+    assert b"/dummies/bar/" in response.data
+    assert b"/dummies/foo/" not in response.data
+    assert b'rel="prev"' not in response.data
+
+    next_url = re.search(rb'href="([^"]+)" rel="next"', response.data).group(1)
+
+    response = mini_client.get(html.unescape(next_url.decode()))
+
+    assert b"/dummies/foo/" in response.data
+    assert b"/dummies/bar/" not in response.data
+    assert b'rel="next"' not in response.data
+
+    prev_url = re.search(rb'href="([^"]+)" rel="prev"', response.data).group(1)
+
+    response = mini_client.get(html.unescape(prev_url.decode()))
+
+    assert b"/dummies/bar/" in response.data
+    assert b'rel="next"' in response.data
+
+
+def test_list_ordered(mini_client, monkeypatch):
+    from .conftest import DummyViewset
+
+    monkeypatch.setattr(DummyViewset, "order_by", "-name")
+
+    response = mini_client.get("/dummies/")
+
+    assert response.data.index(b"/dummies/foo/") < response.data.index(b"/dummies/bar/")
+
+    nodes = DummyViewset(DummyViewset.model).match_nodes(limit=1, skip=1)
+
+    assert [node.name for node in nodes] == ["bar"]
+
+
+def test_viewset_ordering(monkeypatch):
+    from .conftest import DummyNode, DummyViewset
+
+    monkeypatch.setattr(DummyViewset, "order_by", ("-description", "name"))
+
+    viewset = DummyViewset(DummyNode)
+
+    assert viewset.ordering() == [("description", "desc"), ("name", "asc")]
+    assert viewset.order_keys() == [("description", "desc"), ("name", "asc")]
+
+    monkeypatch.setattr(DummyViewset, "order_by", "-missing")
+
+    with pytest.raises(ValueError):
+        viewset.ordering()
+
+
+def test_list_invalid_cursor(mini_client):
+    response = mini_client.get("/dummies/?cursor=not-a-cursor")
+
+    assert response.status_code == 400
+
+
+def test_list_paged_by_optional_property(mini_client, monkeypatch):
+    from .conftest import DummyNode, DummyViewset
+
+    monkeypatch.setattr(DummyViewset, "page_size", 1)
+    monkeypatch.setattr(DummyViewset, "order_by", "-description")
+
+    DummyNode(name="baz", description="example").merge()
+
+    names = []
+    url = "/dummies/"
+
+    while url:
+        response = mini_client.get(url)
+
+        names += [
+            name
+            for name in ("bar", "baz", "foo")
+            if f"/dummies/{name}/".encode() in response.data
+        ]
+
+        next_link = re.search(rb'href="([^"]+)" rel="next"', response.data)
+        url = html.unescape(next_link.group(1).decode()) if next_link else None
+
+    # nodes without a description come first, and none are dropped
+    assert names == ["bar", "foo", "baz"]
+
+
+def _page_through(order, limit=2):
+    from flask_neontology.views.pagination import match_node_page
+
+    from .conftest import DummyNode
+
+    pages = []
+    page = match_node_page(DummyNode, order, None, limit)
+    pages.append([node.name for node in page.nodes])
+
+    while page.next_cursor:
+        page = match_node_page(DummyNode, order, page.next_cursor, limit)
+        pages.append([node.name for node in page.nodes])
+
+    # and back again
+    back = []
+
+    while page.prev_cursor:
+        page = match_node_page(DummyNode, order, page.prev_cursor, limit)
+        back.insert(0, [node.name for node in page.nodes])
+
+    return pages, back
+
+
+@pytest.mark.parametrize(
+    "direction,expected",
+    [
+        # nulls sort last ascending, first descending
+        ("asc", [["a", "c"], ["e", "b"], ["d"]]),
+        ("desc", [["b", "d"], ["e", "c"], ["a"]]),
+    ],
+)
+def test_paging_null_order_values(use_graph, direction, expected):
+    from .conftest import DummyNode
+
+    for name, description in [("a", "x"), ("b", None), ("c", "y"), ("d", None)]:
+        DummyNode(name=name, description=description).merge()
+
+    DummyNode(name="e", description="z").merge()
+
+    pages, back = _page_through([("description", direction), ("name", "asc")])
+
+    assert pages == expected
+    assert back == expected[:-1]
+
+
+def test_cursor_round_trip():
+    from flask_neontology.views.pagination import decode_cursor, encode_cursor
+
+    cursor = encode_cursor(["foo", 1], backward=True)
+
+    assert decode_cursor(cursor) == (["foo", 1], True)
+
+    with pytest.raises(ValueError):
+        decode_cursor(cursor[:-2])
+
+
 def test_item(mini_client):
     response = mini_client.get("/dummies/foo", follow_redirects=True)
 
     assert b"foo CONTENT" in response.data
 
     assert b"foo TITLE" in response.data
+
+
+def test_item_streamed(mini_client, monkeypatch):
+    from .conftest import DummyNodeView
+
+    monkeypatch.setattr(DummyNodeView, "stream", True)
+
+    response = mini_client.get("/dummies/foo/")
+
+    assert response.status_code == 200
+    assert response.is_streamed
+
+    assert b"foo CONTENT" in response.data
+    assert b"foo TITLE" in response.data
+    assert response.data.index(b"</head>") < response.data.index(b"foo CONTENT")
+
+
+def test_item_concurrent_sections(mini_client, monkeypatch):
+    from .conftest import DummyNode, DummyNodeView
+
+    monkeypatch.setattr(DummyNodeView, "max_section_workers", 2)
+
+    DummyNode(name="foo", description="foo DESCRIPTION").merge()
+
+    response = mini_client.get("/dummies/foo/")
+
+    assert response.status_code == 200
+
+    # sections are rendered in the order they are defined
+    assert response.data.index(b"foo CONTENT") < response.data.index(b"foo DESCRIPTION")
+
+
+def test_parallel_sections_share_request_context():
+    from flask import Flask, g, request
+
+    from flask_neontology.views.baseview import (
+        get_section_executor,
+        with_current_context,
+    )
+
+    app = Flask("TestAPP")
+    teardowns = []
+
+    @app.before_request
+    def set_user():
+        g.user = "alice"
+
+    @app.teardown_appcontext
+    def count_teardowns(exc):
+        teardowns.append(exc)
+
+    def section():
+        return f"{g.user} {request.path}"
+
+    @app.route("/page")
+    def page():
+        executor = get_section_executor(2)
+
+        futures = [executor.submit(with_current_context(section)) for _ in range(4)]
+
+        return ",".join(future.result() for future in futures)
+
+    response = app.test_client().get("/page")
+
+    assert response.data.decode() == ",".join(["alice /page"] * 4)
+    assert len(teardowns) == 1
+
+
+def test_fragment_cache_key_depends_on():
+    from types import SimpleNamespace
+
+    from flask import Flask
+
+    from flask_neontology.changes import ChangeTracker
+    from flask_neontology.views.decorators import fragment_cache_key
+
+    from .conftest import DummyNode, DummyNodeView
+
+    app = Flask("TestAPP")
+    app.neontology_manager = SimpleNamespace(changes=ChangeTracker())
+
+    view = DummyNodeView.__new__(DummyNodeView)
+    view.model = DummyNode
+    view.node = DummyNode(name="foo")
+
+    def depends_on(view):
+        return ["OtherNode"], ["DUMMY_RELATIONSHIP"]
+
+    with app.app_context():
+        key = fragment_cache_key(view, "graph", depends_on)
+
+        app.neontology_manager.changes.changed(["OtherNode"])
+
+        assert fragment_cache_key(view, "graph", depends_on) != key
+        assert fragment_cache_key(view, "graph") == fragment_cache_key(view, "graph")
+
+
+def test_item_not_modified(mini_client, monkeypatch):
+    from .conftest import DummyNode, DummyNodeView
+
+    monkeypatch.setattr(DummyNodeView, "conditional_get", True)
+
+    response = mini_client.get("/dummies/foo/")
+
+    etag = response.headers["ETag"]
+
+    cached_response = mini_client.get("/dummies/foo/", headers={"If-None-Match": etag})
+
+    assert cached_response.status_code == 304
+
+    # changing the node changes the ETag
+    DummyNode(name="foo", description="changed").merge()
+
+    updated_response = mini_client.get("/dummies/foo/", headers={"If-None-Match": etag})
+
+    assert updated_response.status_code == 200
+    assert b"changed" in updated_response.data
+
+
+def test_item_not_modified_neighbours(mini_app, mini_client, monkeypatch):
+    from .conftest import DummyNodeView
+
+    monkeypatch.setattr(DummyNodeView, "conditional_get", True)
+
+    etag = mini_client.get("/dummies/foo/").headers["ETag"]
+
+    # a relationship written elsewhere in the graph may be shown on the page
+    mini_app.neontology_manager.changes.changed([], ["DUMMY_RELATIONSHIP"])
+
+    response = mini_client.get("/dummies/foo/", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+
+
+def test_node_etag_depends_on():
+    from .conftest import DummyNodeView
+
+    labels, relationship_types = DummyNodeView().etag_depends_on()
+
+    assert labels == {"DummyNode"}
+    assert "DUMMY_RELATIONSHIP" in relationship_types
+
+
+def test_use_server_side_table_cached(monkeypatch):
+    from flask import Flask
+
+    from flask_neontology.cache import LRUCache
+    from flask_neontology.changes import ChangeTracker
+    from flask_neontology.views import NeontologyViewset
+
+    from .conftest import DummyNode
+
+    counts = []
+
+    def get_count():
+        counts.append(1)
+        return 2
+
+    monkeypatch.setattr(DummyNode, "get_count", get_count)
+
+    class Viewset(NeontologyViewset):
+        server_side_table_threshold = 1
+
+    app = Flask("TestAPP")
+
+    class Manager:
+        changes = ChangeTracker()
+        fragment_cache = LRUCache()
+
+    app.neontology_manager = Manager()
+
+    with app.app_context():
+        assert Viewset(DummyNode).use_server_side_table() is True
+        assert Viewset(DummyNode).use_server_side_table() is True
+        assert len(counts) == 1
+
+        # counted again once the label is written to
+        Manager.changes.changed(["DummyNode"])
+
+        assert Viewset(DummyNode).use_server_side_table() is True
+        assert len(counts) == 2